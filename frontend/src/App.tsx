@@ -50,6 +50,8 @@ type Page = 'live' | 'replay' | 'backtest' | 'championship';
 // Helpers
 // =============================================================================
 
+const wsTextDecoder = new TextDecoder();
+
 function getFlagClass(flags: string[], safetycar: boolean, redFlag: boolean, vsc: boolean): string {
     if (redFlag) return 'red';
     if (safetycar) return 'sc';
@@ -127,6 +129,8 @@ const App: FC = () => {
         const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
         const wsUrl = `${protocol}//${window.location.host}${WS_PATH}`;
         const ws = new WebSocket(wsUrl);
+        // Broadcasts arrive as binary UTF-8 JSON frames
+        ws.binaryType = 'arraybuffer';
         wsRef.current = ws;
 
         ws.onopen = () => {
@@ -136,7 +140,10 @@ const App: FC = () => {
 
         ws.onmessage = (event) => {
             try {
-                const message: WebSocketMessage<RaceState> = JSON.parse(event.data);
+                const raw = typeof event.data === 'string'
+                    ? event.data
+                    : wsTextDecoder.decode(event.data as ArrayBuffer);
+                const message: WebSocketMessage<RaceState> = JSON.parse(raw);
                 if (message.type === 'state_update' && message.data) {
                     updateState(message.data);
                 } else if (message.type === 'session_started') {
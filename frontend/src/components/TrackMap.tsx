@@ -14,7 +14,7 @@
  */
 
 import { useRef, useEffect, useMemo, useCallback, useState, type FC, type CSSProperties } from 'react';
-import type { DriverState, TrackConfig, TrackBounds, DRSZone, TrackPoint, TrackStatus } from '../types';
+import type { DriverState, TrackConfig, TrackBounds, DRSZone, TrackLine, TrackPoint, TrackStatus } from '../types';
 import DRSZoneOverlay from './DRSZoneOverlay';
 import styles from './TrackMap.module.css';
 import { TRACK_MAP_PADDING, TRACK_MAP_MIN_WIDTH, TRACK_MAP_MIN_HEIGHT } from '../config/constants';
@@ -89,22 +89,20 @@ function transformCoords(
  * Create SVG path from track points.
  */
 function createTrackPathFromPoints(
-    points: TrackPoint[] | undefined,
+    line: TrackLine | undefined,
     bounds: TrackBounds,
     width: number,
     height: number
 ): string {
-    if (!points || points.length < 2) return '';
+    if (!line || line.x.length < 2) return '';
 
-    const transformed = points.map((p) => transformCoords(p, bounds, width, height));
-
-    let path = `M ${transformed[0].x} ${transformed[0].y}`;
-    for (let i = 1; i < transformed.length; i++) {
-        path += ` L ${transformed[i].x} ${transformed[i].y}`;
+    const segments: string[] = new Array(line.x.length);
+    for (let i = 0; i < line.x.length; i++) {
+        const p = transformCoords({ x: line.x[i], y: line.y[i] }, bounds, width, height);
+        segments[i] = `${i === 0 ? 'M' : 'L'} ${p.x} ${p.y}`;
     }
-    path += ' Z';
 
-    return path;
+    return `${segments.join(' ')} Z`;
 }
 
 // =============================================================================
@@ -260,12 +258,12 @@ const TrackMap: FC<TrackMapProps> = ({
                 }
 
                 // Fallback: interpolate along center line
-                if (geometry?.center_line && driver.rel_dist !== undefined) {
+                if (geometry?.center_line?.x.length && driver.rel_dist !== undefined) {
                     const relDist = driver.rel_dist || 0;
-                    const points = geometry.center_line;
-                    const idx = Math.floor(relDist * (points.length - 1));
-                    const point = points[Math.min(idx, points.length - 1)];
-                    const pos = transformCoords(point, bounds, width, height);
+                    const line = geometry.center_line;
+                    const last = line.x.length - 1;
+                    const idx = Math.min(Math.floor(relDist * last), last);
+                    const pos = transformCoords({ x: line.x[idx], y: line.y[idx] }, bounds, width, height);
                     return { driver, x: pos.x, y: pos.y };
                 }
 
@@ -448,4 +446,4 @@ const TrackMap: FC<TrackMapProps> = ({
 
 export default TrackMap;
 export { CarMarker, DRSZoneHighlight, transformCoords, createTrackPathFromPoints };
-export type { TrackPoint, TrackBounds, DRSZone };
+export type { TrackLine, TrackPoint, TrackBounds, DRSZone };
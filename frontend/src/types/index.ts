@@ -105,6 +105,13 @@ export interface TrackPoint {
     y: number;
 }
 
+/** A polyline as parallel coordinate arrays (x[i], y[i] is point i). */
+export interface TrackLine {
+    x: number[];
+    y: number[];
+    rel_dist?: number[];
+}
+
 export interface TrackBounds {
     x_min: number;
     x_max: number;
@@ -120,9 +127,9 @@ export interface DRSZone {
 }
 
 export interface TrackConfig {
-    center_line: TrackPoint[];
-    inner_edge: TrackPoint[];
-    outer_edge: TrackPoint[];
+    center_line: TrackLine;
+    inner_edge: TrackLine;
+    outer_edge: TrackLine;
     bounds: TrackBounds;
     drs_zones?: DRSZone[];
     // Legacy support if needed, or remove:
@@ -13,6 +13,8 @@ Usage:
 """
 
 import argparse
+import asyncio
+import contextlib
 import os
 import subprocess
 import sys
@@ -27,25 +29,26 @@ os.environ["PYTHONPATH"] = str(SRC_DIR)
 
 
 def run_backend(dev_mode: bool = False, port: int = 8000) -> None:
-    """Start the backend server."""
+    """Start the backend server in-process."""
+    import uvicorn
+
     print("🏎️  Starting F1 Race Strategy Workbench...")
     
-    cmd = [
-        sys.executable, "-m", "uvicorn",
-        "rsw.main:app",
-        "--host", "0.0.0.0",
-        "--port", str(port),
-    ]
-    
     if dev_mode:
-        cmd.append("--reload")
         print("   Running in development mode with auto-reload")
     
     print(f"   Backend: http://localhost:{port}")
     print(f"   API Docs: http://localhost:{port}/docs")
     print("\n   Press Ctrl+C to stop\n")
     
-    subprocess.run(cmd, cwd=ROOT_DIR)
+    uvicorn.run(
+        "rsw.main:app",
+        host="0.0.0.0",
+        port=port,
+        reload=dev_mode,
+        reload_dirs=[str(SRC_DIR)] if dev_mode else None,
+        app_dir=str(SRC_DIR),
+    )
 
 
 def run_frontend() -> None:
@@ -119,29 +122,69 @@ def download_session(year: int, round_num: int, session_type: str = "Race") -> N
     subprocess.run(cmd, cwd=ROOT_DIR)
 
 
-def run_full_app() -> None:
+async def _wait_for_http(url: str, timeout: float = 10.0) -> bool:
+    """Poll a URL until it answers 200 or the timeout elapses."""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    async with httpx.AsyncClient(timeout=1.0) as client:
+        while loop.time() < deadline:
+            try:
+                response = await client.get(url)
+                if response.status_code == 200:
+                    return True
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.1)
+    return False
+
+
+async def _run_full_app(port: int) -> None:
+    """Serve the backend on this event loop and run the frontend as a child process."""
+    import uvicorn
+
+    frontend_dir = ROOT_DIR / "frontend"
+    config = uvicorn.Config("rsw.main:app", host="0.0.0.0", port=port)
+    server = uvicorn.Server(config)
+    backend_task = asyncio.create_task(server.serve())
+    
+    try:
+        # Wait until the backend actually answers instead of guessing with a sleep
+        if not await _wait_for_http(f"http://localhost:{port}/health/live"):
+            print("⚠️  Backend did not report ready within 10s, continuing anyway")
+        
+        if not (frontend_dir / "node_modules").exists():
+            print("📦 Installing frontend dependencies...")
+            install = await asyncio.create_subprocess_exec("npm", "install", cwd=frontend_dir)
+            if await install.wait() != 0:
+                raise RuntimeError("npm install failed")
+        
+        print("🖥️  Starting frontend...")
+        frontend = await asyncio.create_subprocess_exec("npm", "run", "dev", cwd=frontend_dir)
+        webbrowser.open("http://localhost:5173")
+        
+        try:
+            await frontend.wait()
+        finally:
+            if frontend.returncode is None:
+                frontend.terminate()
+                await frontend.wait()
+    finally:
+        server.should_exit = True
+        await backend_task
+
+
+def run_full_app(port: int = 8000) -> None:
     """Run both backend and frontend."""
-    import threading
-    import time
-    
     print("🏁 Starting F1 Race Strategy Workbench (Full Stack)")
     print("=" * 50)
+    print(f"   Backend: http://localhost:{port}")
+    print("   Frontend: http://localhost:5173")
+    print("\n   Press Ctrl+C to stop\n")
     
-    # Start backend in background
-    def start_backend():
-        run_backend(dev_mode=True)
-    
-    backend_thread = threading.Thread(target=start_backend, daemon=True)
-    backend_thread.start()
-    
-    # Wait for backend to start
-    time.sleep(2)
-    
-    # Open browser
-    webbrowser.open("http://localhost:5173")
-    
-    # Start frontend (blocking)
-    run_frontend()
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_run_full_app(port))
 
 
 def type_check() -> int:
@@ -238,7 +281,7 @@ Examples:
         return
     
     # Default: run full app
-    run_full_app()
+    run_full_app(port=args.port)
 
 
 if __name__ == "__main__":
@@ -14,14 +14,70 @@ import argparse
 import asyncio
 import json
 import sys
+import time
+from collections.abc import Awaitable
 from pathlib import Path
-from datetime import datetime
+from datetime import UTC, datetime
+from typing import TypeVar
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from rsw.backtest.replay import meta_path, session_meta, write_atomic
 from rsw.ingest import OpenF1Client
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+T = TypeVar("T")
+
+# Fields persisted per record type in the cached session file
+_DRIVER_FIELDS = frozenset(
+    {"driver_number", "name_acronym", "full_name", "team_name", "team_colour"}
+)
+_LAP_FIELDS = frozenset(
+    {
+        "driver_number",
+        "lap_number",
+        "lap_duration",
+        "sector_1",
+        "sector_2",
+        "sector_3",
+        "is_pit_out_lap",
+    }
+)
+_STINT_FIELDS = frozenset(
+    {"driver_number", "stint_number", "compound", "lap_start", "lap_end", "tyre_age_at_start"}
+)
+_PIT_FIELDS = frozenset({"driver_number", "lap_number", "pit_duration"})
+_RACE_CONTROL_FIELDS = frozenset({"lap_number", "category", "flag", "message"})
+
+
+async def _timed(name: str, coro: Awaitable[T]) -> T:
+    """Await a fetch and print a progress line once it completes."""
+    start = time.perf_counter()
+    result = await coro
+    elapsed = time.perf_counter() - start
+    count = f"{len(result)} items" if isinstance(result, list) else "done"
+    print(f"  Fetched {name} ✓ ({count}, {elapsed:.2f}s)")
+    return result
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize session data to indented JSON, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC)
+    return json.dumps(data, indent=2, default=_json_default).encode()
+
+
+def _json_default(value: object) -> str:
+    """Fallback encoder for values the stdlib json module cannot handle."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 async def download_session(
     client: OpenF1Client,
@@ -35,101 +91,44 @@ async def download_session(
     """
     print(f"\n📥 Downloading session {session_key}...")
     
-    # Fetch all data
-    print("  Fetching drivers...", end="", flush=True)
-    drivers = await client.get_drivers(session_key)
-    print(f" ✓ ({len(drivers)} drivers)")
-    
-    print("  Fetching laps...", end="", flush=True)
-    laps = await client.get_laps(session_key)
-    print(f" ✓ ({len(laps)} laps)")
-    
-    print("  Fetching stints...", end="", flush=True)
-    stints = await client.get_stints(session_key)
-    print(f" ✓ ({len(stints)} stints)")
-    
-    print("  Fetching pit stops...", end="", flush=True)
-    pits = await client.get_pits(session_key)
-    print(f" ✓ ({len(pits)} pits)")
-    
-    print("  Fetching race control...", end="", flush=True)
-    race_control = await client.get_race_control(session_key)
-    print(f" ✓ ({len(race_control)} messages)")
-    
-    # Get session info
-    print("  Fetching session info...", end="", flush=True)
-    sessions = await client.get_sessions(year=datetime.now().year)
+    # Fetch all data concurrently; progress is reported as each call completes
+    drivers, laps, stints, pits, race_control, sessions = await asyncio.gather(
+        _timed("drivers", client.get_drivers(session_key)),
+        _timed("laps", client.get_laps(session_key)),
+        _timed("stints", client.get_stints(session_key)),
+        _timed("pit stops", client.get_pits(session_key)),
+        _timed("race control messages", client.get_race_control(session_key)),
+        _timed("sessions", client.get_sessions(year=datetime.now().year)),
+    )
     session_info = next((s for s in sessions if s.session_key == session_key), None)
-    print(" ✓")
     
     # Build data structure
     data = {
         "session_key": session_key,
-        "downloaded_at": datetime.utcnow().isoformat(),
+        "downloaded_at": datetime.now(UTC),
         "session_info": {
             "session_name": session_info.session_name if session_info else "Unknown",
             "country_name": session_info.country_name if session_info else "Unknown",
             "circuit_short_name": session_info.circuit_short_name if session_info else "Unknown",
-            "date_start": session_info.date_start.isoformat() if session_info else None,
+            "date_start": session_info.date_start if session_info else None,
         } if session_info else None,
-        "drivers": [
-            {
-                "driver_number": d.driver_number,
-                "name_acronym": d.name_acronym,
-                "full_name": d.full_name,
-                "team_name": d.team_name,
-                "team_colour": d.team_colour,
-            }
-            for d in drivers
-        ],
-        "laps": [
-            {
-                "driver_number": l.driver_number,
-                "lap_number": l.lap_number,
-                "lap_duration": l.lap_duration,
-                "sector_1_time": l.sector_1_time,
-                "sector_2_time": l.sector_2_time,
-                "sector_3_time": l.sector_3_time,
-                "is_pit_out_lap": l.is_pit_out_lap,
-            }
-            for l in laps
-        ],
-        "stints": [
-            {
-                "driver_number": s.driver_number,
-                "stint_number": s.stint_number,
-                "compound": s.compound,
-                "lap_start": s.lap_start,
-                "lap_end": s.lap_end,
-                "tyre_age_at_start": s.tyre_age_at_start,
-            }
-            for s in stints
-        ],
-        "pits": [
-            {
-                "driver_number": p.driver_number,
-                "lap_number": p.lap_number,
-                "pit_duration": p.pit_duration,
-            }
-            for p in pits
-        ],
-        "race_control": [
-            {
-                "lap_number": r.lap_number,
-                "category": r.category,
-                "flag": r.flag,
-                "message": r.message,
-            }
-            for r in race_control
-        ],
+        "drivers": [d.model_dump(include=_DRIVER_FIELDS) for d in drivers],
+        "laps": [lap.model_dump(include=_LAP_FIELDS) for lap in laps],
+        "stints": [s.model_dump(include=_STINT_FIELDS) for s in stints],
+        "pits": [p.model_dump(include=_PIT_FIELDS) for p in pits],
+        "race_control": [r.model_dump(include=_RACE_CONTROL_FIELDS) for r in race_control],
     }
     
     # Save to file
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / f"{session_key}.json"
     
-    with open(output_file, "w") as f:
-        json.dump(data, f, indent=2)
+    # Write to a temp file and rename so an interrupted download never
+    # leaves a truncated cache file behind
+    write_atomic(output_file, _dumps(data))
+    
+    # Listing metadata sidecar, so the session picker never parses the full file
+    write_atomic(meta_path(output_file), _dumps(session_meta(data)))
     
     file_size = output_file.stat().st_size / 1024
     print(f"\n✅ Saved to {output_file} ({file_size:.1f} KB)")
@@ -4,18 +4,51 @@ Health check endpoints.
 Provides liveness and readiness probes for container orchestration.
 """
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
 
+import httpx
 from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
 from rsw.logging_config import get_logger
 from rsw.runtime_config import get_config
 
+try:
+    import orjson  # noqa: F401  (required by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as HealthResponse
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from fastapi.responses import JSONResponse as HealthResponse  # type: ignore[assignment]
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # pragma: no cover - Redis is optional
+    redis = None  # type: ignore[assignment]
+
+try:
+    from sqlalchemy import text
+
+    from rsw.db import get_engine
+except ImportError:  # pragma: no cover - database extras not installed
+    get_engine = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 router = APIRouter(tags=["Health"])
 
+# Dependency probes are reused for this long to absorb bursty orchestrator polling
+HEALTH_CACHE_TTL_SECONDS = 2.0
+
+# Shared probe clients, created lazily so keep-alive connections are reused
+_openf1_client: httpx.AsyncClient | None = None
+_redis_client: Any = None
+
+# A successful SELECT 1 is trusted for this long before the database is re-probed
+DB_PROBE_INTERVAL_SECONDS = 5.0
+_last_db_ok: tuple[float, "ComponentHealth"] | None = None
+
 
 class HealthStatus(BaseModel):
     """Health check response model."""
@@ -37,25 +70,30 @@ class ComponentHealth(BaseModel):
 
 async def check_database() -> ComponentHealth:
     """Check database connectivity."""
-    import time
+    global _last_db_ok
+
+    if _last_db_ok is not None and time.monotonic() - _last_db_ok[0] < DB_PROBE_INTERVAL_SECONDS:
+        return _last_db_ok[1]
 
     try:
-        from rsw.db import get_engine
+        if get_engine is None:
+            raise RuntimeError("Database support is not installed")
 
-        start = time.time()
+        start = time.perf_counter()
         engine = await get_engine()
 
-        from sqlalchemy import text
-
         async with engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
-        latency = (time.time() - start) * 1000
+        latency = (time.perf_counter() - start) * 1000
 
-        return ComponentHealth(
+        health = ComponentHealth(
             status="healthy",
             latency_ms=round(latency, 2),
         )
+        _last_db_ok = (time.monotonic(), health)
+        return health
     except Exception as e:
+        _last_db_ok = None
         logger.error("database_health_check_failed", error=str(e))
         return ComponentHealth(
             status="unhealthy",
@@ -63,19 +101,48 @@ async def check_database() -> ComponentHealth:
         )
 
 
-async def check_redis() -> ComponentHealth:
-    """Check Redis connectivity."""
-    import time
+def _get_openf1_client() -> httpx.AsyncClient:
+    """Get or create the pooled HTTP client used to probe OpenF1."""
+    global _openf1_client
+    if _openf1_client is None or _openf1_client.is_closed:
+        config = get_config()
+        _openf1_client = httpx.AsyncClient(
+            base_url=config.api.openf1_base_url,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+    return _openf1_client
 
-    try:
-        import redis.asyncio as redis
 
+def _get_redis_client() -> Any:
+    """Get or create the shared Redis client used for health probes."""
+    global _redis_client
+    if _redis_client is None:
+        if redis is None:
+            raise RuntimeError("redis package is not installed")
         config = get_config()
-        start = time.time()
-        client = redis.from_url(config.database.redis_url)
+        _redis_client = redis.from_url(config.database.redis_url)
+    return _redis_client
+
+
+async def close_health_clients() -> None:
+    """Close the shared probe clients. Called on application shutdown."""
+    global _openf1_client, _redis_client
+    if _openf1_client is not None:
+        await _openf1_client.aclose()
+        _openf1_client = None
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+async def check_redis() -> ComponentHealth:
+    """Check Redis connectivity."""
+    try:
+        client = _get_redis_client()
+        start = time.perf_counter()
         await client.ping()
-        await client.close()
-        latency = (time.time() - start) * 1000
+        latency = (time.perf_counter() - start) * 1000
 
         return ComponentHealth(
             status="healthy",
@@ -91,19 +158,14 @@ async def check_redis() -> ComponentHealth:
 
 async def check_openf1() -> ComponentHealth:
     """Check OpenF1 API connectivity."""
-    import time
-
-    import httpx
-
     try:
-        config = get_config()
+        client = _get_openf1_client()
 
-        start = time.time()
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{config.api.openf1_base_url}/sessions?limit=1")
-            response.raise_for_status()
+        start = time.perf_counter()
+        response = await client.get("/sessions", params={"limit": 1})
+        response.raise_for_status()
 
-        latency = (time.time() - start) * 1000
+        latency = (time.perf_counter() - start) * 1000
 
         return ComponentHealth(
             status="healthy",
@@ -116,18 +178,88 @@ async def check_openf1() -> ComponentHealth:
         )
 
 
-@router.get("/health", response_model=HealthStatus)
-async def health_check() -> HealthStatus:
+class _HealthCache:
+    """
+    Short-lived cache for dependency probe results.
+
+    Concurrent callers for the same key share a single in-flight probe, so
+    aggressive polling collapses to at most one real check per TTL window.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[ComponentHealth, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _lookup(self, key: str) -> ComponentHealth | None:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    async def get(
+        self,
+        key: str,
+        ttl: float,
+        check: Callable[[], Awaitable[ComponentHealth]],
+    ) -> ComponentHealth:
+        """Return the cached result for key, running check if it has expired."""
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached
+
+            result = await check()
+            self._entries[key] = (result, time.monotonic() + ttl)
+            return result
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
+_health_cache = _HealthCache()
+
+
+async def _cached(
+    key: str,
+    check: Callable[[], Awaitable[ComponentHealth]],
+    ttl: float = HEALTH_CACHE_TTL_SECONDS,
+) -> ComponentHealth:
+    """Run a health check through the shared TTL cache."""
+    return await _health_cache.get(key, ttl, check)
+
+
+def _as_component_health(result: ComponentHealth | BaseException) -> ComponentHealth:
+    """Coerce an exception raised by a health check into an unhealthy result."""
+    if isinstance(result, BaseException):
+        return ComponentHealth(status="unhealthy", message=str(result))
+    return result
+
+
+@router.get("/health", responses={200: {"model": HealthStatus}})
+async def health_check() -> Response:
     """
     Comprehensive health check endpoint.
 
-    Checks all dependencies and returns overall status.
+    Checks all dependencies and returns overall status. The payload is
+    built directly and returned without re-validating it as a HealthStatus.
     """
     config = get_config()
-    # Run all health checks
-    db_health = await check_database()
-    redis_health = await check_redis()
-    openf1_health = await check_openf1()
+    # Run all health checks concurrently
+    results = await asyncio.gather(
+        _cached("database", check_database),
+        _cached("redis", check_redis),
+        _cached("openf1", check_openf1),
+        return_exceptions=True,
+    )
+    db_health, redis_health, openf1_health = (
+        _as_component_health(result) for result in results
+    )
 
     checks = {
         "database": db_health.model_dump(),
@@ -145,12 +277,14 @@ async def health_check() -> HealthStatus:
     else:
         overall_status = "healthy"
 
-    return HealthStatus(
-        status=overall_status,
-        version="1.0.0",
-        environment=config.environment,
-        timestamp=datetime.now(UTC).isoformat(),
-        checks=checks,
+    return HealthResponse(
+        {
+            "status": overall_status,
+            "version": "1.0.0",
+            "environment": config.environment,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "checks": checks,
+        }
     )
 
 
@@ -173,7 +307,7 @@ async def readiness_probe(response: Response) -> dict:
     Returns 503 if not ready.
     """
     # Check critical dependencies
-    db_health = await check_database()
+    db_health = await _cached("database", check_database)
 
     if db_health.status == "unhealthy":
         response.status_code = 503
@@ -10,9 +10,12 @@ Endpoints:
 
 from __future__ import annotations
 
+import time
+from collections import defaultdict
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from rsw.logging_config import get_logger
 
@@ -27,6 +30,29 @@ router = APIRouter(prefix="/sessions", tags=["sessions"])
 # Module-level reference to app state
 _app_state: Any = None
 
+# The season schedule rarely changes, so listings are cached in-process
+SESSIONS_CACHE_TTL_SECONDS = 3600
+SESSIONS_CACHE_MAX_ENTRIES = 32
+# Entries hold (expiry, sessions, round numbers by meeting_key)
+_sessions_cache: dict[
+    tuple[int | None, str | None], tuple[float, list[Any], dict[int, int]]
+] = {}
+
+# Cancelled meeting keys (e.g., Imola 2023 cancelled due to floods)
+_CANCELLED_MEETINGS: frozenset[int] = frozenset({1209})
+
+# Fields read from each session when building the listing response
+_SESSION_FIELDS = attrgetter(
+    "session_key",
+    "session_name",
+    "session_type",
+    "circuit_short_name",
+    "country_name",
+    "date_start",
+    "year",
+    "meeting_key",
+)
+
 
 def init_session_routes(app_state: Any) -> None:
     """
@@ -37,10 +63,38 @@ def init_session_routes(app_state: Any) -> None:
     """
     global _app_state
     _app_state = app_state
+    _sessions_cache.clear()
+
+
+async def _fetch_sessions_cached(
+    year: int | None, country: str | None
+) -> tuple[list[Any], dict[int, int]]:
+    """
+    Fetch sessions and their round numbers, reusing both for the cache TTL.
+
+    Round numbers are computed once per fetched listing, not per request.
+    """
+    key = (year, country)
+    now = time.monotonic()
+    entry = _sessions_cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1], entry[2]
+
+    sessions: list[Any] = await _app_state.client.get_sessions(year=year, country=country)
+    round_map = _calculate_round_numbers(sessions)
+
+    # Empty results usually mean the upstream API failed; don't pin them
+    if sessions:
+        if key not in _sessions_cache and len(_sessions_cache) >= SESSIONS_CACHE_MAX_ENTRIES:
+            _sessions_cache.pop(next(iter(_sessions_cache)))
+        _sessions_cache[key] = (now + SESSIONS_CACHE_TTL_SECONDS, sessions, round_map)
+
+    return sessions, round_map
 
 
 @router.get("")
 async def list_sessions(
+    response: Response,
     year: int | None = Query(None, ge=2018, le=2030, description="Filter by season year"),
     country: str | None = Query(None, description="Filter by country name"),
 ) -> list[dict[str, Any]]:
@@ -57,23 +111,25 @@ async def list_sessions(
     if _app_state is None:
         return []
 
-    sessions = await _app_state.client.get_sessions(year=year, country=country)
-
-    # Calculate round numbers for championship events
-    round_map = _calculate_round_numbers(sessions)
+    sessions, round_map = await _fetch_sessions_cached(year, country)
+    # Like the in-process cache, never let clients pin an empty (failed) listing
+    if sessions:
+        response.headers["Cache-Control"] = f"public, max-age={SESSIONS_CACHE_TTL_SECONDS}"
 
     return [
         {
-            "session_key": s.session_key,
-            "session_name": s.session_name,
-            "session_type": s.session_type,
-            "circuit": s.circuit_short_name,
-            "country": s.country_name,
-            "date": s.date_start.isoformat(),
-            "year": s.year,
-            "round_number": round_map.get(s.meeting_key, 0),
+            "session_key": key,
+            "session_name": name,
+            "session_type": session_type,
+            "circuit": circuit,
+            "country": country_,
+            "date": date_start.isoformat(),
+            "year": year_,
+            "round_number": round_map.get(meeting, 0),
         }
-        for s in sessions
+        for key, name, session_type, circuit, country_, date_start, year_, meeting in map(
+            _SESSION_FIELDS, sessions
+        )
     ]
 
 
@@ -90,25 +146,31 @@ def _calculate_round_numbers(sessions: list[Any]) -> dict[int, int]:
         Dict mapping meeting_key to round_number
     """
     # Group by meeting
-    meetings: dict[int, list[Any]] = {}
+    meetings: defaultdict[int, list[Any]] = defaultdict(list)
     for s in sessions:
-        if s.meeting_key not in meetings:
-            meetings[s.meeting_key] = []
         meetings[s.meeting_key].append(s)
 
     # Identify valid race meetings
     race_meetings: list[tuple[int, Any]] = []
 
-    # Cancelled meeting keys (e.g., Imola 2023 cancelled due to floods)
-    CANCELLED_MEETINGS = {1209}
-
     for m_key, m_sessions in meetings.items():
-        has_race = any(s.session_type == "Race" or "Race" in s.session_name for s in m_sessions)
-        is_testing = any("Testing" in s.session_name for s in m_sessions)
-        is_cancelled = m_key in CANCELLED_MEETINGS
-
-        if has_race and not is_testing and not is_cancelled:
-            start_date = min(s.date_start for s in m_sessions)
+        if m_key in _CANCELLED_MEETINGS:
+            continue
+
+        # Single pass over the meeting's sessions
+        has_race = False
+        is_testing = False
+        start_date = None
+        for s in m_sessions:
+            if "Testing" in s.session_name:
+                is_testing = True
+                break
+            if not has_race and (s.session_type == "Race" or "Race" in s.session_name):
+                has_race = True
+            if start_date is None or s.date_start < start_date:
+                start_date = s.date_start
+
+        if has_race and not is_testing:
             race_meetings.append((m_key, start_date))
 
     # Sort by date and assign round numbers
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Path
 
 from rsw.logging_config import get_logger
 
@@ -44,34 +44,27 @@ def init_simulation_routes(app_state: Any) -> None:
 
 
 @router.post("/load/{year}/{round_num}")
-async def load_race(year: int, round_num: int) -> dict[str, Any]:
+async def load_race(
+    year: int = Path(..., ge=2018, le=2030, description="Season year"),
+    round_num: int = Path(..., ge=1, le=24, description="Championship round number"),
+) -> dict[str, Any]:
     """
     Load and start simulation for a race session.
 
     Args:
-        year: Season year (2018-2024)
+        year: Season year (2018-2030)
         round_num: Championship round number (1-24)
 
     Returns:
         Status message with session details
 
     Raises:
-        HTTPException: 400 if invalid parameters
+        HTTPException: 422 if invalid parameters
         HTTPException: 500 if simulation service unavailable
     """
     if _app_state is None or _app_state.simulation_service is None:
         raise HTTPException(status_code=500, detail="Simulation service not initialized")
 
-    if year < 2018 or year > 2030:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid year: {year}. Must be between 2018 and 2030"
-        )
-
-    if round_num < 1 or round_num > 24:
-        raise HTTPException(
-            status_code=400, detail=f"Invalid round: {round_num}. Must be between 1 and 24"
-        )
-
     logger.info("simulation_load_requested", year=year, round=round_num)
 
     await _app_state.simulation_service.start(year, round_num)
@@ -102,7 +95,9 @@ async def stop_simulation() -> dict[str, str]:
 
 
 @router.post("/speed/{speed}")
-async def set_speed(speed: float) -> dict[str, Any]:
+async def set_speed(
+    speed: float = Path(..., ge=0.1, le=100, description="Playback multiplier"),
+) -> dict[str, Any]:
     """
     Set simulation playback speed.
 
@@ -113,11 +108,8 @@ async def set_speed(speed: float) -> dict[str, Any]:
         Confirmation with new speed value
 
     Raises:
-        HTTPException: 400 if speed out of valid range
+        HTTPException: 422 if speed out of valid range
     """
-    if speed < 0.1 or speed > 100:
-        raise HTTPException(status_code=400, detail="Speed must be between 0.1 and 100")
-
     if _app_state is not None:
         _app_state.speed_multiplier = speed
 
@@ -6,6 +6,9 @@ Manages WebSocket connections for real-time state broadcasting to clients.
 Features:
     - Connection lifecycle management (accept, register, disconnect)
     - Broadcast messaging to all connected clients
+    - Per-client bounded send queues so slow clients never stall a broadcast
+    - Messages are UTF-8 JSON sent as binary frames (orjson when installed)
+    - Opt-in MessagePack frames via ``?format=msgpack`` (requires msgspec)
     - Automatic cleanup of disconnected clients
     - Thread-safe connection tracking
 
@@ -18,32 +21,70 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
 from fastapi import WebSocket
+from starlette.websockets import WebSocketState
 
 from rsw.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Per-client send timeout and outbound queue depth; a client that falls
+# further behind than the queue allows is disconnected
+SEND_TIMEOUT_SECONDS = 5.0
+CLIENT_QUEUE_SIZE = 64
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(message: Any) -> bytes:
+        """Serialize a message to UTF-8 JSON bytes."""
+        return orjson.dumps(message, default=str, option=_ORJSON_OPTIONS)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _dumps(message: Any) -> bytes:
+        """Serialize a message to UTF-8 JSON bytes."""
+        return json.dumps(message, default=str).encode()
+
+
+try:
+    import msgspec
+
+    _pack: Any = msgspec.msgpack.Encoder(enc_hook=str).encode
+except ImportError:  # pragma: no cover - msgspec is optional
+    _pack = None
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    """Encode a message as a JSON frame."""
+    return _dumps(message)
+
 
 class ConnectionManager:
     """
     WebSocket connection manager for real-time updates.
 
-    Manages active WebSocket connections with automatic cleanup
-    of disconnected clients during broadcast operations.
+    Each registered client gets a bounded outbound queue drained by its own
+    writer task, so broadcasting is a non-blocking enqueue per client.
+    Clients whose queue overflows or whose send fails are disconnected.
 
     Attributes:
-        active_connections: List of currently connected WebSockets
+        active_connections: Mapping of connected WebSockets to their send queues
     """
 
-    __slots__ = ("active_connections",)
+    __slots__ = ("active_connections", "_writers", "_msgpack_clients")
 
     def __init__(self) -> None:
-        """Initialize the connection manager with empty connection list."""
-        self.active_connections: list[WebSocket] = []
+        """Initialize the connection manager with no connections."""
+        self.active_connections: dict[WebSocket, asyncio.Queue[bytes]] = {}
+        self._writers: dict[WebSocket, asyncio.Task[None]] = {}
+        self._msgpack_clients: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket) -> None:
         """
@@ -52,22 +93,33 @@ class ConnectionManager:
         This only accepts the connection. Call register() after
         sending initial state to prevent race conditions.
 
+        Clients connecting with ``?format=msgpack`` receive MessagePack
+        frames from broadcast() and send_to() when msgspec is installed;
+        everyone else gets JSON.
+
         Args:
             websocket: WebSocket connection to accept
         """
         await websocket.accept()
+        if _pack is not None and websocket.query_params.get("format") == "msgpack":
+            self._msgpack_clients.add(websocket)
 
     def register(self, websocket: WebSocket) -> None:
         """
         Register a connected WebSocket for broadcasts.
 
         Should be called after initial state has been sent
-        to the client.
+        to the client. Must be called from a running event loop.
 
         Args:
             websocket: WebSocket to register for broadcasts
         """
-        self.active_connections.append(websocket)
+        if websocket in self.active_connections:
+            return
+
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
         logger.debug(
             "websocket_connected",
             total_connections=len(self.active_connections),
@@ -75,19 +127,25 @@ class ConnectionManager:
 
     def disconnect(self, websocket: WebSocket) -> None:
         """
-        Remove a WebSocket from the connection list.
+        Remove a WebSocket and stop its writer task.
 
-        Safe to call even if the WebSocket is not in the list.
+        Safe to call even if the WebSocket is not registered.
 
         Args:
             websocket: WebSocket to remove
         """
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.debug(
-                "websocket_disconnected",
-                total_connections=len(self.active_connections),
-            )
+        self._msgpack_clients.discard(websocket)
+        if self.active_connections.pop(websocket, None) is None:
+            return
+
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+        logger.debug(
+            "websocket_disconnected",
+            total_connections=len(self.active_connections),
+        )
 
     async def broadcast(self, message: dict[str, Any]) -> None:
         """
@@ -101,18 +159,60 @@ class ConnectionManager:
         if not self.active_connections:
             return
 
-        message_json = json.dumps(message, default=str)
-        disconnected: list[WebSocket] = []
+        # Serialize at most once per wire format and reuse the frame for every client
+        json_payload: bytes | None = None
+        msgpack_payload: bytes | None = None
+        for websocket, queue in list(self.active_connections.items()):
+            if websocket in self._msgpack_clients:
+                if msgpack_payload is None:
+                    msgpack_payload = _pack(message)
+                self._enqueue(websocket, queue, msgpack_payload)
+            else:
+                if json_payload is None:
+                    json_payload = _encode(message)
+                self._enqueue(websocket, queue, json_payload)
+
+    async def broadcast_bytes(self, payload: bytes) -> None:
+        """
+        Broadcast an already-encoded frame to all connected clients.
+
+        Lets callers that send the same message repeatedly encode it once
+        and reuse the bytes. The frame is sent as-is, regardless of the
+        format each client negotiated.
+
+        Args:
+            payload: Encoded message
+        """
+        for websocket, queue in list(self.active_connections.items()):
+            self._enqueue(websocket, queue, payload)
+
+    def _enqueue(self, websocket: WebSocket, queue: asyncio.Queue[bytes], payload: bytes) -> None:
+        """Queue a frame for a client, evicting it if it has fallen too far behind."""
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("ws_client_too_slow", queue_size=CLIENT_QUEUE_SIZE)
+            self.disconnect(websocket)
 
-        for connection in self.active_connections:
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue[bytes]) -> None:
+        """
+        Drain a client's queue onto its socket until a send fails.
+
+        Exits once the client is disconnected, even if the cancel from
+        disconnect() was absorbed by ``asyncio.wait_for`` mid-send.
+        """
+        while self.active_connections.get(websocket) is queue:
+            payload = await queue.get()
             try:
-                await connection.send_text(message_json)
+                await asyncio.wait_for(websocket.send_bytes(payload), timeout=SEND_TIMEOUT_SECONDS)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.debug("ws_broadcast_send_failed", error=str(e))
-                disconnected.append(connection)
-
-        for conn in disconnected:
-            self.disconnect(conn)
+                self.disconnect(websocket)
+                return
+            finally:
+                queue.task_done()
 
     async def send_to(self, websocket: WebSocket, message: dict[str, Any]) -> bool:
         """
@@ -123,11 +223,24 @@ class ConnectionManager:
             message: Dictionary to serialize and send
 
         Returns:
-            True if message was sent successfully, False otherwise
+            True if message was queued or sent, False otherwise
         """
+        # Don't spend an encode on a socket that is already closed
+        if (
+            websocket.client_state is WebSocketState.DISCONNECTED
+            or websocket.application_state is WebSocketState.DISCONNECTED
+        ):
+            self.disconnect(websocket)
+            return False
+
         try:
-            message_json = json.dumps(message, default=str)
-            await websocket.send_text(message_json)
+            payload = _pack(message) if websocket in self._msgpack_clients else _encode(message)
+            # Registered clients share the writer task so frames stay ordered
+            queue = self.active_connections.get(websocket)
+            if queue is not None:
+                self._enqueue(websocket, queue, payload)
+                return websocket in self.active_connections
+            await websocket.send_bytes(payload)
             return True
         except Exception as e:
             logger.debug("ws_send_to_failed", error=str(e))
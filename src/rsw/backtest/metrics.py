@@ -5,10 +5,16 @@ Calculates how well the strategy recommendations would have performed
 compared to actual race outcomes.
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 
+import numpy as np
 
-@dataclass
+# A recommendation counts as followed if the driver pitted within this many laps
+PIT_WINDOW_LAPS = 2
+
+
+@dataclass(slots=True)
 class PitDecisionResult:
     """Result of a single pit decision."""
 
@@ -69,25 +75,33 @@ def calculate_metrics(
         total_laps=0,
     )
 
-    # Track pit laps by driver
+    # Track pit laps by driver, sorted for binary search
     actual_pit_laps: dict[int, list[int]] = {}
     for pit in actual_pits:
-        driver = pit["driver_number"]
-        lap = pit["lap_number"]
-        if driver not in actual_pit_laps:
-            actual_pit_laps[driver] = []
-        actual_pit_laps[driver].append(lap)
+        actual_pit_laps.setdefault(pit["driver_number"], []).append(pit["lap_number"])
+    for laps in actual_pit_laps.values():
+        laps.sort()
+
+    # Every lap within the pit window of an actual stop, so the window
+    # check is a single set lookup per recommendation
+    windowed: dict[int, set[int]] = {
+        driver: {
+            p + off for p in laps for off in range(-PIT_WINDOW_LAPS, PIT_WINDOW_LAPS + 1)
+        }
+        for driver, laps in actual_pit_laps.items()
+    }
+
+    position_deltas = np.zeros(len(recommendations), dtype=np.int32)
+    timing_errors: list[int] = []
 
     # Analyze each recommendation
-    for rec in recommendations:
+    for i, rec in enumerate(recommendations):
         lap = rec.get("lap", 0)
         driver = rec.get("driver_number", 0)
         action = rec.get("action", "")
-        # optimal_lap = rec.get("optimal_pit_lap", 0)
 
         # Check if driver actually pitted within window
-        driver_pits = actual_pit_laps.get(driver, [])
-        pitted_this_window = any(abs(p - lap) <= 2 for p in driver_pits)
+        pitted_this_window = lap in windowed.get(driver, ())
 
         # Determine if recommendation was correct
         was_correct = False
@@ -112,32 +126,39 @@ def calculate_metrics(
         )
 
         report.pit_decisions.append(result)
-        report.total_decisions += 1
         if was_correct:
             report.correct_decisions += 1
-        report.total_position_gain += pos_delta
+        position_deltas[i] = pos_delta
+
+        # Pit timing error against the closest actual stop
+        optimal_lap = rec.get("optimal_pit_lap", 0)
+        driver_pits = actual_pit_laps.get(driver)
+        if optimal_lap > 0 and driver_pits:
+            timing_errors.append(_nearest_distance(driver_pits, optimal_lap))
 
     # Calculate summary stats
+    report.total_decisions = len(recommendations)
+    report.total_position_gain = int(position_deltas.sum())
     if report.total_decisions > 0:
         report.accuracy = report.correct_decisions / report.total_decisions
-        report.avg_position_gain = report.total_position_gain / report.total_decisions
-
-    # Calculate pit timing error
-    timing_errors = []
-    for rec in recommendations:
-        if rec.get("optimal_pit_lap", 0) > 0:
-            driver = rec.get("driver_number", 0)
-            actual = actual_pit_laps.get(driver, [])
-            if actual:
-                error = min(abs(a - rec["optimal_pit_lap"]) for a in actual)
-                timing_errors.append(error)
+        report.avg_position_gain = float(position_deltas.mean())
 
     if timing_errors:
-        report.avg_pit_timing_error = sum(timing_errors) / len(timing_errors)
+        report.avg_pit_timing_error = float(np.mean(timing_errors))
 
     return report
 
 
+def _nearest_distance(sorted_laps: list[int], lap: int) -> int:
+    """Distance from lap to the closest value in a non-empty sorted list."""
+    idx = bisect_left(sorted_laps, lap)
+    if idx == 0:
+        return sorted_laps[0] - lap
+    if idx == len(sorted_laps):
+        return lap - sorted_laps[-1]
+    return min(sorted_laps[idx] - lap, lap - sorted_laps[idx - 1])
+
+
 def format_report(report: BacktestReport) -> str:
     """Format backtest report as readable string."""
     lines = [
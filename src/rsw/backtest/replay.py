@@ -6,15 +6,104 @@ Supports variable speed playback, seeking, and event callbacks.
 
 import asyncio
 import json
+import os
+import tempfile
+from bisect import bisect_right
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from rsw.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        """Decode UTF-8 JSON bytes."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _loads(data: bytes) -> Any:
+        """Decode UTF-8 JSON bytes."""
+        return json.loads(data)
+
+
+# Small sidecar written next to each cached session holding only listing metadata
+META_SUFFIX = ".meta.json"
+
+
+def _read_json(path: str | Path) -> Any:
+    """Parse a JSON file, reading raw bytes so no separate decode step is needed."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file via a uniquely named temp file and rename it into place.
+
+    Readers never see a partial file, and concurrent writers of the same
+    path never share a temp file.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        tmp_path = f.name
+        try:
+            f.write(data)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    os.replace(tmp_path, path)
+
+
+def meta_path(session_file: Path) -> Path:
+    """Path of the metadata sidecar for a cached session file."""
+    return session_file.with_name(session_file.stem + META_SUFFIX)
+
+
+def session_meta(data: dict) -> dict:
+    """Extract the listing metadata from full session data."""
+    info = data.get("session_info") or {}
+    return {
+        "session_key": data.get("session_key"),
+        "session_name": info.get("session_name"),
+        "country": info.get("country_name"),
+        "circuit": info.get("circuit_short_name"),
+    }
+
+
+def _read_session_meta(session_file: Path, backfill: bool = True) -> dict:
+    """
+    Read listing metadata for a cached session.
+
+    Uses the sidecar when it is at least as new as the session file;
+    otherwise parses the full file and, if backfill is set, atomically
+    writes a fresh sidecar for the next listing.
+    """
+    sidecar = meta_path(session_file)
+    try:
+        if sidecar.stat().st_mtime >= session_file.stat().st_mtime:
+            cached: dict = _read_json(sidecar)
+            return cached
+    except (OSError, ValueError):
+        pass
+
+    meta = session_meta(_read_json(session_file))
+    if backfill:
+        try:
+            write_atomic(sidecar, json.dumps(meta).encode())
+        except OSError as e:
+            logger.debug("replay_meta_write_error", file=str(sidecar), error=str(e))
+    return meta
+
 
 class PlaybackState(Enum):
     """Replay playback state."""
@@ -74,12 +163,39 @@ class ReplaySession:
         # Calculate total laps
         self.total_laps = max((l["lap_number"] for l in self.laps), default=0)
 
+        # Index per-lap records once so get_state() doesn't rescan them
+        self._laps_by_lap: defaultdict[int, list[dict]] = defaultdict(list)
+        for lap_record in self.laps:
+            self._laps_by_lap[lap_record["lap_number"]].append(lap_record)
+
+        self._pits_by_lap: defaultdict[int, list[dict]] = defaultdict(list)
+        for pit in self.pits:
+            self._pits_by_lap[pit["lap_number"]].append(pit)
+
+        # Active stints for every lap, expanded once from each stint's interval
+        self._stints_by_lap: list[list[dict]] = [[] for _ in range(self.total_laps + 1)]
+        for stint in self.stints:
+            end = stint["lap_end"] if stint["lap_end"] is not None else self.total_laps
+            for covered in range(max(0, stint["lap_start"]), min(end, self.total_laps) + 1):
+                self._stints_by_lap[covered].append(stint)
+
+        # Race control sorted by lap (stable), so "messages up to lap N" is a
+        # binary search for the upper bound plus a short slice
+        self._rc_sorted = sorted(self.race_control, key=lambda r: r.get("lap_number") or 0)
+        self._rc_laps = [r.get("lap_number") or 0 for r in self._rc_sorted]
+
         # Playback state
         self._current_lap = 0
         self._state = PlaybackState.STOPPED
         self._speed = 1.0
         self._task: asyncio.Task | None = None
 
+        # Set while playing; the playback loop blocks on it when paused
+        self._resume_event = asyncio.Event()
+
+        # Last built state, reused while (lap, playback state) is unchanged
+        self._state_cache: tuple[int, PlaybackState, ReplayState] | None = None
+
         # Callbacks
         self.on_lap_complete: Callable[[int, ReplayState], None] | None = None
         self.on_state_change: Callable[[ReplayState], None] | None = None
@@ -87,39 +203,40 @@ class ReplaySession:
     @classmethod
     def load(cls, path: str | Path) -> "ReplaySession":
         """Load session from JSON file."""
-        with open(path) as f:
-            data = json.load(f)
-        return cls(data)
+        return cls(_read_json(path))
 
     @classmethod
     def list_cached_sessions(cls, data_dir: str | Path = "data/sessions") -> list[dict]:
-        """List all cached sessions."""
+        """List all cached sessions, reading only their metadata sidecars where possible."""
         data_path = Path(data_dir)
         if not data_path.exists():
             return []
 
+        # Listing is a read; only backfill sidecars where we may write anyway
+        backfill = os.access(data_path, os.W_OK)
         sessions = []
         for file in data_path.glob("*.json"):
+            if file.name.endswith(META_SUFFIX):
+                continue
             try:
-                with open(file) as f:
-                    data = json.load(f)
-                    sessions.append(
-                        {
-                            "session_key": data.get("session_key"),
-                            "session_name": data.get("session_info", {}).get("session_name"),
-                            "country": data.get("session_info", {}).get("country_name"),
-                            "circuit": data.get("session_info", {}).get("circuit_short_name"),
-                            "file": str(file),
-                        }
-                    )
+                sessions.append({**_read_session_meta(file, backfill), "file": str(file)})
             except Exception as e:
                 logger.debug("replay_cache_read_error", file=str(file), error=str(e))
 
         return sessions
 
     def get_state(self) -> ReplayState:
-        """Get current replay state."""
-        return ReplayState(
+        """
+        Get current replay state.
+
+        The same instance is returned until the lap or playback state
+        changes, so callers must treat it as read-only.
+        """
+        cache = self._state_cache
+        if cache is not None and cache[0] == self._current_lap and cache[1] is self._state:
+            return cache[2]
+
+        state = ReplayState(
             session_key=self.session_key,
             session_name=self.session_info.get("session_name", "Unknown"),
             track_name=self.session_info.get("circuit_short_name", "Unknown"),
@@ -134,26 +251,27 @@ class ReplaySession:
             pits_at_current=self._get_pits_at_lap(self._current_lap),
             messages_at_current=self._get_messages_at_lap(self._current_lap),
         )
+        self._state_cache = (self._current_lap, self._state, state)
+        return state
 
     def _get_laps_at_lap(self, lap: int) -> list[dict]:
         """Get all lap records for a specific lap number."""
-        return [l for l in self.laps if l["lap_number"] == lap]
+        return list(self._laps_by_lap.get(lap, ()))
 
     def _get_stints_at_lap(self, lap: int) -> list[dict]:
         """Get active stints at a lap."""
-        return [
-            s
-            for s in self.stints
-            if s["lap_start"] <= lap and (s["lap_end"] is None or s["lap_end"] >= lap)
-        ]
+        if 0 <= lap < len(self._stints_by_lap):
+            return list(self._stints_by_lap[lap])
+        return []
 
     def _get_pits_at_lap(self, lap: int) -> list[dict]:
         """Get pits that happened on a lap."""
-        return [p for p in self.pits if p["lap_number"] == lap]
+        return list(self._pits_by_lap.get(lap, ()))
 
     def _get_messages_at_lap(self, lap: int) -> list[dict]:
         """Get race control messages up to a lap."""
-        return [r for r in self.race_control if r.get("lap_number", 0) <= lap][-5:]
+        hi = bisect_right(self._rc_laps, lap)
+        return self._rc_sorted[max(0, hi - 5) : hi]
 
     def play(self) -> None:
         """Start or resume playback."""
@@ -161,6 +279,8 @@ class ReplaySession:
             self._current_lap = 0
 
         self._state = PlaybackState.PLAYING
+        self._state_cache = None
+        self._resume_event.set()
 
         if self._task is None or self._task.done():
             self._task = asyncio.create_task(self._playback_loop())
@@ -170,12 +290,15 @@ class ReplaySession:
     def pause(self) -> None:
         """Pause playback."""
         self._state = PlaybackState.PAUSED
+        self._resume_event.clear()
         self._notify_state_change()
 
     def stop(self) -> None:
         """Stop playback and reset."""
         self._state = PlaybackState.STOPPED
         self._current_lap = 0
+        self._state_cache = None
+        self._resume_event.clear()
 
         if self._task:
             self._task.cancel()
@@ -186,19 +309,19 @@ class ReplaySession:
     def seek(self, lap: int) -> None:
         """Seek to a specific lap."""
         self._current_lap = max(0, min(lap, self.total_laps))
+        self._state_cache = None
         self._notify_state_change()
 
     def set_speed(self, speed: float) -> None:
         """Set playback speed multiplier."""
         self._speed = max(0.05, min(10.0, speed))
+        self._state_cache = None
         self._notify_state_change()
 
     async def _playback_loop(self) -> None:
         """Main playback loop."""
         while self._current_lap < self.total_laps:
-            if self._state != PlaybackState.PLAYING:
-                await asyncio.sleep(0.1)
-                continue
+            await self._resume_event.wait()
 
             self._current_lap += 1
 
@@ -2,18 +2,41 @@
 Configuration file loaders.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml  # type: ignore
+from pydantic import TypeAdapter
 
 from .schemas import AppConfig, StrategyConfig, TrackConfig
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+# Validates the whole tracks mapping in a single pydantic-core pass
+_TRACKS_ADAPTER = TypeAdapter(dict[str, TrackConfig])
+
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    """Load a YAML file and return its contents."""
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    """
+    Load a YAML file and return its contents.
+
+    Parses are cached on (path, mtime), so repeated loads of an unchanged
+    file are free and edits are picked up. The returned dict is shared
+    between callers and must not be mutated.
+    """
+    return _load_yaml_cached(str(path), path.stat().st_mtime)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime: float) -> dict[str, Any]:
+    """Parse a YAML file. mtime is only part of the cache key."""
+    # Bytes go straight to libyaml without a Python-level decode
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
 
 
 def get_config_dir() -> Path:
@@ -33,7 +56,7 @@ def load_app_config(path: Path | None = None) -> AppConfig:
         return AppConfig()
 
     data = _load_yaml(path)
-    return AppConfig(**data)
+    return AppConfig.model_validate(data)
 
 
 def load_tracks_config(path: Path | None = None) -> dict[str, TrackConfig]:
@@ -45,9 +68,7 @@ def load_tracks_config(path: Path | None = None) -> dict[str, TrackConfig]:
         return {}
 
     data = _load_yaml(path)
-    tracks_data = data.get("tracks", {})
-
-    return {track_id: TrackConfig(**track_data) for track_id, track_data in tracks_data.items()}
+    return _TRACKS_ADAPTER.validate_python(data.get("tracks", {}))
 
 
 def load_strategy_config(path: Path | None = None) -> StrategyConfig:
@@ -59,4 +80,4 @@ def load_strategy_config(path: Path | None = None) -> StrategyConfig:
         return StrategyConfig()
 
     data = _load_yaml(path)
-    return StrategyConfig(**data)
+    return StrategyConfig.model_validate(data)
@@ -1,13 +1,18 @@
 """
 Pydantic configuration schemas.
+
+Configs are loaded once per process and never mutated, so all models are
+frozen.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ServerConfig(BaseModel):
     """Server configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = "127.0.0.1"
     port: int = 8000
     websocket_port: int = 8765
@@ -17,6 +22,8 @@ class ServerConfig(BaseModel):
 class PollingConfig(BaseModel):
     """Polling configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     interval_seconds: float = 2.0
     cache_ttl_seconds: float = 3.0
 
@@ -24,6 +31,8 @@ class PollingConfig(BaseModel):
 class UIConfig(BaseModel):
     """UI configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     refresh_ms: int = 500
     theme: str = "dark"
 
@@ -31,6 +40,8 @@ class UIConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     level: str = "INFO"
     snapshot_every_n_updates: int = 10
     log_to_file: bool = False
@@ -39,6 +50,8 @@ class LoggingConfig(BaseModel):
 class OpenF1Config(BaseModel):
     """OpenF1 API configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     base_url: str = "https://api.openf1.org/v1"
     timeout_seconds: float = 10.0
     max_retries: int = 3
@@ -48,6 +61,8 @@ class OpenF1Config(BaseModel):
 class AppConfig(BaseModel):
     """Main application configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     server: ServerConfig = Field(default_factory=ServerConfig)
     polling: PollingConfig = Field(default_factory=PollingConfig)
     ui: UIConfig = Field(default_factory=UIConfig)
@@ -58,6 +73,8 @@ class AppConfig(BaseModel):
 class TrackConfig(BaseModel):
     """Track-specific configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     track_id: str
     name: str
     location: str
@@ -74,6 +91,8 @@ class TrackConfig(BaseModel):
 class MonteCarloConfig(BaseModel):
     """Monte Carlo simulation configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     simulations: int = 2000
     horizon_laps: int = 20
     random_seed: int | None = None
@@ -82,6 +101,8 @@ class MonteCarloConfig(BaseModel):
 class PitWindowConfig(BaseModel):
     """Pit window analysis configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     candidate_laps_ahead: int = 10
     candidate_laps_behind: int = 5
     min_stint_length: int = 5
@@ -91,6 +112,8 @@ class PitWindowConfig(BaseModel):
 class SafetyCarConfig(BaseModel):
     """Safety car modeling configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     sc_multiplier: float = 1.0
     vsc_multiplier: float = 1.0
     sc_lap_loss: float = 0.5
@@ -100,6 +123,8 @@ class SafetyCarConfig(BaseModel):
 class PaceNoiseConfig(BaseModel):
     """Pace noise modeling configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     multiplier: float = 1.0
     traffic_delta_seconds: float = 0.5
     dirty_air_delta_seconds: float = 0.3
@@ -108,6 +133,8 @@ class PaceNoiseConfig(BaseModel):
 class DegradationConfig(BaseModel):
     """Degradation modeling configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     forgetting_factor: float = 0.95
     min_observations: int = 3
     outlier_threshold_sigma: float = 3.0
@@ -119,6 +146,8 @@ class DegradationConfig(BaseModel):
 class DecisionConfig(BaseModel):
     """Decision making configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     objective: str = "expected_position"
     undercut_risk_threshold: float = 0.7
     overcut_opportunity_threshold: float = 0.6
@@ -128,6 +157,8 @@ class DecisionConfig(BaseModel):
 class ThresholdsConfig(BaseModel):
     """Warning thresholds configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     cliff_risk_deg_slope: float = 0.15
     high_deg_warning: float = 0.12
     undercut_window_laps: int = 3
@@ -137,6 +168,8 @@ class ThresholdsConfig(BaseModel):
 class StrategyConfig(BaseModel):
     """Strategy engine configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     monte_carlo: MonteCarloConfig = Field(default_factory=MonteCarloConfig)
     pit_window: PitWindowConfig = Field(default_factory=PitWindowConfig)
     safety_car: SafetyCarConfig = Field(default_factory=SafetyCarConfig)
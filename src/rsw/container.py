@@ -5,12 +5,14 @@ Manages service dependencies and enables loose coupling
 following the Dependency Inversion Principle.
 """
 
+import os
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any, TypeVar, cast
 
+from rsw.factories import DataProviderFactory, StrategyFactory
 from rsw.interfaces import ICache, IDataProvider, IStateStore, IStrategyCalculator
-from rsw.runtime_config import get_config
+from rsw.state.store import RaceStateStore
 
 T = TypeVar("T")
 
@@ -63,10 +65,15 @@ class Container:
         Raises:
             KeyError: If interface is not registered
         """
+        # Fast path: already-built singletons are a single dict lookup
+        instance = self._singletons.get(interface)
+        if instance is not None:
+            return cast(T, instance)
+
         if interface not in self._factories:
             raise KeyError(f"No factory registered for {interface.__name__}")
 
-        # Return singleton if exists
+        # Create singleton on first resolve
         if interface in self._singleton_types:
             if interface not in self._singletons:
                 self._singletons[interface] = self._factories[interface]()
@@ -75,6 +82,19 @@ class Container:
         # Create new instance
         return cast(T, self._factories[interface]())
 
+    def register_instance(self, interface: type[T], instance: T) -> None:
+        """
+        Register an already-built singleton instance for an interface.
+
+        The instance has no factory behind it, so reset() drops it and the
+        interface must be registered again before the next resolve().
+
+        Args:
+            interface: The abstract interface type
+            instance: The instance to return from resolve()
+        """
+        self._singletons[interface] = instance
+
     def reset(self) -> None:
         """Reset all singletons (useful for testing)."""
         self._singletons.clear()
@@ -85,7 +105,7 @@ class Container:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AppDependencies:
     """
     Application-wide dependencies.
@@ -109,23 +129,16 @@ def create_dependencies() -> AppDependencies:
 
     Follows: Dependency Inversion (depend on abstractions)
     """
-    import os
-
-    from rsw.factories import DataProviderFactory
-    from rsw.services.strategy_service import StrategyService
-    from rsw.state.store import RaceStateStore
-
-    config = get_config()
-
     # Create implementations via factory (respects RSW_DATA_PROVIDER env var)
     provider_type = os.getenv("RSW_DATA_PROVIDER", "openf1")
     data_provider = DataProviderFactory.create(provider_type)
-    state_store = RaceStateStore()
-    strategy_calculator = StrategyService(config.strategy)
+    # RaceStateStore predates IStateStore and is bound to it nominally
+    state_store = cast(IStateStore, RaceStateStore())
+    strategy_calculator = StrategyFactory.create()
 
     return AppDependencies(
-        data_provider=cast(IDataProvider, data_provider),
-        state_store=cast(IStateStore, state_store),
+        data_provider=data_provider,
+        state_store=state_store,
         strategy_calculator=strategy_calculator,
     )
 
@@ -148,24 +161,21 @@ def get_container() -> Container:
 
 def _register_dependencies(container: Container) -> None:
     """Register all dependencies in the container."""
-    import os
-    from collections.abc import Callable
-    from typing import cast
+    provider_type = os.getenv("RSW_DATA_PROVIDER", "openf1")
 
-    from rsw.factories import DataProviderFactory
-    from rsw.state.store import RaceStateStore
+    def data_provider() -> IDataProvider:
+        return cast(IDataProvider, DataProviderFactory.create(provider_type))
 
-    provider_type = os.getenv("RSW_DATA_PROVIDER", "openf1")
-    container.register(
-        IDataProvider,  # type: ignore[type-abstract]
-        cast(Callable[..., IDataProvider], lambda: DataProviderFactory.create(provider_type)),
-        singleton=True,
-    )
-    container.register(
-        IStateStore,  # type: ignore[type-abstract]
-        cast(Callable[..., IStateStore], RaceStateStore),
-        singleton=True,
-    )
+    def state_store() -> IStateStore:
+        return cast(IStateStore, RaceStateStore())
+
+    container.register(IDataProvider, data_provider, singleton=True)  # type: ignore[type-abstract]
+    container.register(IStateStore, state_store, singleton=True)  # type: ignore[type-abstract]
+
+    # Build the singletons up front so requests never run a factory;
+    # reset() still rebuilds them from the registered factories
+    container.resolve(IDataProvider)  # type: ignore[type-abstract]
+    container.resolve(IStateStore)  # type: ignore[type-abstract]
 
 
 # FastAPI dependency functions
@@ -10,10 +10,19 @@ from .models import (
     RaceControlModel,
     SessionModel,
     StintModel,
+    bulk_insert,
+    bulk_insert_laps,
+    bulk_insert_pit_stops,
+    bulk_insert_returning_ids,
+    bulk_insert_stints,
     close_db,
     get_engine,
     get_session,
     init_db,
+    init_session_factory,
+    insert_race_control,
+    laps_array,
+    laps_stream,
 )
 
 __all__ = [
@@ -24,8 +33,17 @@ __all__ = [
     "StintModel",
     "PitStopModel",
     "RaceControlModel",
+    "bulk_insert",
+    "bulk_insert_returning_ids",
+    "bulk_insert_laps",
+    "bulk_insert_stints",
+    "bulk_insert_pit_stops",
+    "insert_race_control",
+    "laps_stream",
+    "laps_array",
     "get_engine",
     "get_session",
     "init_db",
+    "init_session_factory",
     "close_db",
 ]
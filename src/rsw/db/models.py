@@ -4,21 +4,37 @@ Database models and connection management.
 Uses SQLAlchemy 2.0 async for PostgreSQL.
 """
 
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Mapping, Sequence
 from datetime import datetime
+from typing import Any, cast
 
+import numpy as np
 from sqlalchemy import (
     Boolean,
     DateTime,
+    Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncResult,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.pool import NullPool
 
+from rsw.domain import TyreCompound
 from rsw.runtime_config import get_config
 
 
@@ -28,6 +44,30 @@ class Base(DeclarativeBase):
     pass
 
 
+# Native Postgres enum for tyre compounds (4 bytes instead of a varchar).
+# Feeds also report compounds the domain enum doesn't model; bulk_insert_stints
+# stores those as UNKNOWN.
+# Databases created before the enum existed convert in place with:
+#   CREATE TYPE tyre_compound AS ENUM ('SOFT', 'MEDIUM', 'HARD', 'INTERMEDIATE', 'WET', 'UNKNOWN');
+#   ALTER TABLE stints ALTER COLUMN compound TYPE tyre_compound
+#       USING compound::tyre_compound;
+TYRE_COMPOUND_ENUM = Enum(
+    *(c.value for c in TyreCompound),
+    "UNKNOWN",
+    name="tyre_compound",
+    native_enum=True,
+)
+_TYRE_COMPOUNDS = frozenset(TYRE_COMPOUND_ENUM.enums)
+
+
+def normalize_compound(compound: str | None) -> str | None:
+    """Map a feed compound onto a tyre_compound label, UNKNOWN if unmodelled."""
+    if compound is None:
+        return None
+    compound = compound.upper()
+    return compound if compound in _TYRE_COMPOUNDS else "UNKNOWN"
+
+
 # ============================================================================
 # Session Models
 # ============================================================================
@@ -49,13 +89,14 @@ class SessionModel(Base):
     date_end: Mapped[datetime | None] = mapped_column(DateTime)
 
     # Cache metadata
-    cached_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    cached_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     cache_expires_at: Mapped[datetime | None] = mapped_column(DateTime)
     is_complete: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    # Relationships
-    drivers: Mapped[list["DriverModel"]] = relationship(back_populates="session")
-    laps: Mapped[list["LapModel"]] = relationship(back_populates="session")
+    # Relationships raise on implicit lazy loads (which would be hidden I/O
+    # under async); load them explicitly with selectinload()
+    drivers: Mapped[list["DriverModel"]] = relationship(back_populates="session", lazy="raise")
+    laps: Mapped[list["LapModel"]] = relationship(back_populates="session", lazy="raise")
 
 
 class DriverModel(Base):
@@ -79,10 +120,13 @@ class LapModel(Base):
     """Lap time record."""
 
     __tablename__ = "laps"
+    __table_args__ = (
+        Index("ix_laps_session_driver_lap", "session_id", "driver_number", "lap_number"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), index=True)
-    driver_number: Mapped[int] = mapped_column(Integer, index=True)
+    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"))
+    driver_number: Mapped[int] = mapped_column(Integer)
     lap_number: Mapped[int] = mapped_column(Integer)
     lap_duration: Mapped[float | None] = mapped_column(Float)
     sector_1_time: Mapped[float | None] = mapped_column(Float)
@@ -99,12 +143,22 @@ class StintModel(Base):
     """Tyre stint record."""
 
     __tablename__ = "stints"
+    __table_args__ = (
+        Index("ix_stints_session_driver_stint", "session_id", "driver_number", "stint_number"),
+        # Partial index for the soft/medium stints the strategy lookups filter on
+        Index(
+            "ix_stints_softmed",
+            "session_id",
+            "driver_number",
+            postgresql_where=text("compound IN ('SOFT', 'MEDIUM')"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), index=True)
-    driver_number: Mapped[int] = mapped_column(Integer, index=True)
+    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"))
+    driver_number: Mapped[int] = mapped_column(Integer)
     stint_number: Mapped[int] = mapped_column(Integer)
-    compound: Mapped[str | None] = mapped_column(String(20))
+    compound: Mapped[str | None] = mapped_column(TYRE_COMPOUND_ENUM)
     lap_start: Mapped[int] = mapped_column(Integer)
     lap_end: Mapped[int | None] = mapped_column(Integer)
     tyre_age_at_start: Mapped[int] = mapped_column(Integer, default=0)
@@ -114,10 +168,13 @@ class PitStopModel(Base):
     """Pit stop record."""
 
     __tablename__ = "pit_stops"
+    __table_args__ = (
+        Index("ix_pit_stops_session_driver_lap", "session_id", "driver_number", "lap_number"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"), index=True)
-    driver_number: Mapped[int] = mapped_column(Integer, index=True)
+    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id"))
+    driver_number: Mapped[int] = mapped_column(Integer)
     lap_number: Mapped[int] = mapped_column(Integer)
     pit_duration: Mapped[float | None] = mapped_column(Float)
 
@@ -136,6 +193,211 @@ class RaceControlModel(Base):
     timestamp: Mapped[datetime | None] = mapped_column(DateTime)
 
 
+# ============================================================================
+# Bulk Ingest
+# ============================================================================
+
+# Above this many rows, PostgreSQL ingest switches from executemany to COPY
+COPY_THRESHOLD_ROWS = 10_000
+
+
+def copy_records(
+    model: type[Base],
+    rows: Sequence[Mapping[str, Any]],
+) -> tuple[list[str], list[tuple[Any, ...]]]:
+    """
+    Build COPY columns and records in table order for a batch of rows.
+
+    COPY bypasses SQLAlchemy, so the Python-side column defaults that an
+    executemany INSERT would apply are filled in here. Columns with neither
+    a value nor a Python default are left to the server.
+
+    Args:
+        model: Mapped model class to insert into
+        rows: Column-name to value mappings, all with the same keys
+
+    Returns:
+        Column names and one value tuple per row
+    """
+    given = rows[0].keys()
+    columns: list[str] = []
+    defaults: list[Any] = []
+    for column in model.__table__.columns:
+        default = column.default
+        if column.key in given:
+            columns.append(column.key)
+            defaults.append(None)
+        elif default is not None and (default.is_scalar or default.is_callable):
+            columns.append(column.key)
+            defaults.append(default)
+
+    def value(row: Mapping[str, Any], column: str, default: Any) -> Any:
+        if default is None:
+            return row[column]
+        return default.arg(None) if default.is_callable else default.arg
+
+    records = [
+        tuple(value(row, c, d) for c, d in zip(columns, defaults, strict=True)) for row in rows
+    ]
+    return columns, records
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: type[Base],
+    rows: Sequence[Mapping[str, Any]],
+) -> None:
+    """
+    Insert many rows in one statement without building ORM instances.
+
+    Small batches go through a single executemany INSERT, which asyncpg
+    pipelines in one round trip. Large batches on asyncpg use COPY.
+    The caller owns the transaction.
+
+    Args:
+        session: Active database session
+        model: Mapped model class to insert into
+        rows: Column-name to value mappings, all with the same keys
+    """
+    if not rows:
+        return
+
+    if len(rows) >= COPY_THRESHOLD_ROWS and session.get_bind().dialect.driver == "asyncpg":
+        columns, records = copy_records(model, rows)
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        driver_connection = raw.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("asyncpg connection is not available for COPY")
+        await driver_connection.copy_records_to_table(
+            model.__tablename__,
+            records=records,
+            columns=columns,
+        )
+        return
+
+    await session.execute(insert(model), list(rows))
+
+
+async def bulk_insert_returning_ids(
+    session: AsyncSession,
+    model: type[Base],
+    rows: Sequence[Mapping[str, Any]],
+) -> list[int]:
+    """
+    Bulk insert rows and return their generated primary keys, in row order.
+
+    Uses INSERT ... RETURNING with SQLAlchemy's batched "insertmanyvalues"
+    execution, so the keys come back without per-row round trips.
+
+    Args:
+        session: Active database session
+        model: Mapped model class with an integer ``id`` primary key
+        rows: Column-name to value mappings, all with the same keys
+
+    Returns:
+        Primary keys of the inserted rows
+    """
+    if not rows:
+        return []
+
+    pk = model.id  # type: ignore[attr-defined]
+    stmt = insert(model).returning(pk, sort_by_parameter_order=True)
+    result = await session.scalars(stmt, list(rows))
+    return list(result.all())
+
+
+async def bulk_insert_laps(session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+    """Bulk insert lap records."""
+    await bulk_insert(session, LapModel, rows)
+
+
+async def bulk_insert_stints(session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+    """Bulk insert tyre stint records, storing unmodelled compounds as UNKNOWN."""
+    rows = [
+        {**row, "compound": normalize_compound(row["compound"])} if "compound" in row else row
+        for row in rows
+    ]
+    await bulk_insert(session, StintModel, rows)
+
+
+async def bulk_insert_pit_stops(session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+    """Bulk insert pit stop records."""
+    await bulk_insert(session, PitStopModel, rows)
+
+
+async def insert_race_control(session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+    """
+    Bulk insert race control messages without waiting for WAL flush on commit.
+
+    Race control rows are analytics-only, so on PostgreSQL the transaction
+    is committed with synchronous_commit off: a crash can lose the last few
+    milliseconds of messages but never corrupts data. The setting applies
+    to the whole current transaction, so call this in a dedicated one.
+    """
+    if not rows:
+        return
+
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+    await bulk_insert(session, RaceControlModel, rows)
+
+
+# ============================================================================
+# Columnar Reads
+# ============================================================================
+
+# Rows fetched per round trip when streaming laps
+LAP_STREAM_BATCH_SIZE = 1000
+
+# Struct-of-arrays layout for session lap data. lap_duration is nullable in the
+# table and NULL durations are written into the float column as NaN
+LAP_DTYPE = np.dtype(
+    [("driver_number", np.int32), ("lap_number", np.int32), ("lap_duration", np.float64)]
+)
+
+
+# One streamed lap row: (driver_number, lap_number, lap_duration or None)
+LapRow = tuple[int, int, float | None]
+
+
+async def laps_stream(session: AsyncSession, session_id: int) -> AsyncResult[Any]:
+    """
+    Stream (driver_number, lap_number, lap_duration) tuples for a session.
+
+    Selects bare columns, so no LapModel instances are built, and fetches
+    in LAP_STREAM_BATCH_SIZE chunks over a server-side cursor.
+    """
+    laps = LapModel.__table__.c
+    stmt = (
+        select(laps.driver_number, laps.lap_number, laps.lap_duration)
+        .where(laps.session_id == session_id)
+        .order_by(laps.driver_number, laps.lap_number)
+        .execution_options(yield_per=LAP_STREAM_BATCH_SIZE)
+    )
+    result: AsyncResult[Any] = await session.stream(stmt)
+    return result
+
+
+async def laps_array(session: AsyncSession, session_id: int) -> np.ndarray:
+    """Load a session's laps into a LAP_DTYPE structured array, NULL durations as NaN."""
+    result = await laps_stream(session, session_id)
+    nan = float("nan")
+    chunks = []
+    async for partition in result.partitions():
+        rows = cast(Sequence[LapRow], partition)
+        chunks.append(
+            np.fromiter(
+                ((driver, lap, nan if dur is None else dur) for driver, lap, dur in rows),
+                dtype=LAP_DTYPE,
+                count=len(rows),
+            )
+        )
+    if not chunks:
+        return np.empty(0, dtype=LAP_DTYPE)
+    return np.concatenate(chunks)
+
+
 # ============================================================================
 # Database Connection
 # ============================================================================
@@ -143,7 +405,7 @@ class RaceControlModel(Base):
 _engine: AsyncEngine | None = None
 
 
-_session_factory: Callable[[], AsyncSession] | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 async def get_engine() -> AsyncEngine:
@@ -151,33 +413,57 @@ async def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
         config = get_config()
+        db = config.database
+        connect_args: dict[str, Any] = {"server_settings": {"jit": "off"}}
+
+        if db.use_pgbouncer:
+            # PgBouncer pools server-side and can't share prepared statements
+            connect_args["statement_cache_size"] = 0
+            pool_args: dict[str, Any] = {"poolclass": NullPool}
+        else:
+            pool_args = {
+                "pool_size": db.pool_size,
+                "max_overflow": db.pool_max_overflow,
+                "pool_timeout": db.pool_timeout,
+                "pool_recycle": db.pool_recycle,
+                "pool_pre_ping": True,
+            }
+
         _engine = create_async_engine(
-            config.database.postgres_url,
-            pool_size=config.database.pool_size,
-            max_overflow=config.database.pool_max_overflow,
+            db.postgres_url,
             echo=config.is_development,
+            connect_args=connect_args,
+            **pool_args,
         )
     return _engine
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session."""
+async def init_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Create the engine and session factory. Called once from the app lifespan.
+
+    Returns:
+        The shared session factory
+    """
     global _session_factory
     if _session_factory is None:
-        engine = await get_engine()
-        from collections.abc import Callable
-        from typing import cast
-
-        from sqlalchemy.ext.asyncio import async_sessionmaker
-
-        _session_factory = cast(
-            Callable[[], AsyncSession],
-            async_sessionmaker(
-                engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-            ),
+        _session_factory = async_sessionmaker(
+            await get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
         )
+    return _session_factory
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get database session.
+
+    Raises:
+        RuntimeError: If init_session_factory() has not run
+    """
+    if _session_factory is None:
+        raise RuntimeError("Database session factory is not initialized")
 
     async with _session_factory() as session:
         yield session
@@ -192,7 +478,8 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections."""
-    global _engine
+    global _engine, _session_factory
+    _session_factory = None
     if _engine:
         await _engine.dispose()
         _engine = None
@@ -5,8 +5,11 @@ Immutable objects that represent domain concepts.
 Follows: Information Hiding, Encapsulation
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from math import hypot
+
+import numpy as np
 
 # ============================================================================
 # Enums (Named Constants - KISS)
@@ -25,14 +28,17 @@ class TyreCompound(str, Enum):
     @property
     def degradation_factor(self) -> float:
         """Base degradation factor for compound."""
-        factors = {
-            "SOFT": 1.2,
-            "MEDIUM": 1.0,
-            "HARD": 0.8,
-            "INTERMEDIATE": 1.1,
-            "WET": 1.0,
-        }
-        return factors.get(self.value, 1.0)
+        return _DEGRADATION_FACTORS[self]
+
+
+# Built once; the enum is closed so every member has an entry
+_DEGRADATION_FACTORS: dict[TyreCompound, float] = {
+    TyreCompound.SOFT: 1.2,
+    TyreCompound.MEDIUM: 1.0,
+    TyreCompound.HARD: 0.8,
+    TyreCompound.INTERMEDIATE: 1.1,
+    TyreCompound.WET: 1.0,
+}
 
 
 class SessionType(str, Enum):
@@ -70,7 +76,7 @@ class RecommendationType(str, Enum):
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LapTime:
     """
     Immutable lap time value object.
@@ -100,7 +106,7 @@ class LapTime:
         return self.seconds - other.seconds
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Gap:
     """
     Immutable gap value object.
@@ -109,25 +115,31 @@ class Gap:
     """
 
     seconds: float
+    _laps_behind: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived once; 60s approximates a lap time
+        laps = int(self.seconds // 60) if self.seconds >= 60.0 else 0
+        object.__setattr__(self, "_laps_behind", laps)
 
     @property
     def is_lapped(self) -> bool:
-        return self.seconds >= 60.0  # Approximate lap time
+        return self._laps_behind > 0
 
     @property
     def laps_behind(self) -> int:
-        return int(self.seconds // 60) if self.is_lapped else 0
+        return self._laps_behind
 
     def __str__(self) -> str:
         if self.seconds == 0:
             return "LEADER"
-        if self.is_lapped:
-            laps = self.laps_behind
+        laps = self._laps_behind
+        if laps:
             return f"+{laps} LAP{'S' if laps > 1 else ''}"
         return f"+{self.seconds:.3f}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PitWindow:
     """
     Immutable pit window value object.
@@ -154,7 +166,7 @@ class PitWindow:
         return self.max_lap - self.min_lap
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Coordinates:
     """
     Immutable track coordinates.
@@ -167,9 +179,14 @@ class Coordinates:
 
     def distance_to(self, other: "Coordinates") -> float:
         """Calculate distance to another point."""
-        import math
+        return hypot(self.x - other.x, self.y - other.y)
 
-        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+    @staticmethod
+    def distances_bulk(
+        xs: np.ndarray, ys: np.ndarray, other_x: float, other_y: float
+    ) -> np.ndarray:
+        """Distances from many (x, y) points to one point, computed in a single pass."""
+        return np.hypot(xs - other_x, ys - other_y)
 
 
 # ============================================================================
@@ -177,7 +194,7 @@ class Coordinates:
 # ============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrategyRecommendation:
     """
     Strategy recommendation result.
@@ -201,7 +218,7 @@ class StrategyRecommendation:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonteCarloResult:
     """
     Monte Carlo simulation result.
@@ -9,7 +9,15 @@ from typing import Any
 
 
 class RSWError(Exception):
-    """Base exception for all RSW errors."""
+    """
+    Base exception for all RSW errors.
+
+    Every class in the hierarchy declares __slots__ for its own attributes.
+    BaseException still provides __dict__, so this speeds attribute access
+    rather than shrinking instances.
+    """
+
+    __slots__ = ("message", "code", "details", "_dict")
 
     def __init__(
         self,
@@ -20,17 +28,26 @@ class RSWError(Exception):
         self.message = message
         self.code = code
         self.details = details or {}
+        self._dict: dict[str, Any] | None = None
         super().__init__(self.message)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert exception to dictionary for API responses."""
-        return {
-            "error": {
-                "code": self.code,
-                "message": self.message,
-                "details": self.details,
+        """
+        Convert exception to dictionary for API responses.
+
+        Built on first call and reused afterwards; subclasses finish setting
+        code and details in __init__, so the error is complete by then.
+        Treat the result as read-only.
+        """
+        if self._dict is None:
+            self._dict = {
+                "error": {
+                    "code": self.code,
+                    "message": self.message,
+                    "details": self.details,
+                }
             }
-        }
+        return self._dict
 
 
 # ============================================================================
@@ -41,6 +58,8 @@ class RSWError(Exception):
 class APIError(RSWError):
     """Error communicating with external APIs."""
 
+    __slots__ = ("status_code", "endpoint")
+
     def __init__(
         self,
         message: str,
@@ -59,6 +78,8 @@ class APIError(RSWError):
 class RateLimitError(APIError):
     """Rate limit exceeded on external API."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         retry_after: int | None = None,
@@ -76,6 +97,8 @@ class RateLimitError(APIError):
 class APITimeoutError(APIError):
     """Request to external API timed out."""
 
+    __slots__ = ("timeout",)
+
     def __init__(self, endpoint: str | None = None, timeout: float = 30.0) -> None:
         super().__init__(
             message=f"Request timed out after {timeout}s",
@@ -89,6 +112,8 @@ class APITimeoutError(APIError):
 class APIConnectionError(APIError):
     """Failed to connect to external API."""
 
+    __slots__ = ()
+
     def __init__(self, endpoint: str | None = None) -> None:
         super().__init__(
             message="Failed to connect to API",
@@ -106,6 +131,8 @@ class APIConnectionError(APIError):
 class DataError(RSWError):
     """Error with data processing or validation."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, field: str | None = None) -> None:
         super().__init__(
             message=message,
@@ -117,6 +144,8 @@ class DataError(RSWError):
 class SessionNotFoundError(DataError):
     """Requested session was not found."""
 
+    __slots__ = ("session_key",)
+
     def __init__(self, session_key: int) -> None:
         super().__init__(
             message=f"Session {session_key} not found",
@@ -129,6 +158,8 @@ class SessionNotFoundError(DataError):
 class DriverNotFoundError(DataError):
     """Requested driver was not found."""
 
+    __slots__ = ("driver_number", "session_key")
+
     def __init__(self, driver_number: int, session_key: int | None = None) -> None:
         super().__init__(
             message=f"Driver {driver_number} not found",
@@ -142,6 +173,8 @@ class DriverNotFoundError(DataError):
 class InvalidDataError(DataError):
     """Data failed validation."""
 
+    __slots__ = ("value",)
+
     def __init__(self, message: str, field: str, value: Any = None) -> None:
         super().__init__(message=message, field=field)
         self.value = value
@@ -157,6 +190,8 @@ class InvalidDataError(DataError):
 class StrategyError(RSWError):
     """Error in strategy calculation."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, driver_number: int | None = None) -> None:
         super().__init__(
             message=message,
@@ -168,6 +203,8 @@ class StrategyError(RSWError):
 class InsufficientDataError(StrategyError):
     """Not enough data for strategy calculation."""
 
+    __slots__ = ("required", "available")
+
     def __init__(
         self,
         message: str = "Insufficient data for calculation",
@@ -184,6 +221,8 @@ class InsufficientDataError(StrategyError):
 class ModelError(StrategyError):
     """Error in ML model prediction."""
 
+    __slots__ = ("model_name",)
+
     def __init__(self, message: str, model_name: str | None = None) -> None:
         super().__init__(message=message)
         self.model_name = model_name
@@ -200,6 +239,8 @@ class ModelError(StrategyError):
 class AuthError(RSWError):
     """Authentication/authorization error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication required") -> None:
         super().__init__(message=message, code="AUTH_ERROR")
 
@@ -207,6 +248,8 @@ class AuthError(RSWError):
 class InvalidTokenError(AuthError):
     """Invalid or expired authentication token."""
 
+    __slots__ = ()
+
     def __init__(self, reason: str = "Token is invalid or expired") -> None:
         super().__init__(message=reason)
         self.code = "INVALID_TOKEN"
@@ -215,6 +258,8 @@ class InvalidTokenError(AuthError):
 class InsufficientPermissionsError(AuthError):
     """User lacks required permissions."""
 
+    __slots__ = ("required_permission",)
+
     def __init__(self, required_permission: str) -> None:
         super().__init__(message=f"Missing required permission: {required_permission}")
         self.required_permission = required_permission
@@ -229,6 +274,8 @@ class InsufficientPermissionsError(AuthError):
 class ReplayError(RSWError):
     """Error during replay playback."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, session_key: int | None = None) -> None:
         super().__init__(
             message=message,
@@ -240,6 +287,8 @@ class ReplayError(RSWError):
 class CachedSessionNotFoundError(ReplayError):
     """Cached session file not found."""
 
+    __slots__ = ("path",)
+
     def __init__(self, session_key: int, path: str | None = None) -> None:
         super().__init__(
             message=f"Cached session {session_key} not found",
@@ -252,6 +301,8 @@ class CachedSessionNotFoundError(ReplayError):
 class NoActiveReplayError(ReplayError):
     """No replay is currently active."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(message="No active replay session")
         self.code = "NO_ACTIVE_REPLAY"
@@ -265,6 +316,8 @@ class NoActiveReplayError(ReplayError):
 class ConfigError(RSWError):
     """Configuration error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, config_key: str | None = None) -> None:
         super().__init__(
             message=message,
@@ -276,6 +329,8 @@ class ConfigError(RSWError):
 class MissingConfigError(ConfigError):
     """Required configuration is missing."""
 
+    __slots__ = ()
+
     def __init__(self, config_key: str) -> None:
         super().__init__(
             message=f"Missing required configuration: {config_key}",
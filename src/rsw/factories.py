@@ -5,8 +5,12 @@ Follows: Factory Pattern, Single Responsibility
 Encapsulates object creation logic.
 """
 
+from collections.abc import Iterable
+from functools import cache
 from typing import Any
 
+import numpy as np
+
 from rsw.domain import PitWindow, RecommendationType, StrategyRecommendation, TyreCompound
 from rsw.runtime_config import get_config
 
@@ -21,10 +25,16 @@ class DataProviderFactory:
     """
 
     @staticmethod
+    @cache
     def create(provider_type: str = "openf1") -> Any:
         """
         Create a data provider instance.
 
+        Instances are cached per provider type, so the OpenF1 client and its
+        connection pool are built once. Every caller gets the same shared
+        client and must not close it; only the owner of the cache (app
+        shutdown, or a test after ``create.cache_clear()``) should.
+
         Args:
             provider_type: Type of provider ("openf1", "cached", "mock")
 
@@ -59,10 +69,13 @@ class StrategyFactory:
     """
 
     @staticmethod
+    @cache
     def create(strategy_type: str = "default") -> Any:
         """
         Create a strategy calculator.
 
+        Instances are cached per strategy type and shared by all callers.
+
         Args:
             strategy_type: Type of strategy ("default", "aggressive", "conservative")
 
@@ -140,6 +153,46 @@ class PitWindowFactory:
             reason=reason,
         )
 
+    @staticmethod
+    def from_calculation_batch(
+        current_lap: int | np.ndarray,
+        total_laps: int | np.ndarray,
+        deg_slope: np.ndarray,
+        pit_loss: float | np.ndarray,
+        compound: Iterable[TyreCompound | str],
+        tyre_age: int | np.ndarray = 0,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized from_calculation for many scenarios at once.
+
+        Applies the same arithmetic as from_calculation element-wise, so
+        Monte Carlo sweeps avoid per-sample Python overhead. Arguments
+        broadcast against each other. Windows are not validated; callers
+        needing PitWindow objects should check min <= ideal <= max.
+
+        Returns:
+            Tuple of (min_lap, ideal_lap, max_lap) integer arrays
+        """
+        deg_factor = np.fromiter(
+            (TyreCompound(c).degradation_factor for c in compound), dtype=np.float64
+        )
+        adjusted_deg = np.asarray(deg_slope, dtype=np.float64) * deg_factor
+
+        # Pit when degradation cost exceeds pit loss; default stint otherwise
+        positive = adjusted_deg > 0
+        stint = np.divide(
+            pit_loss, adjusted_deg * 2, out=np.zeros_like(adjusted_deg), where=positive
+        )
+        optimal_stint = np.where(positive, np.trunc(stint), 25).astype(np.int64)
+
+        total = np.asarray(total_laps, dtype=np.int64)
+        ideal = np.minimum(current_lap + optimal_stint - tyre_age, total - 10)
+        min_lap = np.maximum(np.asarray(current_lap) + 3, ideal - 5)
+        max_lap = np.minimum(ideal + 8, total - 5)
+        ideal = np.maximum(min_lap, np.minimum(ideal, max_lap))
+
+        return min_lap, ideal, max_lap
+
 
 class RecommendationFactory:
     """
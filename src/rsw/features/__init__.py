@@ -2,14 +2,19 @@
 Feature engineering module for race strategy analysis.
 """
 
-from .build import FeatureFrame, build_features
-from .filters import apply_filters, is_valid_lap
+from .build import Compound, FeatureFrame, FeatureTable, build_features
+from .filters import LapFlag, apply_filters, filter_mask, is_valid_lap, is_valid_lap_batch
 from .traffic import detect_traffic
 
 __all__ = [
+    "Compound",
     "FeatureFrame",
+    "FeatureTable",
     "build_features",
     "apply_filters",
+    "filter_mask",
     "is_valid_lap",
+    "is_valid_lap_batch",
+    "LapFlag",
     "detect_traffic",
 ]
@@ -5,11 +5,47 @@ Features are computed per driver and used as inputs to the
 degradation models and strategy calculations.
 """
 
-import statistics
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from math import inf, sqrt
+from typing import Any
 
+import numpy as np
 
-@dataclass
+
+class Compound(IntEnum):
+    """Tyre compound codes used for columnar storage and vector filters."""
+
+    UNKNOWN = 0
+    SOFT = 1
+    MEDIUM = 2
+    HARD = 3
+    INTERMEDIATE = 4
+    WET = 5
+
+
+# Display names indexed by Compound code
+COMPOUND_NAMES: tuple[str, ...] = tuple(c.name for c in Compound)
+_COMPOUND_LUT: dict[str, Compound] = {c.name: c for c in Compound}
+
+
+def intern_compound(name: str | None) -> str:
+    """
+    Return the shared canonical string for a compound name.
+
+    Known compounds map to the COMPOUND_NAMES objects, so equal compounds
+    are the same object; unrecognized names pass through unchanged.
+    """
+    if not name:
+        return "UNKNOWN"
+    code = _COMPOUND_LUT.get(name)
+    return name if code is None else COMPOUND_NAMES[code]
+
+
+@dataclass(slots=True)
 class FeatureFrame:
     """
     Feature container for a single driver at a point in the race.
@@ -51,6 +87,146 @@ class FeatureFrame:
     # Fuel correction (approximate)
     fuel_corrected_time: float | None = None
 
+    @property
+    def compound_code(self) -> Compound:
+        """Compound as a Compound code; unrecognized names are UNKNOWN."""
+        return _COMPOUND_LUT.get(self.compound, Compound.UNKNOWN)
+
+
+# Fuel correction (approximate: 0.03s per kg, ~1.5kg per lap)
+FUEL_EFFECT_PER_LAP = 0.045
+
+
+@lru_cache(maxsize=8)
+def _fuel_lut(total_laps: int) -> tuple[float, ...]:
+    """Fuel effect for laps 0..total_laps+1 of a race; built once per race length."""
+    return tuple((total_laps - lap) * FUEL_EFFECT_PER_LAP for lap in range(total_laps + 2))
+
+
+# FeatureTable columns grouped by storage type, with FeatureFrame defaults
+_INT_COLUMNS: dict[str, int] = {
+    "driver_number": 0,
+    "lap_number": 0,
+    "lap_in_stint": 0,
+    "stint_number": 1,
+    "tyre_age": 0,
+}
+_FLOAT_COLUMNS: dict[str, float] = {
+    "lap_time": np.nan,
+    "recent_pace_mean": np.nan,
+    "recent_pace_std": np.nan,
+    "best_lap_time": np.nan,
+    "track_evolution": 0.0,
+    "gap_ahead": np.nan,
+    "fuel_corrected_time": np.nan,
+}
+_BOOL_COLUMNS: dict[str, bool] = {
+    "traffic_affected": False,
+    "clean_air": True,
+    "is_pit_in_lap": False,
+    "is_pit_out_lap": False,
+    "is_sc_lap": False,
+    "is_vsc_lap": False,
+    "is_valid": True,
+}
+# Float columns where None is stored as NaN
+_OPTIONAL_COLUMNS = frozenset(_FLOAT_COLUMNS) - {"track_evolution"}
+
+
+class FeatureTable:
+    """
+    Columnar (struct-of-arrays) store for many feature frames.
+
+    Each FeatureFrame field is a NumPy array of length N: ints as int32,
+    floats as float64 with NaN for None, flags as bool and compound as int8
+    Compound codes. Filters work on whole columns at once.
+    Indexing with an int returns a FeatureFrame; with a mask, slice or
+    index array it returns a new FeatureTable.
+    """
+
+    __slots__ = ("compound", *_INT_COLUMNS, *_FLOAT_COLUMNS, *_BOOL_COLUMNS)
+
+    compound: np.ndarray
+
+    # _INT_COLUMNS
+    driver_number: np.ndarray
+    lap_number: np.ndarray
+    lap_in_stint: np.ndarray
+    stint_number: np.ndarray
+    tyre_age: np.ndarray
+
+    # _FLOAT_COLUMNS
+    lap_time: np.ndarray
+    recent_pace_mean: np.ndarray
+    recent_pace_std: np.ndarray
+    best_lap_time: np.ndarray
+    track_evolution: np.ndarray
+    gap_ahead: np.ndarray
+    fuel_corrected_time: np.ndarray
+
+    # _BOOL_COLUMNS
+    traffic_affected: np.ndarray
+    clean_air: np.ndarray
+    is_pit_in_lap: np.ndarray
+    is_pit_out_lap: np.ndarray
+    is_sc_lap: np.ndarray
+    is_vsc_lap: np.ndarray
+    is_valid: np.ndarray
+
+    def __init__(self, n: int = 0) -> None:
+        self.compound = np.full(n, Compound.UNKNOWN, dtype=np.int8)
+        for name, int_default in _INT_COLUMNS.items():
+            setattr(self, name, np.full(n, int_default, dtype=np.int32))
+        for name, float_default in _FLOAT_COLUMNS.items():
+            setattr(self, name, np.full(n, float_default, dtype=np.float64))
+        for name, bool_default in _BOOL_COLUMNS.items():
+            setattr(self, name, np.full(n, bool_default, dtype=np.bool_))
+
+    def __len__(self) -> int:
+        return len(self.compound)
+
+    @classmethod
+    def from_frames(cls, frames: list[FeatureFrame]) -> "FeatureTable":
+        """Build a table from a list of feature frames."""
+        table = cls.__new__(cls)
+        n = len(frames)
+        table.compound = np.fromiter(
+            (_COMPOUND_LUT.get(f.compound, Compound.UNKNOWN) for f in frames),
+            dtype=np.int8,
+            count=n,
+        )
+        for name in _INT_COLUMNS:
+            setattr(table, name, np.array([getattr(f, name) for f in frames], dtype=np.int32))
+        for name in _FLOAT_COLUMNS:
+            values = [getattr(f, name) for f in frames]
+            if name in _OPTIONAL_COLUMNS:
+                values = [np.nan if v is None else v for v in values]
+            setattr(table, name, np.array(values, dtype=np.float64))
+        for name in _BOOL_COLUMNS:
+            setattr(table, name, np.array([getattr(f, name) for f in frames], dtype=np.bool_))
+        return table
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, (int, np.integer)):
+            return self.frame(int(key))
+        table = FeatureTable.__new__(FeatureTable)
+        for name in self.__slots__:
+            setattr(table, name, getattr(self, name)[key])
+        return table
+
+    def frame(self, index: int) -> FeatureFrame:
+        """Materialize a single row as a FeatureFrame."""
+        values = {name: getattr(self, name)[index].item() for name in self.__slots__}
+        values["compound"] = COMPOUND_NAMES[values["compound"]]
+        for name in _OPTIONAL_COLUMNS:
+            if values[name] != values[name]:  # NaN
+                values[name] = None
+        return FeatureFrame(**values)
+
+    def to_frames(self) -> list[FeatureFrame]:
+        """Materialize every row as a FeatureFrame."""
+        return [self.frame(i) for i in range(len(self))]
+
 
 def build_features(
     driver_number: int,
@@ -66,6 +242,8 @@ def build_features(
     is_sc: bool = False,
     is_vsc: bool = False,
     window_size: int = 5,
+    valid_times: list[float] | None = None,
+    lap_index: int | None = None,
 ) -> FeatureFrame:
     """
     Build a feature frame for a driver at a specific lap.
@@ -84,6 +262,10 @@ def build_features(
         is_sc: Whether safety car is deployed
         is_vsc: Whether virtual safety car is active
         window_size: Rolling window for pace statistics
+        valid_times: Positive lap times from lap_times, if the caller
+            already has them filtered
+        lap_index: Treat lap_times as if sliced to lap_times[:lap_index + 1],
+            without copying the list
 
     Returns:
         FeatureFrame with computed features
@@ -93,7 +275,7 @@ def build_features(
         lap_number=lap_number,
         lap_in_stint=lap_in_stint,
         stint_number=stint_number,
-        compound=compound or "UNKNOWN",
+        compound=intern_compound(compound),
         tyre_age=tyre_age,
         gap_ahead=gap_ahead,
         is_pit_out_lap=is_pit_out,
@@ -101,22 +283,50 @@ def build_features(
         is_vsc_lap=is_vsc,
     )
 
+    # Only lap_times[:stop] is visible to this lap
+    stop = len(lap_times) if lap_index is None else max(0, min(lap_index + 1, len(lap_times)))
+
     # Current lap time
-    if lap_times and len(lap_times) >= lap_number:
+    if stop and stop >= lap_number:
         frame.lap_time = lap_times[lap_number - 1] if lap_number > 0 else None
-    elif lap_times:
-        frame.lap_time = lap_times[-1] if lap_times else None
-
-    # Best lap time
-    valid_times = [t for t in lap_times if t and t > 0]
-    if valid_times:
-        frame.best_lap_time = min(valid_times)
-
-    # Rolling pace statistics
-    recent_times = valid_times[-window_size:] if valid_times else []
-    if len(recent_times) >= 2:
-        frame.recent_pace_mean = statistics.mean(recent_times)
-        frame.recent_pace_std = statistics.stdev(recent_times)
+    elif stop:
+        frame.lap_time = lap_times[stop - 1]
+
+    # Best lap time and the rolling window of recent valid laps
+    recent_times: Sequence[float]
+    if valid_times is None:
+        # Single pass over the raw laps: track the best lap and keep only
+        # the last window_size valid laps, without building a filtered list
+        best = inf
+        window: deque[float] = deque(maxlen=window_size if window_size > 0 else None)
+        for i in range(stop):
+            t = lap_times[i]
+            if t and t > 0:
+                window.append(t)
+                if t < best:
+                    best = t
+        if window:
+            frame.best_lap_time = best
+        recent_times = window
+    else:
+        if valid_times:
+            frame.best_lap_time = min(valid_times)
+        recent_times = valid_times[-window_size:]
+
+    # Rolling pace statistics: one pass for sum and sum of squares, taken
+    # relative to the first lap so the variance doesn't lose precision
+    n = len(recent_times)
+    if n >= 2:
+        base = recent_times[0]
+        total = 0.0
+        total_sq = 0.0
+        for t in recent_times:
+            d = t - base
+            total += d
+            total_sq += d * d
+        mean_dev = total / n
+        frame.recent_pace_mean = base + mean_dev
+        frame.recent_pace_std = sqrt(max(0.0, (total_sq - total * mean_dev) / (n - 1)))
     elif recent_times:
         frame.recent_pace_mean = recent_times[0]
         frame.recent_pace_std = 0.0
@@ -129,10 +339,13 @@ def build_features(
         frame.traffic_affected = gap_ahead < 1.5
         frame.clean_air = gap_ahead > 2.0
 
-    # Fuel correction (approximate: 0.03s per kg, ~1.5kg per lap)
-    # Early laps are slower due to fuel weight
-    fuel_effect = (total_laps - lap_number) * 0.045  # ~0.045s per lap of fuel
+    # Fuel correction: early laps are slower due to fuel weight
     if frame.lap_time:
+        fuel_lut = _fuel_lut(total_laps)
+        if 0 <= lap_number < len(fuel_lut):
+            fuel_effect = fuel_lut[lap_number]
+        else:
+            fuel_effect = (total_laps - lap_number) * FUEL_EFFECT_PER_LAP
         frame.fuel_corrected_time = frame.lap_time - fuel_effect
 
     # Validity for model training
@@ -154,28 +367,102 @@ def build_stint_features(
     stint_start_lap: int,
     compound: str,
     total_laps: int,
+    window_size: int = 5,
+    valid_only: bool = False,
 ) -> list[FeatureFrame]:
     """
     Build feature frames for all laps in a stint.
 
-    Useful for batch processing of historical data.
+    Useful for batch processing of historical data. Produces the same frames
+    as calling build_features on each lap prefix, with bit-identical rolling
+    pace statistics (zero tolerance), but computes best lap and rolling pace
+    for the whole stint at once with array operations.
+
+    With valid_only, frames for invalid laps are never built, so modelling
+    pipelines receive a dense list where every frame has is_valid set.
     """
+    n = len(lap_times)
+    if n == 0:
+        return []
+
+    times = np.array([t if t else 0.0 for t in lap_times], dtype=np.float64)
+    valid = times > 0
+
+    # Best valid lap up to and including each lap
+    best = np.minimum.accumulate(np.where(valid, times, np.inf))
+
+    # Rolling mean/stdev over the last window_size valid laps. Each window is
+    # summed column by column relative to its own first lap, the same float
+    # operations build_features does, so the statistics match it exactly.
+    valid_times = times[valid]
+    m = valid_times.size
+    w = window_size if 0 < window_size < m else max(m, 1)
+    end = np.cumsum(valid)
+    count = np.minimum(end, w)
+    if m:
+        k = np.arange(m)
+        base = valid_times[np.maximum(k - w + 1, 0)]
+        # Column c of window k is valid lap k - (w - 1) + c; windows that
+        # start before the first valid lap skip their leading columns
+        total = np.zeros(m)
+        total_sq = np.zeros(m)
+        for c in range(w):
+            first = max(w - 1 - c, 0)
+            d = valid_times[first + c - (w - 1) : m + c - (w - 1)] - base[first:]
+            total[first:] += d
+            total_sq[first:] += d * d
+        win_n = np.minimum(k + 1, w)
+        mean_dev = total / win_n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            win_var = np.maximum(0.0, (total_sq - total * mean_dev) / (win_n - 1))
+        win_std = np.where(win_n >= 2, np.sqrt(win_var), 0.0)
+        last = np.maximum(end - 1, 0)
+        mean = (base + mean_dev)[last]
+        std = win_std[last]
+    else:
+        mean = std = np.zeros(n)
+
+    lap_numbers = stint_start_lap + np.arange(n)
+    fuel_list = ((total_laps - lap_numbers) * FUEL_EFFECT_PER_LAP).tolist()
+
+    best_list = best.tolist()
+    mean_list = mean.tolist()
+    std_list = std.tolist()
+    count_list = count.tolist()
+    laps_divisor = max(total_laps, 1)
+
     frames = []
-    for i, lap_time in enumerate(lap_times):
+    for i in range(n):
         lap_number = stint_start_lap + i
         lap_in_stint = i + 1
 
-        frame = build_features(
-            driver_number=0,  # Will be set by caller
-            lap_number=lap_number,
-            lap_times=lap_times[: i + 1],
-            lap_in_stint=lap_in_stint,
-            stint_number=1,
-            compound=compound,
-            tyre_age=lap_in_stint,
-            gap_ahead=None,
-            total_laps=total_laps,
+        # Same lookup build_features does on the lap_times[: i + 1] prefix
+        if lap_in_stint >= lap_number:
+            lap_time = lap_times[lap_number - 1] if lap_number > 0 else None
+        else:
+            lap_time = lap_times[i]
+
+        is_valid = lap_time is not None and lap_time > 0
+        if valid_only and not is_valid:
+            continue
+
+        has_pace = count_list[i] > 0
+        frames.append(
+            FeatureFrame(
+                driver_number=0,  # Will be set by caller
+                lap_number=lap_number,
+                lap_in_stint=lap_in_stint,
+                stint_number=1,
+                compound=intern_compound(compound),
+                tyre_age=lap_in_stint,
+                lap_time=lap_time,
+                recent_pace_mean=mean_list[i] if has_pace else None,
+                recent_pace_std=std_list[i] if has_pace else None,
+                best_lap_time=best_list[i] if has_pace else None,
+                track_evolution=lap_number / laps_divisor,
+                fuel_corrected_time=lap_time - fuel_list[i] if lap_time else None,
+                is_valid=is_valid,
+            )
         )
-        frames.append(frame)
 
     return frames
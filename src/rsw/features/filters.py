@@ -4,9 +4,67 @@ Lap time filters for removing outliers and invalid data points.
 Clean data is essential for accurate degradation modeling.
 """
 
-import statistics
+from enum import IntFlag
 
-from .build import FeatureFrame
+import numpy as np
+
+from .build import Compound, FeatureFrame, FeatureTable
+
+
+class LapFlag(IntFlag):
+    """Per-lap condition bits, packed into a uint8 column for batch validation."""
+
+    NONE = 0
+    PIT_IN = 1
+    PIT_OUT = 2
+    SC = 4
+    VSC = 8
+
+
+# Any of these bits disqualifies a lap from analysis
+DISQUALIFYING_FLAGS = LapFlag.PIT_IN | LapFlag.PIT_OUT | LapFlag.SC | LapFlag.VSC
+
+
+def pack_lap_flags(
+    is_pit_in: np.ndarray,
+    is_pit_out: np.ndarray,
+    is_sc: np.ndarray,
+    is_vsc: np.ndarray,
+) -> np.ndarray:
+    """Pack the four boolean condition columns into a uint8 LapFlag column."""
+    flags = np.asarray(is_pit_in, dtype=np.uint8) * np.uint8(LapFlag.PIT_IN)
+    flags |= np.asarray(is_pit_out, dtype=np.uint8) * np.uint8(LapFlag.PIT_OUT)
+    flags |= np.asarray(is_sc, dtype=np.uint8) * np.uint8(LapFlag.SC)
+    flags |= np.asarray(is_vsc, dtype=np.uint8) * np.uint8(LapFlag.VSC)
+    return flags
+
+
+def is_valid_lap_batch(
+    lap_times: np.ndarray,
+    flags: np.ndarray,
+    min_lap_time: float = 60.0,
+    max_lap_time: float = 180.0,
+) -> np.ndarray:
+    """
+    Vectorized is_valid_lap over a whole race.
+
+    Args:
+        lap_times: Lap times in seconds, with missing laps as NaN
+        flags: uint8 LapFlag bits per lap (see pack_lap_flags)
+
+    Returns:
+        Boolean mask of laps valid for analysis
+    """
+    lap_times = np.asarray(lap_times, dtype=np.float64)
+    flags = np.asarray(flags, dtype=np.uint8)
+    # NaN fails every comparison, so missing laps are rejected
+    valid: np.ndarray = (
+        (lap_times > 0)
+        & (lap_times >= min_lap_time)
+        & (lap_times <= max_lap_time)
+        & ((flags & np.uint8(DISQUALIFYING_FLAGS)) == 0)
+    )
+    return valid
 
 
 def is_valid_lap(
@@ -25,20 +83,81 @@ def is_valid_lap(
     - Pit in/out laps (slow due to pit lane travel)
     - Safety car laps (artificially slow)
     - Extremely fast or slow outliers
+
+    Scalar counterpart of is_valid_lap_batch; prefer the batch form when
+    validating a whole race.
     """
     if lap_time is None or lap_time <= 0:
         return False
 
-    if is_pit_in or is_pit_out:
+    if is_pit_in or is_pit_out or is_sc or is_vsc:
         return False
 
-    if is_sc or is_vsc:
-        return False
+    return min_lap_time <= lap_time <= max_lap_time
 
-    if lap_time < min_lap_time or lap_time > max_lap_time:
-        return False
 
-    return True
+def _as_lap_array(lap_times: list[float]) -> np.ndarray:
+    """Convert lap times to float64, with None as NaN so it never passes > 0."""
+    return np.array([np.nan if t is None else t for t in lap_times], dtype=np.float64)
+
+
+def _indexed(arr: np.ndarray, mask: np.ndarray) -> list[tuple[int, float]]:
+    """Build (index, lap_time) tuples for the masked entries."""
+    indices = np.flatnonzero(mask)
+    return list(zip(indices.tolist(), arr[indices].tolist(), strict=True))
+
+
+def _zscore_mask(arr: np.ndarray, valid: np.ndarray, threshold: float) -> np.ndarray:
+    """Mask of valid laps within threshold sample deviations of the valid mean."""
+    times = arr[valid]
+    mean = times.mean()
+    std = times.std(ddof=1)
+    inliers: np.ndarray = valid & (np.abs(arr - mean) <= threshold * std)
+    return inliers
+
+
+def _iqr_mask(arr: np.ndarray, valid: np.ndarray, multiplier: float) -> np.ndarray:
+    """Mask of valid laps inside the multiplier-scaled interquartile fences."""
+    times = arr[valid]
+    n = times.size
+    # Only two order statistics are needed, so select them in O(n)
+    k1, k3 = n // 4, 3 * n // 4
+    part = np.partition(times, (k1, k3))
+    q1 = part[k1]
+    q3 = part[k3]
+    iqr = q3 - q1
+    inliers: np.ndarray = valid & (arr >= q1 - multiplier * iqr) & (arr <= q3 + multiplier * iqr)
+    return inliers
+
+
+def _zscore_inliers(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """Z-score keep mask over arr, including the small-sample fallbacks."""
+    valid = arr > 0
+    if arr.size < 3 or np.count_nonzero(valid) < 3:
+        return valid
+
+    times = arr[valid]
+    if (times == times[0]).all():
+        # Zero spread: nothing can be an outlier
+        return np.ones(arr.size, dtype=np.bool_)
+
+    return _zscore_mask(arr, valid, threshold)
+
+
+def _iqr_inliers(arr: np.ndarray, multiplier: float) -> np.ndarray:
+    """IQR keep mask over arr, including the small-sample fallback."""
+    valid = arr > 0
+    if np.count_nonzero(valid) < 4:
+        return valid
+
+    return _iqr_mask(arr, valid, multiplier)
+
+
+# Outlier methods accepted by apply_filters / filter_mask
+_OUTLIER_INLIERS = {
+    "zscore": _zscore_inliers,
+    "iqr": _iqr_inliers,
+}
 
 
 def filter_outliers_zscore(
@@ -50,28 +169,11 @@ def filter_outliers_zscore(
 
     Returns list of (index, lap_time) tuples for valid laps.
     """
-    if len(lap_times) < 3:
-        return [(i, t) for i, t in enumerate(lap_times) if t > 0]
-
-    valid_times = [t for t in lap_times if t and t > 0]
-    if len(valid_times) < 3:
-        return [(i, t) for i, t in enumerate(lap_times) if t > 0]
-
-    mean = statistics.mean(valid_times)
-    std = statistics.stdev(valid_times)
-
-    if std == 0:
-        return [(i, t) for i, t in enumerate(lap_times)]
-
-    result = []
-    for i, lap_time in enumerate(lap_times):
-        if lap_time is None or lap_time <= 0:
-            continue
-        z_score = abs(lap_time - mean) / std
-        if z_score <= threshold:
-            result.append((i, lap_time))
-
-    return result
+    arr = _as_lap_array(lap_times)
+    mask = _zscore_inliers(arr, threshold)
+    if mask.all():
+        return list(enumerate(lap_times))
+    return _indexed(arr, mask)
 
 
 def filter_outliers_iqr(
@@ -83,27 +185,80 @@ def filter_outliers_iqr(
 
     More robust to non-normal distributions than z-score.
     """
-    valid_times = sorted([t for t in lap_times if t and t > 0])
-
-    if len(valid_times) < 4:
-        return [(i, t) for i, t in enumerate(lap_times) if t and t > 0]
-
-    n = len(valid_times)
-    q1 = valid_times[n // 4]
-    q3 = valid_times[3 * n // 4]
-    iqr = q3 - q1
-
-    lower_bound = q1 - multiplier * iqr
-    upper_bound = q3 + multiplier * iqr
-
-    result = []
-    for i, lap_time in enumerate(lap_times):
-        if lap_time is None or lap_time <= 0:
-            continue
-        if lower_bound <= lap_time <= upper_bound:
-            result.append((i, lap_time))
+    arr = _as_lap_array(lap_times)
+    return _indexed(arr, _iqr_inliers(arr, multiplier))
+
+
+def _combined_mask(
+    is_valid: np.ndarray,
+    is_pit_in: np.ndarray,
+    is_pit_out: np.ndarray,
+    is_sc: np.ndarray,
+    is_vsc: np.ndarray,
+    traffic_affected: np.ndarray,
+    lap_time: np.ndarray,
+    remove_pit_laps: bool,
+    remove_sc_laps: bool,
+    remove_traffic: bool,
+    outlier_method: str,
+    outlier_threshold: float,
+    compound_codes: np.ndarray | None = None,
+    compound: Compound | None = None,
+) -> np.ndarray:
+    """Fuse the flag, compound and outlier filters into one keep mask."""
+    keep: np.ndarray = (
+        is_valid
+        & ~(remove_pit_laps & (is_pit_in | is_pit_out))
+        & ~(remove_sc_laps & (is_sc | is_vsc))
+        & ~(remove_traffic & traffic_affected)
+    )
+    if compound is not None and compound_codes is not None:
+        keep &= compound_codes == int(compound)
+
+    # Outlier detection runs on rows with a recorded, non-zero lap time
+    # (None is stored as NaN); everything else drops out at this stage
+    if outlier_method and keep.any():
+        keep &= np.nan_to_num(lap_time) != 0
+        inliers = _OUTLIER_INLIERS.get(outlier_method)
+        if inliers is not None:
+            kept = np.flatnonzero(keep)
+            keep[kept[~inliers(lap_time[kept], outlier_threshold)]] = False
+
+    return keep
+
+
+def filter_mask(
+    table: FeatureTable,
+    remove_pit_laps: bool = True,
+    remove_sc_laps: bool = True,
+    remove_traffic: bool = True,
+    outlier_method: str = "zscore",
+    outlier_threshold: float = 3.0,
+    compound: Compound | None = None,
+) -> np.ndarray:
+    """
+    Compute the boolean mask of table rows that pass all filter criteria.
 
-    return result
+    Flag and compound filters are combined as whole-column operations;
+    outlier detection then runs on the lap times of the surviving rows, so
+    with a compound set the outliers are judged within that compound.
+    """
+    return _combined_mask(
+        table.is_valid,
+        table.is_pit_in_lap,
+        table.is_pit_out_lap,
+        table.is_sc_lap,
+        table.is_vsc_lap,
+        table.traffic_affected,
+        table.lap_time,
+        remove_pit_laps,
+        remove_sc_laps,
+        remove_traffic,
+        outlier_method,
+        outlier_threshold,
+        table.compound,
+        compound,
+    )
 
 
 def apply_filters(
@@ -113,56 +268,64 @@ def apply_filters(
     remove_traffic: bool = True,
     outlier_method: str = "zscore",
     outlier_threshold: float = 3.0,
+    compound: Compound | None = None,
 ) -> list[FeatureFrame]:
     """
     Apply filters to a list of feature frames.
 
-    Returns only frames that pass all filter criteria.
+    Returns only frames that pass all filter criteria, optionally restricted
+    to one compound. For data already in a FeatureTable, index it with
+    filter_mask instead.
     """
-    filtered = []
-
-    for frame in frames:
-        # Skip invalid laps
-        if not frame.is_valid:
-            continue
-
-        # Pit lap filter
-        if remove_pit_laps and (frame.is_pit_in_lap or frame.is_pit_out_lap):
-            continue
-
-        # Safety car filter
-        if remove_sc_laps and (frame.is_sc_lap or frame.is_vsc_lap):
-            continue
-
-        # Traffic filter
-        if remove_traffic and frame.traffic_affected:
-            continue
-
-        filtered.append(frame)
-
-    # Apply outlier detection on lap times
-    if filtered and outlier_method:
-        lap_times = [f.lap_time for f in filtered if f.lap_time]
-
-        if outlier_method == "zscore":
-            valid_indices = {idx for idx, _ in filter_outliers_zscore(lap_times, outlier_threshold)}
-        elif outlier_method == "iqr":
-            valid_indices = {idx for idx, _ in filter_outliers_iqr(lap_times, outlier_threshold)}
-        else:
-            valid_indices = set(range(len(lap_times)))
-
-        # Map back to frames
-        time_idx = 0
-        final_filtered = []
-        for frame in filtered:
-            if frame.lap_time:
-                if time_idx in valid_indices:
-                    final_filtered.append(frame)
-                time_idx += 1
-
-        return final_filtered
-
-    return filtered
+    if not frames:
+        return []
+
+    # Only the columns the filters read are extracted from the frames
+    n = len(frames)
+    flags = np.array(
+        [
+            (
+                f.is_valid,
+                f.is_pit_in_lap,
+                f.is_pit_out_lap,
+                f.is_sc_lap,
+                f.is_vsc_lap,
+                f.traffic_affected,
+            )
+            for f in frames
+        ],
+        dtype=np.bool_,
+    ).reshape(n, 6)
+    lap_time = np.fromiter(
+        (np.nan if f.lap_time is None else f.lap_time for f in frames),
+        dtype=np.float64,
+        count=n,
+    )
+    compound_codes = None
+    if compound is not None:
+        compound_codes = np.fromiter(
+            (f.compound_code for f in frames),
+            dtype=np.int8,
+            count=n,
+        )
+    is_valid, is_pit_in, is_pit_out, is_sc, is_vsc, traffic_affected = flags.T
+    keep = _combined_mask(
+        is_valid,
+        is_pit_in,
+        is_pit_out,
+        is_sc,
+        is_vsc,
+        traffic_affected,
+        lap_time,
+        remove_pit_laps,
+        remove_sc_laps,
+        remove_traffic,
+        outlier_method,
+        outlier_threshold,
+        compound_codes,
+        compound,
+    )
+    return [frames[i] for i in np.flatnonzero(keep)]
 
 
 def mark_pit_laps(
@@ -4,10 +4,14 @@ Traffic detection heuristics for identifying laps affected by dirty air.
 Dirty air behind another car causes loss of downforce and slower lap times.
 """
 
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class TrafficState:
     """Tracks traffic state for a driver."""
 
@@ -19,7 +23,7 @@ class TrafficState:
 
 def detect_traffic(
     gap_ahead: float | None,
-    previous_gaps: list[float] | None = None,
+    previous_gaps: Sequence[float] | np.ndarray | None = None,
     close_gap_threshold: float = 1.5,
     sustained_laps: int = 2,
 ) -> tuple[bool, float]:
@@ -28,7 +32,7 @@ def detect_traffic(
 
     Args:
         gap_ahead: Current gap to car in front (seconds)
-        previous_gaps: List of gaps from previous laps
+        previous_gaps: Gaps from previous laps (list or NumPy array)
         close_gap_threshold: Gap below which traffic is considered
         sustained_laps: Number of consecutive laps for sustained traffic
 
@@ -52,10 +56,19 @@ def detect_traffic(
         # Linear interpolation
         severity = 1.0 - (gap_ahead - 0.5) / (close_gap_threshold - 0.5)
 
-    # Check for sustained traffic
-    if previous_gaps:
-        recent_close = sum(1 for g in previous_gaps[-sustained_laps:] if g < close_gap_threshold)
-        is_sustained = recent_close >= sustained_laps
+    # Check for sustained traffic: every one of the last sustained_laps gaps
+    # was close (short-circuits on the first clear lap)
+    if previous_gaps is not None and len(previous_gaps) > 0:
+        if sustained_laps <= 0:
+            is_sustained = True
+        elif len(previous_gaps) < sustained_laps:
+            is_sustained = False
+        else:
+            recent = previous_gaps[-sustained_laps:]
+            if isinstance(recent, np.ndarray):
+                is_sustained = bool((recent < close_gap_threshold).all())
+            else:
+                is_sustained = all(g < close_gap_threshold for g in recent)
 
         if is_sustained:
             severity = min(1.0, severity * 1.2)  # Boost severity for sustained traffic
@@ -95,6 +108,52 @@ def estimate_traffic_delta(
     return base_delta * (2.0 - gap_ahead) / 0.5
 
 
+def detect_traffic_batch(
+    gaps: np.ndarray,
+    close_gap_threshold: float = 1.5,
+    sustained_laps: int = 2,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized detect_traffic over one driver's consecutive lap gaps.
+
+    Each lap's previous gaps are the entries before it in the array.
+    Missing gaps are NaN and count as not close.
+
+    Returns:
+        Tuple of (is_traffic_affected, traffic_severity) arrays
+    """
+    gaps = np.asarray(gaps, dtype=np.float64)
+    known = ~np.isnan(gaps)
+    close = gaps < close_gap_threshold
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        linear = 1.0 - (gaps - 0.5) / (close_gap_threshold - 0.5)
+    severity = np.where(gaps >= close_gap_threshold, 0.0, np.where(gaps <= 0.5, 1.0, linear))
+
+    # Close laps among the preceding sustained_laps laps, as a rolling sum
+    closes = np.concatenate(([0], np.cumsum(close)))
+    idx = np.arange(gaps.size)
+    recent_close = closes[idx] - closes[np.maximum(idx - sustained_laps, 0)]
+    sustained = recent_close >= sustained_laps
+
+    severity = np.where(sustained, np.minimum(1.0, severity * 1.2), severity)
+    return known & (close | sustained), np.where(known, severity, 0.0)
+
+
+def estimate_traffic_delta_batch(
+    gaps: np.ndarray,
+    base_delta: float = 0.3,
+    max_delta: float = 1.0,
+) -> np.ndarray:
+    """Vectorized estimate_traffic_delta; NaN gaps give 0.0."""
+    gaps = np.asarray(gaps, dtype=np.float64)
+    return np.select(
+        [gaps <= 0.5, gaps <= 1.5, gaps <= 2.0],
+        [max_delta, base_delta * 0.5, base_delta * (2.0 - gaps) / 0.5],
+        default=0.0,
+    )
+
+
 def detect_traffic_spike(
     current_lap_time: float,
     recent_lap_times: list[float],
@@ -129,7 +188,7 @@ class TrafficTracker:
     def __init__(self, close_gap_threshold: float = 1.5):
         self.close_gap_threshold = close_gap_threshold
         self.driver_states: dict[int, TrafficState] = {}
-        self.gap_history: dict[int, list[float]] = {}
+        self.gap_history: dict[int, deque[float]] = {}
 
     def update(
         self,
@@ -144,22 +203,23 @@ class TrafficTracker:
         # Initialize state if needed
         if driver_number not in self.driver_states:
             self.driver_states[driver_number] = TrafficState(driver_number)
-            self.gap_history[driver_number] = []
+            # Keep last 10 gaps
+            self.gap_history[driver_number] = deque(maxlen=10)
 
         state = self.driver_states[driver_number]
         history = self.gap_history[driver_number]
 
+        # Gaps from earlier laps, taken before this lap's gap is recorded
+        previous_gaps = list(history) if history else None
+
         # Record gap
         if gap_ahead is not None:
             history.append(gap_ahead)
-            # Keep last 10 gaps
-            if len(history) > 10:
-                history.pop(0)
 
         # Detect traffic
         is_traffic, severity = detect_traffic(
             gap_ahead,
-            previous_gaps=history[:-1] if history else None,
+            previous_gaps=previous_gaps,
             close_gap_threshold=self.close_gap_threshold,
         )
 
@@ -5,19 +5,25 @@ All data adapters must implement this interface to ensure
 consistent data formats across different sources.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable
 from datetime import UTC, datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 # ============================================================================
 # Data Transfer Objects (DTOs) - canonical format for all data providers
 # ============================================================================
+# DTOs are frozen: once validated they are shared between caches, batches
+# and the state store without defensive copies.
 
 
 class SessionInfo(BaseModel):
     """Session information from a data provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     session_key: int
     meeting_key: int
     session_name: str  # "Race", "Qualifying", "Practice 1", etc.
@@ -32,6 +38,8 @@ class SessionInfo(BaseModel):
 class DriverInfo(BaseModel):
     """Driver information from a data provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     driver_number: int
     name_acronym: str  # "VER", "HAM", etc.
     full_name: str
@@ -44,6 +52,8 @@ class DriverInfo(BaseModel):
 class LapData(BaseModel):
     """Single lap data from a data provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     driver_number: int
     lap_number: int
     lap_duration: float | None = None
@@ -60,6 +70,8 @@ class LapData(BaseModel):
 class PositionData(BaseModel):
     """Position data from a data provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     driver_number: int
     position: int
     timestamp: datetime
@@ -68,6 +80,8 @@ class PositionData(BaseModel):
 class IntervalData(BaseModel):
     """Interval/gap data from a data provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     driver_number: int
     gap_to_leader: float | None = None
     interval: float | None = None  # Gap to car ahead
@@ -77,6 +91,8 @@ class IntervalData(BaseModel):
 class StintData(BaseModel):
     """Stint (tyre) data from a data provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     driver_number: int
     stint_number: int
     compound: str  # "SOFT", "MEDIUM", "HARD", "INTERMEDIATE", "WET"
@@ -88,6 +104,8 @@ class StintData(BaseModel):
 class PitData(BaseModel):
     """Pit stop data from a data provider."""
 
+    model_config = ConfigDict(frozen=True)
+
     driver_number: int
     lap_number: int
     pit_duration: float  # Total in-pit time in seconds
@@ -97,6 +115,8 @@ class PitData(BaseModel):
 class RaceControlMessage(BaseModel):
     """Race control message (flags, SC, etc.)."""
 
+    model_config = ConfigDict(frozen=True)
+
     category: str  # "Flag", "SafetyCar", etc.
     flag: str | None = None  # "GREEN", "YELLOW", "RED", "SC", "VSC"
     message: str
@@ -113,6 +133,8 @@ class UpdateBatch(BaseModel):
     of whether they come from OpenF1, FastF1, or any other source.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     session_key: int
     timestamp: datetime
     current_lap: int | None = None
@@ -127,6 +149,22 @@ class UpdateBatch(BaseModel):
     race_control: list[RaceControlMessage] | None = None
 
 
+# Batch validators: one call validates a whole response in pydantic-core
+# instead of constructing models row by row
+DRIVERS_ADAPTER = TypeAdapter(list[DriverInfo])
+LAPS_ADAPTER = TypeAdapter(list[LapData])
+POSITIONS_ADAPTER = TypeAdapter(list[PositionData])
+INTERVALS_ADAPTER = TypeAdapter(list[IntervalData])
+STINTS_ADAPTER = TypeAdapter(list[StintData])
+PITS_ADAPTER = TypeAdapter(list[PitData])
+RACE_CONTROL_ADAPTER = TypeAdapter(list[RaceControlMessage])
+
+
+async def _none() -> None:
+    """Placeholder for an optional fetch that is skipped."""
+    return None
+
+
 # ============================================================================
 # Abstract Base Class
 # ============================================================================
@@ -210,27 +248,36 @@ class DataProvider(ABC):
         Fetch a complete update batch with all relevant data.
 
         This is a convenience method that calls the individual fetch methods
-        and combines the results into a single UpdateBatch.
+        concurrently and combines the results into a single UpdateBatch.
         """
-        from datetime import datetime
+        timestamp = datetime.now(UTC)
 
-        batch = UpdateBatch(
-            session_key=session_key,
-            timestamp=datetime.now(UTC),
+        drivers_fetch: Awaitable[list[DriverInfo] | None] = (
+            self.get_drivers(session_key) if include_drivers else _none()
         )
 
-        if include_drivers:
-            batch.drivers = await self.get_drivers(session_key)
-
-        batch.laps = await self.get_laps(session_key, since_lap=since_lap)
-        batch.positions = await self.get_positions(session_key)
-        batch.intervals = await self.get_intervals(session_key)
-        batch.stints = await self.get_stints(session_key)
-        batch.pits = await self.get_pits(session_key)
-        batch.race_control = await self.get_race_control(session_key)
-
-        # Determine current lap from lap data
-        if batch.laps:
-            batch.current_lap = max(lap.lap_number for lap in batch.laps)
+        # The fetches are independent, so issue them concurrently. asyncio.gather
+        # is only typed up to six awaitables, so the last two share a nested gather
+        laps, positions, intervals, stints, pits, (race_control, drivers) = await asyncio.gather(
+            self.get_laps(session_key, since_lap=since_lap),
+            self.get_positions(session_key),
+            self.get_intervals(session_key),
+            self.get_stints(session_key),
+            self.get_pits(session_key),
+            asyncio.gather(self.get_race_control(session_key), drivers_fetch),
+        )
 
-        return batch
+        # UpdateBatch is frozen, so it is built once all payloads are in
+        return UpdateBatch(
+            session_key=session_key,
+            timestamp=timestamp,
+            # Determine current lap from lap data
+            current_lap=max(lap.lap_number for lap in laps) if laps else None,
+            drivers=drivers,
+            laps=laps,
+            positions=positions,
+            intervals=intervals,
+            stints=stints,
+            pits=pits,
+            race_control=race_control,
+        )
@@ -14,9 +14,11 @@ API Documentation: https://docs.fastf1.dev/
 import asyncio
 import atexit
 import os
+import pickle
+import tempfile
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
@@ -24,12 +26,21 @@ import pandas as pd
 from rsw.logging_config import get_logger
 from rsw.state.schemas import DriverState
 
+if TYPE_CHECKING:
+    from rsw.ingest.base import LapData, StintData
+
 logger = get_logger(__name__)
 
 # FastF1 imports - will be lazy loaded
 _fastf1 = None
 _fastf1_cache_enabled = False
 
+# FastF1's HTTP cache; fully loaded sessions are pickled under sessions/
+_FASTF1_CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".fastf1-cache")
+
+# Set RSW_FASTF1_PICKLE_CACHE=0 to disable the on-disk session cache
+_PICKLE_SESSIONS = os.getenv("RSW_FASTF1_PICKLE_CACHE", "1") != "0"
+
 
 def _ensure_fastf1() -> Any:
     """Lazy load and configure FastF1."""
@@ -40,17 +51,16 @@ def _ensure_fastf1() -> Any:
         _fastf1 = fastf1
 
         # Enable cache
-        cache_dir = os.path.join(os.path.dirname(__file__), "..", "..", "..", ".fastf1-cache")
-        os.makedirs(cache_dir, exist_ok=True)
-        fastf1.Cache.enable_cache(cache_dir)
+        os.makedirs(_FASTF1_CACHE_DIR, exist_ok=True)
+        fastf1.Cache.enable_cache(_FASTF1_CACHE_DIR)
         _fastf1_cache_enabled = True
-        logger.info("fastf1_cache_enabled", cache_dir=cache_dir)
+        logger.info("fastf1_cache_enabled", cache_dir=_FASTF1_CACHE_DIR)
 
     return _fastf1
 
 
 # Thread pool for running blocking FastF1 calls
-_FASTF1_WORKERS = int(os.getenv("RSW_FASTF1_WORKERS", "4"))
+_FASTF1_WORKERS = int(os.getenv("RSW_FASTF1_WORKERS", str(min(8, os.cpu_count() or 1))))
 _executor = ThreadPoolExecutor(max_workers=_FASTF1_WORKERS)
 atexit.register(lambda: _executor.shutdown(wait=False))
 
@@ -91,9 +101,9 @@ async def get_track_geometry(session: Any) -> dict[str, Any]:
 
     Returns:
         dict with:
-            - center_line: list of {x, y, rel_dist} points
-            - inner_edge: list of {x, y} points
-            - outer_edge: list of {x, y} points
+            - center_line: {x, y, rel_dist} parallel coordinate lists
+            - inner_edge: {x, y} parallel coordinate lists
+            - outer_edge: {x, y} parallel coordinate lists
             - drs_zones: list of {start_idx, end_idx, start_rel, end_rel}
             - bounds: {x_min, x_max, y_min, y_max}
             - rotation: circuit rotation angle
@@ -140,35 +150,12 @@ async def get_track_geometry(session: Any) -> dict[str, Any]:
 
             # Compute track edges using normal vectors
             track_width = 15  # meters (approximate F1 track width)
-
-            # Calculate tangent vectors
-            dx = np.gradient(x)
-            dy = np.gradient(y)
-
-            # Normalize
-            norm = np.sqrt(dx**2 + dy**2)
-            norm[norm == 0] = 1.0
-            dx = dx / norm
-            dy = dy / norm
-
-            # Normal vectors (perpendicular to tangent)
-            nx = -dy
-            ny = dx
-
-            # Compute edges
-            x_inner = x - nx * (track_width / 2)
-            y_inner = y - ny * (track_width / 2)
-            x_outer = x + nx * (track_width / 2)
-            y_outer = y + ny * (track_width / 2)
+            x_inner, y_inner, x_outer, y_outer = _compute_edges(x, y, track_width / 2)
 
             # Get DRS zones from telemetry
             drs = telemetry["DRS"].to_numpy()
             drs_zones = _extract_drs_zones(drs, x, y, rel_dist)
 
-            # Compute bounds
-            all_x = np.concatenate([x, x_inner, x_outer])
-            all_y = np.concatenate([y, y_inner, y_outer])
-
             # Get circuit rotation angle if available
             try:
                 circuit_info = session.get_circuit_info()
@@ -177,28 +164,26 @@ async def get_track_geometry(session: Any) -> dict[str, Any]:
                 logger.debug("circuit_info_unavailable", error=str(e))
                 rotation = 0
 
-            # Downsample for transfer (every 5th point is usually enough)
+            # Downsample for transfer (every 5th point is usually enough).
+            # Lines are sent as parallel coordinate arrays rather than one
+            # dict per point, which keeps the payload free of repeated keys.
             step = 5
 
             return {
-                "center_line": [
-                    {"x": float(x[i]), "y": float(y[i]), "rel_dist": float(rel_dist[i])}
-                    for i in range(0, len(x), step)
-                ],
-                "inner_edge": [
-                    {"x": float(x_inner[i]), "y": float(y_inner[i])}
-                    for i in range(0, len(x_inner), step)
-                ],
-                "outer_edge": [
-                    {"x": float(x_outer[i]), "y": float(y_outer[i])}
-                    for i in range(0, len(x_outer), step)
-                ],
+                "center_line": {
+                    "x": _downsample(x, step),
+                    "y": _downsample(y, step),
+                    "rel_dist": _downsample(rel_dist, step),
+                },
+                "inner_edge": {"x": _downsample(x_inner, step), "y": _downsample(y_inner, step)},
+                "outer_edge": {"x": _downsample(x_outer, step), "y": _downsample(y_outer, step)},
                 "drs_zones": drs_zones,
+                # Bounds reduce each array in place rather than concatenating copies
                 "bounds": {
-                    "x_min": float(all_x.min()),
-                    "x_max": float(all_x.max()),
-                    "y_min": float(all_y.min()),
-                    "y_max": float(all_y.max()),
+                    "x_min": float(np.min((x.min(), x_inner.min(), x_outer.min()))),
+                    "x_max": float(np.max((x.max(), x_inner.max(), x_outer.max()))),
+                    "y_min": float(np.min((y.min(), y_inner.min(), y_outer.min()))),
+                    "y_max": float(np.max((y.max(), y_inner.max(), y_outer.max()))),
                 },
                 "rotation": rotation,
                 "total_points": len(x),
@@ -207,9 +192,9 @@ async def get_track_geometry(session: Any) -> dict[str, Any]:
             logger.warning("track_geometry_extraction_failed", error=str(e))
             # Return empty default geometry (perfect circle placeholder or empty)
             return {
-                "center_line": [],
-                "inner_edge": [],
-                "outer_edge": [],
+                "center_line": {"x": [], "y": [], "rel_dist": []},
+                "inner_edge": {"x": [], "y": []},
+                "outer_edge": {"x": [], "y": []},
                 "drs_zones": [],
                 "bounds": {"x_min": 0, "x_max": 0, "y_min": 0, "y_max": 0},
                 "rotation": 0,
@@ -220,107 +205,186 @@ async def get_track_geometry(session: Any) -> dict[str, Any]:
     return await loop.run_in_executor(_executor, _extract)
 
 
+def _compute_edges(
+    x: np.ndarray, y: np.ndarray, half_width: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Offset the center line by half_width along its normals.
+
+    Both tangent components come from a single np.gradient call and are
+    normalized and scaled in place, so only the four edge arrays are
+    allocated on top of the tangent buffer.
+
+    Returns:
+        (x_inner, y_inner, x_outer, y_outer)
+    """
+    tangent = np.gradient(np.stack((x, y)), axis=1)
+    dx, dy = tangent
+
+    norm = np.sqrt(dx * dx + dy * dy)
+    norm[norm == 0] = 1.0
+    tangent /= norm
+    tangent *= half_width
+
+    # The normal (-dy, dx) is perpendicular to the tangent
+    return x + dy, y - dx, x - dy, y + dx
+
+
+def _downsample(values: np.ndarray, step: int) -> list[float]:
+    """Every step-th sample as a list of Python floats."""
+    return values[::step].astype(float, copy=False).tolist()  # type: ignore[no-any-return]
+
+
+# DRS signal values that mean the flap is open
+_DRS_ACTIVE_VALUES = (10, 12, 14)
+
+
 def _extract_drs_zones(
     drs: np.ndarray, x: np.ndarray, y: np.ndarray, rel_dist: np.ndarray
 ) -> list[dict]:
-    """Extract DRS zones from telemetry DRS signal."""
-    zones = []
-    in_zone = False
-    zone_start_idx = 0
-
-    for i, val in enumerate(drs):
-        # DRS is active when value is 10, 12, or 14
-        is_drs_on = val in [10, 12, 14]
-
-        if is_drs_on and not in_zone:
-            # Zone started
-            in_zone = True
-            zone_start_idx = i
-        elif not is_drs_on and in_zone:
-            # Zone ended
-            in_zone = False
-            zones.append(
-                {
-                    "start_idx": int(zone_start_idx),
-                    "end_idx": int(i - 1),
-                    "start_x": float(x[zone_start_idx]),
-                    "start_y": float(y[zone_start_idx]),
-                    "end_x": float(x[i - 1]),
-                    "end_y": float(y[i - 1]),
-                    "start_rel": float(rel_dist[zone_start_idx]),
-                    "end_rel": float(rel_dist[i - 1]),
-                }
-            )
+    """
+    Extract DRS zones from telemetry DRS signal.
 
-    # Handle zone that extends to end of lap
-    if in_zone:
-        zones.append(
-            {
-                "start_idx": int(zone_start_idx),
-                "end_idx": int(len(drs) - 1),
-                "start_x": float(x[zone_start_idx]),
-                "start_y": float(y[zone_start_idx]),
-                "end_x": float(x[-1]),
-                "end_y": float(y[-1]),
-                "start_rel": float(rel_dist[zone_start_idx]),
-                "end_rel": float(rel_dist[-1]),
-            }
+    Zone boundaries are found as rising/falling edges of the active mask in
+    one vectorized pass; a zone still open at the end of the lap ends on
+    the last sample.
+    """
+    active = np.isin(drs, _DRS_ACTIVE_VALUES)
+    if not active.any():
+        return []
+
+    edges = np.diff(np.concatenate(([False], active, [False])).view(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+
+    return [
+        {
+            "start_idx": start_idx,
+            "end_idx": end_idx,
+            "start_x": start_x,
+            "start_y": start_y,
+            "end_x": end_x,
+            "end_y": end_y,
+            "start_rel": start_rel,
+            "end_rel": end_rel,
+        }
+        for start_idx, end_idx, start_x, start_y, end_x, end_y, start_rel, end_rel in zip(
+            starts.tolist(),
+            ends.tolist(),
+            x[starts].astype(float).tolist(),
+            y[starts].astype(float).tolist(),
+            x[ends].astype(float).tolist(),
+            y[ends].astype(float).tolist(),
+            rel_dist[starts].astype(float).tolist(),
+            rel_dist[ends].astype(float).tolist(),
+            strict=True,
         )
+    ]
 
-    return zones
 
+# Telemetry columns served by get_driver_positions, with the compact dtype
+# each is cached as (coordinates and 0-360 speeds need nowhere near float64)
+_POSITION_COLUMNS: dict[str, type[np.generic]] = {
+    "X": np.float32,
+    "Y": np.float32,
+    "Speed": np.float32,
+    "nGear": np.int8,
+    "Throttle": np.float32,
+    "Brake": np.float32,
+    "DRS": np.int8,
+    "RelativeDistance": np.float32,
+}
 
-async def get_driver_positions(session: Any, frame_index: int = 0) -> dict[str, dict]:
+# Per-lap telemetry already extracted to NumPy columns, keyed by
+# (id(session), driver, lap index label); cleared by clear_session_cache
+_driver_tel_cache: dict[tuple[int, str, Any], dict[str, np.ndarray]] = {}
+
+
+def _compact_column(col: pd.Series, dtype: type[np.generic]) -> np.ndarray:
+    """Downcast a telemetry column; integer columns with gaps stay float32."""
+    if np.issubdtype(dtype, np.integer) and col.isna().any():
+        dtype = np.float32
+    values: np.ndarray = col.to_numpy(dtype=dtype)
+    return values
+
+
+def _lap_telemetry_columns(session: Any, driver: str, lap: Any) -> dict[str, np.ndarray] | None:
     """
-    Get driver positions at a specific frame/time.
+    Get a lap's telemetry as NumPy columns, calling get_telemetry() only once per lap.
 
-    For live data, this returns current positions.
-    For replay, this returns positions at the given frame.
+    Returns None if the lap has no telemetry.
     """
+    key = (id(session), driver, lap.name)
+    columns = _driver_tel_cache.get(key)
+    if columns is not None:
+        return columns
 
-    def _extract() -> dict[str, dict]:
-        drivers: dict[str, dict] = {}
+    telemetry = lap.get_telemetry()
+    if telemetry is None or telemetry.empty:
+        return None
 
-        for driver in session.drivers:
-            try:
-                driver_laps = session.laps.pick_drivers(driver)
-                if driver_laps.empty:
-                    continue
+    columns = {
+        name: _compact_column(telemetry[name], dtype)
+        for name, dtype in _POSITION_COLUMNS.items()
+        if name in telemetry
+    }
+    _driver_tel_cache[key] = columns
+    return columns
 
-                # Get driver info
-                driver_info = session.get_driver(driver)
-                code = driver_info.get("Abbreviation", str(driver))
 
-                # Get latest lap telemetry
-                latest_lap = driver_laps.iloc[-1]
-                telemetry = latest_lap.get_telemetry()
+def _driver_position(session: Any, driver: str, frame_index: int) -> tuple[str, dict] | None:
+    """Extract one driver's (code, position) at frame_index, or None if unavailable."""
+    try:
+        driver_laps = session.laps.pick_drivers(driver)
+        if driver_laps.empty:
+            return None
 
-                if telemetry is None or telemetry.empty:
-                    continue
+        # Get driver info
+        driver_info = session.get_driver(driver)
+        code = driver_info.get("Abbreviation", str(driver))
 
-                # Get position at frame (or latest if frame exceeds)
-                idx = min(frame_index, len(telemetry) - 1)
-
-                drivers[code] = {
-                    "x": float(telemetry["X"].iloc[idx]),
-                    "y": float(telemetry["Y"].iloc[idx]),
-                    "speed": float(telemetry["Speed"].iloc[idx]),
-                    "gear": int(telemetry["nGear"].iloc[idx]),
-                    "throttle": float(telemetry["Throttle"].iloc[idx]),
-                    "brake": float(telemetry["Brake"].iloc[idx]) * 100,  # Normalize to 0-100
-                    "drs": int(telemetry["DRS"].iloc[idx]),
-                    "rel_dist": float(telemetry["RelativeDistance"].iloc[idx])
-                    if "RelativeDistance" in telemetry
-                    else 0,
-                }
-            except Exception as e:
-                logger.debug("driver_position_error", driver=driver, error=str(e))
-                continue
+        # Get latest lap telemetry
+        telemetry = _lap_telemetry_columns(session, driver, driver_laps.iloc[-1])
+        if telemetry is None:
+            return None
+
+        # Get position at frame (or latest if frame exceeds)
+        idx = min(frame_index, len(telemetry["X"]) - 1)
+        rel_dist = telemetry.get("RelativeDistance")
+
+        return code, {
+            "x": float(telemetry["X"][idx]),
+            "y": float(telemetry["Y"][idx]),
+            "speed": float(telemetry["Speed"][idx]),
+            "gear": int(telemetry["nGear"][idx]),
+            "throttle": float(telemetry["Throttle"][idx]),
+            "brake": float(telemetry["Brake"][idx]) * 100,  # Normalize to 0-100
+            "drs": int(telemetry["DRS"][idx]),
+            "rel_dist": float(rel_dist[idx]) if rel_dist is not None else 0,
+        }
+    except Exception as e:
+        logger.debug("driver_position_error", driver=driver, error=str(e))
+        return None
 
-        return drivers
 
+async def get_driver_positions(session: Any, frame_index: int = 0) -> dict[str, dict]:
+    """
+    Get driver positions at a specific frame/time.
+
+    For live data, this returns current positions.
+    For replay, this returns positions at the given frame.
+
+    Drivers are extracted concurrently on the FastF1 thread pool; the
+    result keeps session.drivers order.
+    """
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_executor, _extract)
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(_executor, _driver_position, session, driver, frame_index)
+            for driver in session.drivers
+        )
+    )
+    return dict(result for result in results if result is not None)
 
 
 async def get_weather_data(session: Any) -> list[dict]:
@@ -396,25 +460,384 @@ async def get_session_info(year: int, round_number: int | str) -> dict:
     return await loop.run_in_executor(_executor, _get_info)  # type: ignore[arg-type]
 
 
-# Cache for loaded sessions to avoid reloading
+# Cache for loaded sessions to avoid reloading. Loaded sessions hold
+# hundreds of MB of telemetry, so only the most recent few are kept.
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("RSW_FASTF1_SESSION_CACHE", "4"))
 _session_cache: dict[str, Any] = {}
 
 
+def _evict_session(cache_key: str) -> None:
+    """Drop a cached session together with its extracted telemetry."""
+    session = _session_cache.pop(cache_key, None)
+    if session is None:
+        return
+    session_id = id(session)
+    for key in [k for k in _driver_tel_cache if k[0] == session_id]:
+        del _driver_tel_cache[key]
+
+
+def _fastf1_version() -> str:
+    """Installed FastF1 version; pickles from other versions are not reused."""
+    return str(getattr(_ensure_fastf1(), "__version__", "unknown"))
+
+
+def _session_pickle_path(cache_key: str) -> str:
+    """Path of the on-disk pickle for a loaded session."""
+    filename = f"{cache_key}-fastf1-{_fastf1_version()}.pkl"
+    return os.path.join(_FASTF1_CACHE_DIR, "sessions", filename)
+
+
+def _raw_cache_dir(session: Any) -> str | None:
+    """FastF1's raw HTTP cache directory for a session, derived from its api_path."""
+    api_path = getattr(session, "api_path", None)
+    if not isinstance(api_path, str) or not api_path.strip("/"):
+        return None
+    # api_path is "/static/<year>/<event>/<session>/"; the cache drops "static"
+    parts = api_path.strip("/").split("/")
+    if parts[0] == "static":
+        parts = parts[1:]
+    return os.path.join(_FASTF1_CACHE_DIR, *parts)
+
+
+def _is_pickle_fresh(path: str) -> bool:
+    """
+    Whether a session pickle is at least as new as the session's raw FastF1 cache.
+
+    The raw directory is recorded in a ``.src`` sidecar when the pickle is
+    written. A pickle without one, or older than any raw cache file (e.g.
+    FastF1 fetched data the pickled session was missing), is stale.
+    """
+    try:
+        with open(f"{path}.src", encoding="utf-8") as f:
+            raw_dir = f.read().strip()
+        pickle_mtime = os.path.getmtime(path)
+    except OSError:
+        return False
+
+    try:
+        with os.scandir(raw_dir) as entries:
+            newest_raw = max((e.stat().st_mtime for e in entries if e.is_file()), default=0.0)
+    except FileNotFoundError:
+        # Raw cache cleared: the pickle is the only copy left
+        return True
+    return pickle_mtime >= newest_raw
+
+
+def _read_session_pickle(path: str) -> Any:
+    """Load a pickled session, or None if it is missing, stale or unreadable."""
+    if not os.path.exists(path):
+        return None
+    if not _is_pickle_fresh(path):
+        logger.info("session_pickle_stale", path=path)
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.warning("session_pickle_load_failed", path=path, error=str(e))
+        return None
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write via a uniquely named temp file so readers and other writers never collide."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(data)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    os.replace(tmp_path, path)
+
+
+def _write_session_pickle(path: str, session: Any) -> None:
+    """Pickle a loaded session together with the sidecar used to detect staleness."""
+    raw_dir = _raw_cache_dir(session)
+    if raw_dir is None:
+        # Without a raw cache location the pickle could never be validated
+        logger.debug("session_pickle_skipped", path=path)
+        return
+    try:
+        # Sidecar first, so a visible pickle always has one
+        _atomic_write(f"{path}.src", raw_dir.encode())
+        _atomic_write(path, pickle.dumps(session, protocol=5))
+    except Exception as e:
+        logger.warning("session_pickle_write_failed", path=path, error=str(e))
+
+
+async def _load_session_cached(year: int, round_number: int | str, session_type: str) -> Any:
+    """
+    Load a session from its on-disk pickle, falling back to FastF1.
+
+    Pickles are local files written by this process family, so they are
+    trusted as long as they match the installed FastF1 version and are not
+    older than the session's raw cache; a freshly loaded session is pickled
+    in the background.
+    """
+    if not _PICKLE_SESSIONS:
+        return await load_session(year, round_number, session_type)
+
+    loop = asyncio.get_event_loop()
+    path = await loop.run_in_executor(
+        _executor, _session_pickle_path, f"{year}_{round_number}_{session_type}"
+    )
+    session = await loop.run_in_executor(_executor, _read_session_pickle, path)
+    if session is not None:
+        logger.info("fastf1_session_unpickled", path=path)
+        return session
+
+    session = await load_session(year, round_number, session_type)
+    _executor.submit(_write_session_pickle, path, session)
+    return session
+
+
 async def get_or_load_session(year: int, round_number: int | str, session_type: str = "R") -> Any:
-    """Get cached session or load it."""
+    """
+    Get cached session or load it, evicting the oldest session when full.
+
+    Sessions also persist on disk between restarts (see _load_session_cached).
+    """
     cache_key = f"{year}_{round_number}_{session_type}"
 
     if cache_key not in _session_cache:
         logger.info("loading_fastf1_session", year=year, round=round_number, type=session_type)
-        _session_cache[cache_key] = await load_session(year, round_number, session_type)
+        session = await _load_session_cached(year, round_number, session_type)
+        while _session_cache and len(_session_cache) >= SESSION_CACHE_MAX_ENTRIES:
+            _evict_session(next(iter(_session_cache)))
+        _session_cache[cache_key] = session
         logger.info("fastf1_session_loaded")
 
     return _session_cache[cache_key]
 
 
 def clear_session_cache() -> None:
-    """Clear the session cache to free memory."""
+    """
+    Clear the session and telemetry caches to free memory.
+
+    Both dicts are cleared in place; rebinding them here would only create
+    locals and leave the sessions referenced at module level.
+    """
     _session_cache.clear()
+    _driver_tel_cache.clear()
+
+
+def _timedelta_to_seconds(val: Any) -> float | None:
+    """Safely convert Timedelta to float seconds, or None for NaT."""
+    if val is None:
+        return None
+    if hasattr(val, "total_seconds"):
+        seconds = float(val.total_seconds())
+        return None if seconds != seconds else seconds  # NaT gives NaN
+    return None
+
+
+def _seconds_column(df: pd.DataFrame, name: str) -> list[float | None]:
+    """A timedelta column as float seconds, with NaT and missing columns as None."""
+    if name not in df.columns:
+        return [None] * len(df)
+    col = df[name]
+    if not pd.api.types.is_timedelta64_dtype(col):
+        return [_timedelta_to_seconds(v) for v in col.tolist()]
+    seconds = col.dt.total_seconds()
+    return seconds.astype(object).where(seconds.notna(), None).tolist()  # type: ignore[no-any-return]
+
+
+def _optional_int_column(df: pd.DataFrame, name: str) -> list[int | None]:
+    """A column of non-negative whole numbers as ints; anything else becomes None."""
+    if name not in df.columns:
+        return [None] * len(df)
+    values = pd.to_numeric(df[name], errors="coerce")
+    whole = values.where((values >= 0) & (values % 1 == 0))
+    return [None if v != v else int(v) for v in whole.tolist()]
+
+
+def _text_column(df: pd.DataFrame, name: str, default: str | None) -> list[str | None]:
+    """A text column with missing or empty values replaced by default."""
+    if name not in df.columns:
+        return [default] * len(df)
+    col = df[name]
+    present = col.notna() & (col.astype(str) != "")
+    return col.astype(object).where(present, default).tolist()  # type: ignore[no-any-return]
+
+
+def _str_column(df: pd.DataFrame, name: str, default: str) -> list[str]:
+    """A text column coerced to str, with missing or empty values replaced by default."""
+    if name not in df.columns:
+        return [default] * len(df)
+    col = df[name].fillna("").astype(str)
+    values: list[str] = col.where(col != "", default).tolist()
+    return values
+
+
+# FastF1 compound labels (including pre-2019 names and C-numbers) mapped to
+# the compounds used throughout the app
+_COMPOUND_ALIASES = {
+    "SOFT": "SOFT",
+    "MEDIUM": "MEDIUM",
+    "HARD": "HARD",
+    "INTERMEDIATE": "INTERMEDIATE",
+    "WET": "WET",
+    "SUPERSOFT": "SOFT",
+    "ULTRASOFT": "SOFT",
+    "HYPERSOFT": "SOFT",
+    "C1": "HARD",
+    "C2": "HARD",
+    "C3": "MEDIUM",
+    "C4": "MEDIUM",
+    "C5": "SOFT",
+}
+
+
+def _stints_from_frame(laps: pd.DataFrame) -> list["StintData"]:
+    """
+    Derive per-driver stints from a FastF1 laps frame.
+
+    Stints come from the Stint column when present, otherwise from changes
+    of compound within each driver's laps. Each stint's compound is its most
+    common known compound, computed with one groupby over all laps.
+    """
+    from rsw.ingest.base import StintData
+
+    if not {"DriverNumber", "Compound", "LapNumber"}.issubset(laps.columns):
+        return []
+
+    df = pd.DataFrame(
+        {
+            "driver": pd.to_numeric(laps["DriverNumber"], errors="coerce"),
+            "lap": pd.to_numeric(laps["LapNumber"], errors="coerce"),
+            "compound": laps["Compound"].astype("string").str.strip().str.upper().map(
+                _COMPOUND_ALIASES, na_action="ignore"
+            ),
+            "tyre_life": (
+                pd.to_numeric(laps["TyreLife"], errors="coerce")
+                if "TyreLife" in laps.columns
+                else np.nan
+            ),
+        }
+    )
+    if "Stint" in laps.columns:
+        df["stint"] = pd.to_numeric(laps["Stint"], errors="coerce")
+    else:
+        # A new stint starts whenever a driver's compound changes; laps with
+        # no recorded compound carry the previous one rather than split a stint
+        filled = df["compound"].groupby(df["driver"]).ffill().fillna("UNKNOWN")
+        changed = filled.ne(filled.groupby(df["driver"]).shift())
+        df["stint"] = changed.astype(np.int64).groupby(df["driver"]).cumsum()
+    df = df.dropna(subset=["driver", "lap", "stint"])
+    if df.empty:
+        return []
+
+    keys = ["driver", "stint"]
+    grouped = df.groupby(keys, sort=True)
+    spans = grouped["lap"].agg(["min", "max"])
+    # TyreLife on lap 1 of stint = 1 (new tyre) or higher (used tyre)
+    first_life = df.drop_duplicates(subset=keys).set_index(keys)["tyre_life"]
+    modes = (
+        df.dropna(subset=["compound"])
+        .groupby(keys)["compound"]
+        .agg(lambda c: c.value_counts().index[0])
+    )
+    summary = spans.join(first_life).join(modes)
+
+    stints = []
+    for (drv_num, stint_num), lap_start, lap_end, tyre_life, compound in zip(
+        summary.index.tolist(),
+        summary["min"].tolist(),
+        summary["max"].tolist(),
+        summary["tyre_life"].tolist(),
+        summary["compound"].tolist(),
+        strict=True,
+    ):
+        stints.append(
+            StintData(
+                driver_number=int(drv_num),
+                stint_number=int(stint_num),
+                compound=compound if isinstance(compound, str) else "UNKNOWN",
+                lap_start=int(lap_start),
+                lap_end=int(lap_end),
+                tyre_age_at_start=max(0, int(tyre_life) - 1) if tyre_life == tyre_life else 0,
+            )
+        )
+    return stints
+
+
+def _laps_from_frame(laps: pd.DataFrame) -> list["LapData"]:
+    """
+    Convert a FastF1 laps frame into LapData models.
+
+    Every field is converted column-wise with pandas before the models are
+    built, so the per-row work is a single constructor call. Rows without a
+    driver or lap number are skipped.
+    """
+    from rsw.ingest.base import LapData
+
+    if "DriverNumber" not in laps.columns or laps.empty:
+        return []
+
+    n = len(laps)
+    driver_numbers = pd.to_numeric(laps["DriverNumber"], errors="coerce")
+    if "LapNumber" in laps.columns:
+        lap_numbers = pd.to_numeric(laps["LapNumber"], errors="coerce")
+    else:
+        lap_numbers = pd.Series(0, index=laps.index)
+    present = (driver_numbers.notna() & lap_numbers.notna()).to_numpy()
+
+    if "Compound" in laps.columns:
+        compounds = laps["Compound"].where(laps["Compound"].notna(), "").astype(str)
+        compounds = compounds.where(compounds.str.strip() != "", "UNKNOWN").tolist()
+    else:
+        compounds = ["UNKNOWN"] * n
+
+    if "TyreLife" in laps.columns:
+        tyre_ages = pd.to_numeric(laps["TyreLife"], errors="coerce").fillna(0)
+        tyre_ages = tyre_ages.to_numpy(dtype=np.int64).tolist()
+    else:
+        tyre_ages = [0] * n
+
+    pit_out = laps["PitOutTime"].notna().tolist() if "PitOutTime" in laps.columns else [False] * n
+
+    columns = zip(
+        present.tolist(),
+        driver_numbers.fillna(0).to_numpy(dtype=np.int64).tolist(),
+        lap_numbers.fillna(0).to_numpy(dtype=np.int64).tolist(),
+        _seconds_column(laps, "LapTime"),
+        _seconds_column(laps, "Sector1Time"),
+        _seconds_column(laps, "Sector2Time"),
+        _seconds_column(laps, "Sector3Time"),
+        pit_out,
+        compounds,
+        tyre_ages,
+        strict=True,
+    )
+    return [
+        LapData(
+            driver_number=driver_number,
+            lap_number=lap_number,
+            lap_duration=lap_duration,
+            sector_1=sector_1,
+            sector_2=sector_2,
+            sector_3=sector_3,
+            is_pit_out_lap=is_pit_out,
+            compound=compound,
+            tyre_age=tyre_age,
+        )
+        for (
+            ok,
+            driver_number,
+            lap_number,
+            lap_duration,
+            sector_1,
+            sector_2,
+            sector_3,
+            is_pit_out,
+            compound,
+            tyre_age,
+        ) in columns
+        if ok
+    ]
 
 
 def extract_race_data(session: Any) -> Any:
@@ -434,7 +857,7 @@ def extract_race_data(session: Any) -> Any:
     """
     from datetime import datetime
 
-    from rsw.ingest.base import LapData, PitData, RaceControlMessage, StintData
+    from rsw.ingest.base import PitData, RaceControlMessage, StintData
 
     # 1. Extract Drivers
     drivers = []
@@ -465,61 +888,12 @@ def extract_race_data(session: Any) -> Any:
         logger.warning("driver_extraction_failed", error=str(e))
 
     # 2. Laps - Convert to LapData Pydantic models
-    def _timedelta_to_seconds(val: Any) -> float | None:
-        """Safely convert Timedelta to float seconds, or None for NaT."""
-        if val is None:
-            return None
-        if hasattr(val, "total_seconds"):
-            return float(val.total_seconds())
-        # Check for NaT (pandas Not-a-Time)
-        try:
-            if pd.isna(val):
-                return None
-        except (TypeError, ValueError):
-            pass
-        return None
-
     all_laps = []
     try:
         # Verify laps attribute existence and accessibility
         if hasattr(session, "laps"):
             try:
-                laps_iter = session.laps.itertuples()
-                for row in laps_iter:
-                    lap_time = getattr(row, "LapTime", None)
-                    lap_duration = _timedelta_to_seconds(lap_time)
-
-                    # Safely get driver number
-                    driver_num = getattr(row, "DriverNumber", None)
-                    if driver_num is None:
-                        continue
-
-                    # Extract tyre data
-                    # Handle NaN/None in Compound
-                    raw_compound = getattr(row, "Compound", None)
-                    compound = (
-                        str(raw_compound)
-                        if pd.notna(raw_compound) and str(raw_compound).strip() != ""
-                        else "UNKNOWN"
-                    )
-
-                    # Handle NaN/None in TyreLife
-                    raw_life = getattr(row, "TyreLife", 0)
-                    tyre_age = int(raw_life) if pd.notna(raw_life) else 0
-
-                    all_laps.append(
-                        LapData(
-                            driver_number=int(driver_num),
-                            lap_number=int(getattr(row, "LapNumber", 0)),
-                            lap_duration=lap_duration,
-                            sector_1=_timedelta_to_seconds(getattr(row, "Sector1Time", None)),
-                            sector_2=_timedelta_to_seconds(getattr(row, "Sector2Time", None)),
-                            sector_3=_timedelta_to_seconds(getattr(row, "Sector3Time", None)),
-                            is_pit_out_lap=getattr(row, "PitOutTime", None) is not None,
-                            compound=compound,
-                            tyre_age=tyre_age,
-                        )
-                    )
+                all_laps = _laps_from_frame(session.laps)
             except Exception as e:
                 # Catch DataNotLoadedError or AttributeError from session.laps
                 logger.warning("lap_iteration_failed", error=str(e))
@@ -535,31 +909,33 @@ def extract_race_data(session: Any) -> Any:
             try:
                 # Check for standard FastF1 columns
                 laps_df = session.laps
-                if "PitInTime" in laps_df.columns:
+                if "PitInTime" in laps_df.columns and "DriverNumber" in laps_df.columns:
                     # Filter for rows where PitInTime is not null (not NaT)
-                    pit_stops = laps_df[pd.notna(laps_df["PitInTime"])]
-
-                    for pit_row in pit_stops.itertuples():
-                        driver_num = getattr(pit_row, "DriverNumber", None)
-                        if driver_num is None:
-                            continue
-
-                        pit_duration = getattr(pit_row, "PitInTime", None)
-                        if pit_duration and hasattr(pit_duration, "total_seconds"):
-                            pit_duration = pit_duration.total_seconds()
-                        else:
-                            pit_duration = 20.0  # Default
-
-                        all_pits.append(
-                            PitData(
-                                driver_number=int(driver_num),
-                                lap_number=int(getattr(pit_row, "LapNumber", 0)),
-                                pit_duration=pit_duration,
-                                timestamp=datetime.now(
-                                    UTC
-                                ),  # FastF1 doesn't provide timestamps
-                            )
+                    pit_stops = laps_df.loc[laps_df["PitInTime"].notna()]
+                    driver_numbers = pd.to_numeric(pit_stops["DriverNumber"], errors="coerce")
+                    if "LapNumber" in pit_stops.columns:
+                        lap_numbers = pd.to_numeric(pit_stops["LapNumber"], errors="coerce")
+                    else:
+                        lap_numbers = pd.Series(0, index=pit_stops.index)
+                    present = (driver_numbers.notna() & lap_numbers.notna()).tolist()
+
+                    now = datetime.now(UTC)  # FastF1 doesn't provide timestamps
+                    all_pits = [
+                        PitData(
+                            driver_number=driver_number,
+                            lap_number=lap_number,
+                            pit_duration=pit_duration or 20.0,  # Default
+                            timestamp=now,
                         )
+                        for ok, driver_number, lap_number, pit_duration in zip(
+                            present,
+                            driver_numbers.fillna(0).to_numpy(dtype=np.int64).tolist(),
+                            lap_numbers.fillna(0).to_numpy(dtype=np.int64).tolist(),
+                            _seconds_column(pit_stops, "PitInTime"),
+                            strict=True,
+                        )
+                        if ok
+                    ]
             except Exception as e:
                 logger.warning("pit_extraction_failed", error=str(e))
     except Exception as e:
@@ -568,58 +944,9 @@ def extract_race_data(session: Any) -> Any:
 
     # 4. Stints - Parse real stints from FastF1 lap data (Stint + Compound columns)
     all_stints = []
-    _compound_aliases = {
-        "SOFT": "SOFT", "MEDIUM": "MEDIUM", "HARD": "HARD",
-        "INTERMEDIATE": "INTERMEDIATE", "WET": "WET",
-        "SUPERSOFT": "SOFT", "ULTRASOFT": "SOFT", "HYPERSOFT": "SOFT",
-        "C1": "HARD", "C2": "HARD", "C3": "MEDIUM",
-        "C4": "MEDIUM", "C5": "SOFT",
-    }
     try:
         if hasattr(session, "laps"):
-            laps_df = session.laps
-            required_cols = {"DriverNumber", "Stint", "Compound", "LapNumber"}
-            if required_cols.issubset(laps_df.columns):
-                for (drv_num, stint_num), grp in laps_df.groupby(["DriverNumber", "Stint"]):
-                    try:
-                        drv_int = int(drv_num)
-                        stint_int = int(stint_num)
-
-                        # Use most common non-null compound value in this stint group
-                        raw_compounds = [
-                            str(c).strip().upper()
-                            for c in grp["Compound"].dropna().tolist()
-                            if str(c).strip() not in ("", "NAN", "NONE", "UNKNOWN")
-                        ]
-                        if raw_compounds:
-                            raw_compound = max(set(raw_compounds), key=raw_compounds.count)
-                            compound = _compound_aliases.get(raw_compound, "UNKNOWN")
-                        else:
-                            compound = "UNKNOWN"
-
-                        lap_start = int(grp["LapNumber"].min())
-                        lap_end = int(grp["LapNumber"].max())
-
-                        # TyreLife on lap 1 of stint = 1 (new tyre) or higher (used tyre)
-                        tyre_age_at_start = 0
-                        if "TyreLife" in grp.columns:
-                            first_life = grp["TyreLife"].iloc[0]
-                            if pd.notna(first_life):
-                                tyre_age_at_start = max(0, int(first_life) - 1)
-
-                        all_stints.append(
-                            StintData(
-                                driver_number=drv_int,
-                                stint_number=stint_int,
-                                compound=compound,
-                                lap_start=lap_start,
-                                lap_end=lap_end,
-                                tyre_age_at_start=tyre_age_at_start,
-                            )
-                        )
-                    except Exception as e:
-                        logger.debug("stint_parse_skip", driver=drv_num, stint=stint_num, error=str(e))
-                        continue
+            all_stints = _stints_from_frame(session.laps)
     except Exception as e:
         logger.warning("stint_extraction_failed", error=str(e))
 
@@ -644,25 +971,24 @@ def extract_race_data(session: Any) -> Any:
         messages = getattr(session, "race_control_messages", None)
         if messages is not None and not messages.empty:
             now = datetime.now(UTC)
-            for row in messages.itertuples():
-                category = getattr(row, "Category", "Other") or "Other"
-                flag = getattr(row, "Flag", None)
-                message = getattr(row, "Message", "") or ""
-                raw_lap = getattr(row, "Lap", None)
-                lap_number = int(raw_lap) if raw_lap is not None and str(raw_lap).isdigit() else None
-                raw_num = getattr(row, "RacingNumber", None)
-                driver_number = int(raw_num) if raw_num is not None and str(raw_num).isdigit() else None
-
-                all_race_control.append(
-                    RaceControlMessage(
-                        category=category,
-                        flag=flag,
-                        message=message,
-                        lap_number=lap_number,
-                        driver_number=driver_number,
-                        timestamp=now,
-                    )
+            all_race_control = [
+                RaceControlMessage(
+                    category=category,
+                    flag=flag,
+                    message=message,
+                    lap_number=lap_number,
+                    driver_number=driver_number,
+                    timestamp=now,
+                )
+                for category, flag, message, lap_number, driver_number in zip(
+                    _str_column(messages, "Category", "Other"),
+                    _text_column(messages, "Flag", None),
+                    _str_column(messages, "Message", ""),
+                    _optional_int_column(messages, "Lap"),
+                    _optional_int_column(messages, "RacingNumber"),
+                    strict=True,
                 )
+            ]
     except Exception as e:
         logger.warning("race_control_extraction_failed", error=str(e))
         all_race_control = []
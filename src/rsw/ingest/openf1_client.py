@@ -8,16 +8,23 @@ API Documentation: https://openf1.org
 """
 
 import asyncio
+import json
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ..config import load_app_config
 from ..logging_config import get_logger
-
-logger = get_logger(__name__)
 from .base import (
+    DRIVERS_ADAPTER,
+    INTERVALS_ADAPTER,
+    LAPS_ADAPTER,
+    PITS_ADAPTER,
+    POSITIONS_ADAPTER,
+    RACE_CONTROL_ADAPTER,
+    STINTS_ADAPTER,
     DataProvider,
     DriverInfo,
     IntervalData,
@@ -29,6 +36,68 @@ from .base import (
     StintData,
 )
 
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 multiplexing in httpx)
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - HTTP/2 is an optional speedup
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        """Decode UTF-8 JSON bytes."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _loads(data: bytes) -> Any:
+        """Decode UTF-8 JSON bytes."""
+        return json.loads(data)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _validate_rows(
+    adapter: TypeAdapter[list[ModelT]],
+    model: type[ModelT],
+    rows: list[dict[str, Any]],
+    entity: str,
+) -> list[ModelT]:
+    """
+    Validate a response's rows in one batch.
+
+    If any row is invalid, fall back to row-by-row validation so only the
+    bad rows are dropped, as before.
+    """
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError:
+        valid: list[ModelT] = []
+        for row in rows:
+            try:
+                valid.append(model.model_validate(row))
+            except ValidationError as e:
+                logger.debug("parse_error", entity=entity, error=str(e))
+        return valid
+
+
+TimedT = TypeVar("TimedT", PositionData, IntervalData)
+
+
+def _latest_per_driver(items: list[TimedT]) -> list[TimedT]:
+    """Keep the most recent entry for each driver."""
+    latest: dict[int, TimedT] = {}
+    for item in items:
+        current = latest.get(item.driver_number)
+        if current is None or item.timestamp > current.timestamp:
+            latest[item.driver_number] = item
+    return list(latest.values())
+
 
 class OpenF1Client(DataProvider):
     """
@@ -48,11 +117,17 @@ class OpenF1Client(DataProvider):
         self._cache_ttl = config.polling.cache_ttl_seconds
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client with connection pooling."""
+        """
+        Get or create the HTTP client with connection pooling.
+
+        A single client is shared by every fetch, so concurrent requests reuse
+        keep-alive connections (multiplexed over HTTP/2 when h2 is installed).
+        """
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                timeout=self.timeout,
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                http2=_HTTP2_AVAILABLE,
                 headers={"Accept": "application/json"},
                 limits=httpx.Limits(
                     max_connections=20,
@@ -96,7 +171,9 @@ class OpenF1Client(DataProvider):
                     continue
 
                 response.raise_for_status()
-                data = response.json()
+                # Decode the raw body directly; orjson parses large lap and
+                # position payloads several times faster than the stdlib
+                data = _loads(response.content)
 
                 # Update cache
                 self._cache[cache_key] = (datetime.now(UTC), data)
@@ -203,24 +280,25 @@ class OpenF1Client(DataProvider):
         params = {"session_key": session_key}
         data = await self._fetch("/drivers", params)
 
-        drivers = []
+        rows = []
         for item in data:
             try:
-                driver = DriverInfo(
-                    driver_number=item["driver_number"],
-                    name_acronym=item["name_acronym"],
-                    full_name=item["full_name"],
-                    team_name=item["team_name"],
-                    team_colour=item.get("team_colour", "FFFFFF"),
-                    country_code=item.get("country_code", ""),
-                    headshot_url=item.get("headshot_url"),
+                rows.append(
+                    {
+                        "driver_number": item["driver_number"],
+                        "name_acronym": item["name_acronym"],
+                        "full_name": item["full_name"],
+                        "team_name": item["team_name"],
+                        "team_colour": item.get("team_colour", "FFFFFF"),
+                        "country_code": item.get("country_code", ""),
+                        "headshot_url": item.get("headshot_url"),
+                    }
                 )
-                drivers.append(driver)
-            except (KeyError, ValueError) as e:
+            except KeyError as e:
                 logger.debug("parse_error", entity="driver", error=str(e))
                 continue
 
-        return drivers
+        return _validate_rows(DRIVERS_ADAPTER, DriverInfo, rows, "driver")
 
     async def get_laps(
         self,
@@ -237,26 +315,27 @@ class OpenF1Client(DataProvider):
 
         data = await self._fetch("/laps", params)
 
-        laps = []
+        rows = []
         for item in data:
             try:
-                lap = LapData(
-                    driver_number=item["driver_number"],
-                    lap_number=item["lap_number"],
-                    lap_duration=item.get("lap_duration"),
-                    sector_1=item.get("duration_sector_1"),
-                    sector_2=item.get("duration_sector_2"),
-                    sector_3=item.get("duration_sector_3"),
-                    is_pit_out_lap=item.get("is_pit_out_lap", False),
-                    speed_trap=item.get("st_speed"),
-                    timestamp=self._parse_datetime(item.get("date_start")),
+                rows.append(
+                    {
+                        "driver_number": item["driver_number"],
+                        "lap_number": item["lap_number"],
+                        "lap_duration": item.get("lap_duration"),
+                        "sector_1": item.get("duration_sector_1"),
+                        "sector_2": item.get("duration_sector_2"),
+                        "sector_3": item.get("duration_sector_3"),
+                        "is_pit_out_lap": item.get("is_pit_out_lap", False),
+                        "speed_trap": item.get("st_speed"),
+                        "timestamp": self._parse_datetime(item.get("date_start")),
+                    }
                 )
-                laps.append(lap)
-            except (KeyError, ValueError) as e:
+            except KeyError as e:
                 logger.debug("parse_error", entity="lap", error=str(e))
                 continue
 
-        return laps
+        return _validate_rows(LAPS_ADAPTER, LapData, rows, "lap")
 
     async def get_positions(self, session_key: int) -> list[PositionData]:
         """Fetch position data."""
@@ -264,70 +343,56 @@ class OpenF1Client(DataProvider):
         data = await self._fetch("/position", params)
 
         # OpenF1 returns multiple position entries per driver (one per change)
-        # We want the most recent position for each driver
-        latest_positions: dict[int, PositionData] = {}
-
+        # We want the most recent position for each driver. Rows are validated
+        # first so a malformed latest row falls back to the driver's last valid one
+        rows = []
         for item in data:
             try:
-                driver_num = item["driver_number"]
                 timestamp = self._parse_datetime(item["date"])
-
                 if timestamp is None:
                     continue
 
-                position = PositionData(
-                    driver_number=driver_num,
-                    position=item["position"],
-                    timestamp=timestamp,
+                rows.append(
+                    {
+                        "driver_number": item["driver_number"],
+                        "position": item["position"],
+                        "timestamp": timestamp,
+                    }
                 )
-
-                # Keep only the latest position for each driver
-                if (
-                    driver_num not in latest_positions
-                    or timestamp > latest_positions[driver_num].timestamp
-                ):
-                    latest_positions[driver_num] = position
-
-            except (KeyError, ValueError) as e:
+            except KeyError as e:
                 logger.debug("parse_error", entity="position", error=str(e))
                 continue
 
-        return list(latest_positions.values())
+        positions = _validate_rows(POSITIONS_ADAPTER, PositionData, rows, "position")
+        return _latest_per_driver(positions)
 
     async def get_intervals(self, session_key: int) -> list[IntervalData]:
         """Fetch interval/gap data."""
         params = {"session_key": session_key}
         data = await self._fetch("/intervals", params)
 
-        # Get most recent interval for each driver
-        latest_intervals: dict[int, IntervalData] = {}
-
+        # Get most recent valid interval for each driver
+        rows = []
         for item in data:
             try:
-                driver_num = item["driver_number"]
                 timestamp = self._parse_datetime(item["date"])
-
                 if timestamp is None:
                     continue
 
-                interval = IntervalData(
-                    driver_number=driver_num,
-                    gap_to_leader=item.get("gap_to_leader"),
-                    interval=item.get("interval"),
-                    timestamp=timestamp,
+                rows.append(
+                    {
+                        "driver_number": item["driver_number"],
+                        "gap_to_leader": item.get("gap_to_leader"),
+                        "interval": item.get("interval"),
+                        "timestamp": timestamp,
+                    }
                 )
-
-                if (
-                    driver_num not in latest_intervals
-                    or timestamp > latest_intervals[driver_num].timestamp
-                ):
-                    latest_intervals[driver_num] = interval
-
-            except (KeyError, ValueError) as e:
+            except KeyError as e:
                 logger.debug("parse_error", entity="interval", error=str(e))
                 continue
 
-        return list(latest_intervals.values())
+        intervals = _validate_rows(INTERVALS_ADAPTER, IntervalData, rows, "interval")
+        return _latest_per_driver(intervals)
 
     async def get_stints(
         self,
@@ -341,67 +406,70 @@ class OpenF1Client(DataProvider):
 
         data = await self._fetch("/stints", params)
 
-        stints = []
+        rows = []
         for item in data:
             try:
-                stint = StintData(
-                    driver_number=item["driver_number"],
-                    stint_number=item["stint_number"],
-                    compound=item["compound"],
-                    lap_start=item["lap_start"],
-                    lap_end=item.get("lap_end"),
-                    tyre_age_at_start=item.get("tyre_age_at_start", 0),
+                rows.append(
+                    {
+                        "driver_number": item["driver_number"],
+                        "stint_number": item["stint_number"],
+                        "compound": item["compound"],
+                        "lap_start": item["lap_start"],
+                        "lap_end": item.get("lap_end"),
+                        "tyre_age_at_start": item.get("tyre_age_at_start", 0),
+                    }
                 )
-                stints.append(stint)
-            except (KeyError, ValueError) as e:
+            except KeyError as e:
                 logger.debug("parse_error", entity="stint", error=str(e))
                 continue
 
-        return stints
+        return _validate_rows(STINTS_ADAPTER, StintData, rows, "stint")
 
     async def get_pits(self, session_key: int) -> list[PitData]:
         """Fetch pit stop data."""
         params = {"session_key": session_key}
         data = await self._fetch("/pit", params)
 
-        pits = []
+        rows = []
         for item in data:
             try:
-                pit = PitData(
-                    driver_number=item["driver_number"],
-                    lap_number=item["lap_number"],
-                    pit_duration=item["pit_duration"],
-                    timestamp=self._parse_datetime(item["date"]) or datetime.now(UTC),
+                rows.append(
+                    {
+                        "driver_number": item["driver_number"],
+                        "lap_number": item["lap_number"],
+                        "pit_duration": item["pit_duration"],
+                        "timestamp": self._parse_datetime(item["date"]) or datetime.now(UTC),
+                    }
                 )
-                pits.append(pit)
-            except (KeyError, ValueError) as e:
+            except KeyError as e:
                 logger.debug("parse_error", entity="pit", error=str(e))
                 continue
 
-        return pits
+        return _validate_rows(PITS_ADAPTER, PitData, rows, "pit")
 
     async def get_race_control(self, session_key: int) -> list[RaceControlMessage]:
         """Fetch race control messages."""
         params = {"session_key": session_key}
         data = await self._fetch("/race_control", params)
 
-        messages = []
+        rows = []
         for item in data:
             try:
-                msg = RaceControlMessage(
-                    category=item["category"],
-                    flag=item.get("flag"),
-                    message=item["message"],
-                    lap_number=item.get("lap_number"),
-                    driver_number=item.get("driver_number"),
-                    timestamp=self._parse_datetime(item["date"]) or datetime.now(UTC),
+                rows.append(
+                    {
+                        "category": item["category"],
+                        "flag": item.get("flag"),
+                        "message": item["message"],
+                        "lap_number": item.get("lap_number"),
+                        "driver_number": item.get("driver_number"),
+                        "timestamp": self._parse_datetime(item["date"]) or datetime.now(UTC),
+                    }
                 )
-                messages.append(msg)
-            except (KeyError, ValueError) as e:
+            except KeyError as e:
                 logger.debug("parse_error", entity="race_control", error=str(e))
                 continue
 
-        return messages
+        return _validate_rows(RACE_CONTROL_ADAPTER, RaceControlMessage, rows, "race_control")
 
 
 # Convenience function for quick testing
@@ -29,6 +29,7 @@ from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSoc
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from rsw.api.routes.health import close_health_clients
 from rsw.api.routes.health import router as health_router
 from rsw.api.routes.sessions import init_session_routes
 from rsw.api.routes.sessions import router as sessions_router
@@ -44,9 +45,11 @@ from rsw.api.routes.championship import router as championship_router
 from rsw.api.routes.backtest import router as backtest_router
 from rsw.api.websocket_manager import ConnectionManager
 from rsw.config import load_app_config, load_tracks_config
+from rsw.exceptions import RSWError
 from rsw.ingest import OpenF1Client
 from rsw.ingest.weather_client import WeatherClient
 from rsw.logging_config import get_logger
+from rsw.middleware.error_handler import rsw_error_handler
 from rsw.middleware.rate_limit import RateLimitMiddleware
 from rsw.monitoring import MetricsMiddleware, metrics_endpoint
 from rsw.models.degradation import ModelManager
@@ -159,11 +162,12 @@ async def lifespan(application: FastAPI) -> Any:
     # Optionally initialize database and session repository
     if os.getenv("RSW_DB_ENABLED", "false").lower() == "true":
         try:
-            from rsw.db.models import get_session, init_db
+            from rsw.db.models import init_db, init_session_factory
             from rsw.repositories.session_repository import SessionRepository
 
             await init_db()
-            app_state.session_repo = SessionRepository(session_factory=get_session)
+            session_factory = await init_session_factory()
+            app_state.session_repo = SessionRepository(session_factory=session_factory)
             logger.info("database_initialized")
         except Exception as e:
             logger.warning("database_init_failed", error=str(e))
@@ -182,6 +186,7 @@ async def lifespan(application: FastAPI) -> Any:
         from rsw.db.models import close_db
 
         await close_db()
+    await close_health_clients()
     logger.info("application_stopped")
 
 
@@ -248,6 +253,9 @@ app.add_middleware(MetricsMiddleware)
 if os.getenv("RSW_RATE_LIMIT_ENABLED", "false").lower() == "true":
     app.add_middleware(RateLimitMiddleware)
 
+# Domain errors are encoded with orjson rather than FastAPI's default JSONResponse
+app.add_exception_handler(RSWError, rsw_error_handler)  # type: ignore[arg-type]
+
 
 # =============================================================================
 # Include Routers
@@ -468,15 +476,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     try:
         # Send initial state
         safe_data = sanitize_for_json(state.store.to_dict())
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "state_update",
-                    "data": safe_data,
-                },
-                default=str,
-            )
-        )
+        await conn_mgr.send_to(websocket, {"type": "state_update", "data": safe_data})
 
         # Handle incoming messages
         while True:
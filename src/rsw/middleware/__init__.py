@@ -11,7 +11,12 @@ from .auth import (
     require_permission,
     require_role,
 )
-from .error_handler import ErrorHandlerMiddleware, http_exception_handler
+from .error_handler import (
+    ErrorHandlerMiddleware,
+    http_exception_handler,
+    rsw_error_handler,
+    rsw_error_response,
+)
 from .rate_limit import (
     InMemoryRateLimiter,
     RateLimitConfig,
@@ -36,4 +41,6 @@ __all__ = [
     # Error Handler
     "ErrorHandlerMiddleware",
     "http_exception_handler",
+    "rsw_error_handler",
+    "rsw_error_response",
 ]
@@ -4,6 +4,7 @@ Global error handling middleware.
 Provides consistent error responses and logging for all exceptions.
 """
 
+import json
 import traceback
 from collections.abc import Callable
 
@@ -11,12 +12,69 @@ from fastapi import HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from rsw.exceptions import RSWError
+from rsw.exceptions import NoActiveReplayError, RSWError
 from rsw.logging_config import get_logger
 from rsw.runtime_config import get_config
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Map error codes to HTTP status codes
+ERROR_STATUS_CODES: dict[str, int] = {
+    # 400 Bad Request
+    "INVALID_DATA": 400,
+    "DATA_ERROR": 400,
+    "CONFIG_ERROR": 400,
+    # 401 Unauthorized
+    "AUTH_ERROR": 401,
+    "INVALID_TOKEN": 401,
+    # 403 Forbidden
+    "INSUFFICIENT_PERMISSIONS": 403,
+    # 404 Not Found
+    "SESSION_NOT_FOUND": 404,
+    "DRIVER_NOT_FOUND": 404,
+    "CACHED_SESSION_NOT_FOUND": 404,
+    # 422 Unprocessable
+    "INSUFFICIENT_DATA": 422,
+    # 429 Too Many Requests
+    "RATE_LIMIT_EXCEEDED": 429,
+    # 500 Internal Server Error
+    "API_ERROR": 502,
+    "API_TIMEOUT": 504,
+    "API_CONNECTION_ERROR": 503,
+    "MODEL_ERROR": 500,
+    "STRATEGY_ERROR": 500,
+}
+
+
+def _encode_error(error: RSWError) -> bytes:
+    """Serialize an error payload, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(error.to_dict(), default=str)
+    return json.dumps(error.to_dict(), default=str, separators=(",", ":")).encode()
+
+
+# Errors whose payload never varies are encoded once at import
+_STATIC_ERROR_BODIES: dict[type[RSWError], bytes] = {
+    NoActiveReplayError: _encode_error(NoActiveReplayError()),
+}
+
+
+def rsw_error_response(error: RSWError) -> Response:
+    """Build the JSON response for an RSWError without re-encoding via stdlib json."""
+    body = _STATIC_ERROR_BODIES.get(type(error))
+    if body is None:
+        body = _encode_error(error)
+    return Response(
+        content=body,
+        status_code=ERROR_STATUS_CODES.get(error.code, 500),
+        media_type="application/json",
+    )
+
 
 class ErrorHandlerMiddleware(BaseHTTPMiddleware):
     """
@@ -41,11 +99,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                 path=request.url.path,
             )
 
-            status_code = self._get_status_code(e.code)
-            return JSONResponse(
-                status_code=status_code,
-                content=e.to_dict(),
-            )
+            return rsw_error_response(e)
 
         except HTTPException as e:
             # FastAPI HTTP exceptions (pass through)
@@ -94,33 +148,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
 
     def _get_status_code(self, error_code: str) -> int:
         """Map error codes to HTTP status codes."""
-        code_map = {
-            # 400 Bad Request
-            "INVALID_DATA": 400,
-            "DATA_ERROR": 400,
-            "CONFIG_ERROR": 400,
-            # 401 Unauthorized
-            "AUTH_ERROR": 401,
-            "INVALID_TOKEN": 401,
-            # 403 Forbidden
-            "INSUFFICIENT_PERMISSIONS": 403,
-            # 404 Not Found
-            "SESSION_NOT_FOUND": 404,
-            "DRIVER_NOT_FOUND": 404,
-            "CACHED_SESSION_NOT_FOUND": 404,
-            # 422 Unprocessable
-            "INSUFFICIENT_DATA": 422,
-            # 429 Too Many Requests
-            "RATE_LIMIT_EXCEEDED": 429,
-            # 500 Internal Server Error
-            "API_ERROR": 502,
-            "API_TIMEOUT": 504,
-            "API_CONNECTION_ERROR": 503,
-            "MODEL_ERROR": 500,
-            "STRATEGY_ERROR": 500,
-        }
-
-        return code_map.get(error_code, 500)
+        return ERROR_STATUS_CODES.get(error_code, 500)
 
 
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
@@ -135,3 +163,15 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         },
         headers=getattr(exc, "headers", None),
     )
+
+
+async def rsw_error_handler(request: Request, exc: RSWError) -> Response:
+    """Exception handler for RSWError raised from route handlers."""
+    logger.error(
+        "rsw_error",
+        code=exc.code,
+        message=exc.message,
+        details=exc.details,
+        path=request.url.path,
+    )
+    return rsw_error_response(exc)
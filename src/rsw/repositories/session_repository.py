@@ -65,6 +65,35 @@ class SessionRepository(IRepository[SessionModel]):
             result = await session.execute(stmt)
             return cast(SessionModel | None, result.scalar_one_or_none())
 
+    async def get_with_details(self, session_key: int) -> SessionModel | None:
+        """
+        Get session by session_key with its drivers and laps loaded.
+
+        Relationships are loaded with one SELECT ... IN query each; any
+        other relationship access raises instead of lazy loading.
+
+        Args:
+            session_key: OpenF1 session key
+
+        Returns:
+            SessionModel or None
+        """
+        from sqlalchemy import select
+        from sqlalchemy.orm import raiseload, selectinload
+
+        async with self._session_factory() as session:
+            stmt = (
+                select(SessionModel)
+                .where(SessionModel.session_key == session_key)
+                .options(
+                    selectinload(SessionModel.drivers),
+                    selectinload(SessionModel.laps),
+                    raiseload("*"),
+                )
+            )
+            result = await session.execute(stmt)
+            return cast(SessionModel | None, result.scalar_one_or_none())
+
     async def get_all(self, **filters: Any) -> list[SessionModel]:
         """
         Get all sessions matching filters.
@@ -54,6 +54,10 @@ class DatabaseConfig(BaseSettings):
     # Connection pool
     pool_size: int = 5
     pool_max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    # Behind PgBouncer in transaction mode, let it own pooling
+    use_pgbouncer: bool = False
 
     model_config = SettingsConfigDict(env_prefix="RSW_DB_")
 
@@ -31,14 +31,38 @@ def event_loop():
 # Application Fixtures
 # ============================================================================
 
-@pytest.fixture
-def app():
-    """Get FastAPI application."""
+@pytest.fixture(scope="session")
+def route_app_state():
+    """Lightweight app state shared by the route modules for the test session."""
+    from types import SimpleNamespace
+
+    from rsw.state import RaceStateStore
+
+    client = AsyncMock()
+    client.get_sessions.return_value = []
+    client.get_session.return_value = None
+
+    return SimpleNamespace(
+        client=client,
+        store=RaceStateStore(),
+        simulation_service=None,
+        speed_multiplier=1.0,
+    )
+
+
+@pytest.fixture(scope="session")
+def app(route_app_state):
+    """Get FastAPI application, built once per test session."""
+    from rsw.api.routes.sessions import init_session_routes
+    from rsw.api.routes.simulation import init_simulation_routes
     from rsw.main import app
+
+    init_session_routes(route_app_state)
+    init_simulation_routes(route_app_state)
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
     """Get synchronous test client."""
     return TestClient(app)
@@ -58,6 +82,27 @@ async def async_client(app) -> AsyncGenerator[httpx.AsyncClient, None]:
 # Mock Data Fixtures
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def sample_openf1_payload() -> dict[int, dict]:
+    """Cached OpenF1 session dumps from data/sessions, keyed by session_key."""
+    try:
+        import orjson
+
+        loads = orjson.loads
+    except ImportError:
+        loads = json.loads
+
+    payloads: dict[int, dict] = {}
+    sessions_dir = Path(__file__).parent.parent / "data" / "sessions"
+    for path in sorted(sessions_dir.glob("*.json")):
+        # Skip the listing-metadata sidecars written next to each session
+        if path.name.endswith(".meta.json"):
+            continue
+        data = loads(path.read_bytes())
+        payloads[data["session_key"]] = data
+    return payloads
+
+
 @pytest.fixture
 def sample_session() -> dict:
     """Sample session data."""
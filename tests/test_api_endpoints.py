@@ -26,6 +26,28 @@ class TestHealthEndpoints:
         assert "version" in data
         assert "environment" in data
 
+    async def test_health_checks_are_cached(self):
+        """Repeated probes within the TTL reuse the first check result."""
+        from rsw.api.routes.health import ComponentHealth, _HealthCache
+
+        calls = 0
+
+        async def check() -> ComponentHealth:
+            nonlocal calls
+            calls += 1
+            return ComponentHealth(status="healthy")
+
+        cache = _HealthCache()
+        first = await cache.get("db", 60.0, check)
+        second = await cache.get("db", 60.0, check)
+
+        assert first is second
+        assert calls == 1
+
+        await cache.get("redis", 0.0, check)
+        await cache.get("redis", 0.0, check)
+        assert calls == 3
+
 
 class TestSessionEndpoints:
     """Tests for session management endpoints."""
@@ -37,7 +59,51 @@ class TestSessionEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
+
+    def test_empty_sessions_not_cacheable(self, client: TestClient):
+        """Test an empty (failed) listing is not marked cacheable."""
+        response = client.get("/api/sessions?year=2023")
+
+        assert response.json() == []
+        assert "cache-control" not in response.headers
     
+    async def test_round_numbers_cached_with_listing(self, monkeypatch):
+        """Test round numbers are computed once per cached listing."""
+        from datetime import datetime
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock
+
+        from fastapi import Response
+
+        from rsw.api.routes import sessions as routes
+
+        race = SimpleNamespace(
+            session_key=9158,
+            session_name="Race",
+            session_type="Race",
+            circuit_short_name="Sakhir",
+            country_name="Bahrain",
+            date_start=datetime(2023, 3, 5),
+            year=2023,
+            meeting_key=1141,
+        )
+        client = AsyncMock()
+        client.get_sessions.return_value = [race]
+        calls = []
+        calculate = routes._calculate_round_numbers
+        monkeypatch.setattr(routes, "_app_state", SimpleNamespace(client=client))
+        monkeypatch.setattr(routes, "_sessions_cache", {})
+        monkeypatch.setattr(
+            routes, "_calculate_round_numbers", lambda s: calls.append(s) or calculate(s)
+        )
+
+        first = await routes.list_sessions(Response(), year=2023, country=None)
+        second = await routes.list_sessions(Response(), year=2023, country=None)
+
+        assert first == second
+        assert first[0]["round_number"] == 1
+        assert len(calls) == 1
+
     def test_get_sessions_invalid_year(self, client: TestClient):
         """Test /api/sessions with invalid year."""
         try:
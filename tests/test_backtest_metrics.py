@@ -0,0 +1,73 @@
+"""
+Tests for backtest metrics calculation.
+"""
+
+import pytest
+
+from rsw.backtest import calculate_metrics
+
+
+@pytest.fixture
+def actual_pits():
+    return [
+        {"driver_number": 1, "lap_number": 20},
+        {"driver_number": 1, "lap_number": 45},
+        {"driver_number": 44, "lap_number": 30},
+    ]
+
+
+@pytest.fixture
+def position_history():
+    return {
+        1: [1] * 60,
+        44: [5] * 29 + [8] + [4] * 30,
+    }
+
+
+class TestCalculateMetrics:
+    """Tests for calculate_metrics."""
+
+    def test_pit_window_matching(self, actual_pits, position_history):
+        recommendations = [
+            {"lap": 18, "driver_number": 1, "action": "PIT_NOW"},  # within 2 of lap 20
+            {"lap": 17, "driver_number": 1, "action": "PIT_NOW"},  # 3 laps early
+            {"lap": 10, "driver_number": 1, "action": "STAY_OUT"},
+            {"lap": 46, "driver_number": 1, "action": "STAY_OUT"},  # pitted on 45
+            {"lap": 30, "driver_number": 16, "action": "STAY_OUT"},  # never pitted
+        ]
+
+        report = calculate_metrics(recommendations, actual_pits, position_history)
+
+        assert [d.actual_action for d in report.pit_decisions] == [
+            "PITTED",
+            "STAYED_OUT",
+            "STAYED_OUT",
+            "PITTED",
+            "STAYED_OUT",
+        ]
+        assert [d.was_correct for d in report.pit_decisions] == [True, False, True, False, True]
+        assert report.total_decisions == 5
+        assert report.correct_decisions == 3
+        assert report.accuracy == pytest.approx(0.6)
+
+    def test_position_gain_and_timing_error(self, actual_pits, position_history):
+        recommendations = [
+            {"lap": 30, "driver_number": 44, "action": "PIT_NOW", "optimal_pit_lap": 27},
+            {"lap": 40, "driver_number": 1, "action": "STAY_OUT", "optimal_pit_lap": 44},
+            {"lap": 5, "driver_number": 16, "action": "STAY_OUT", "optimal_pit_lap": 10},
+        ]
+
+        report = calculate_metrics(recommendations, actual_pits, position_history)
+
+        assert report.pit_decisions[0].position_delta == 4  # P8 -> P4
+        assert report.total_position_gain == 4
+        assert report.avg_position_gain == pytest.approx(4 / 3)
+        # Errors: |30-27| = 3 and |45-44| = 1; driver 16 has no stops
+        assert report.avg_pit_timing_error == pytest.approx(2.0)
+
+    def test_empty_inputs(self):
+        report = calculate_metrics([], [], {})
+
+        assert report.total_decisions == 0
+        assert report.accuracy == 0.0
+        assert report.avg_pit_timing_error == 0.0
@@ -0,0 +1,57 @@
+"""
+Tests for YAML configuration loading.
+"""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from rsw.config import load_strategy_config, load_tracks_config
+
+TRACKS_YAML = """
+tracks:
+  bahrain:
+    track_id: bahrain
+    name: {name}
+    location: Sakhir
+    country: Bahrain
+    laps: 57
+    pit_loss_seconds: 22.0
+"""
+
+
+def test_unchanged_file_is_parsed_once(tmp_path):
+    from rsw.config.loader import _load_yaml_cached
+
+    path = tmp_path / "strategy.yaml"
+    path.write_text("monte_carlo:\n  simulations: 500\n")
+
+    misses = _load_yaml_cached.cache_info().misses
+    first = load_strategy_config(path)
+    second = load_strategy_config(path)
+
+    assert first == second
+    assert first.monte_carlo.simulations == 500
+    assert _load_yaml_cached.cache_info().misses == misses + 1
+
+
+def test_modified_file_is_reloaded(tmp_path):
+    path = tmp_path / "tracks.yaml"
+    path.write_text(TRACKS_YAML.format(name="Bahrain"))
+    assert load_tracks_config(path)["bahrain"].name == "Bahrain"
+
+    path.write_text(TRACKS_YAML.format(name="Sakhir"))
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+    assert load_tracks_config(path)["bahrain"].name == "Sakhir"
+
+
+def test_loaded_config_is_frozen(tmp_path):
+    path = tmp_path / "tracks.yaml"
+    path.write_text(TRACKS_YAML.format(name="Bahrain"))
+    track = load_tracks_config(path)["bahrain"]
+
+    with pytest.raises(ValidationError):
+        track.laps = 58
@@ -0,0 +1,34 @@
+"""
+Tests for the dependency injection container.
+"""
+
+from rsw.container import Container, _register_dependencies
+from rsw.interfaces import IStateStore
+
+
+def test_reset_rebuilds_singletons(monkeypatch):
+    monkeypatch.setenv("RSW_DATA_PROVIDER", "mock")
+    container = Container()
+    _register_dependencies(container)
+
+    store = container.resolve(IStateStore)
+    assert container.resolve(IStateStore) is store
+
+    container.reset()
+
+    assert container.resolve(IStateStore) is not store
+
+
+async def test_dependencies_follow_container_reset(monkeypatch):
+    import rsw.container
+    from rsw.container import get_container, get_state_store
+
+    monkeypatch.setenv("RSW_DATA_PROVIDER", "mock")
+    monkeypatch.setattr(rsw.container, "_container", None)
+
+    store = await get_state_store()
+    assert await get_state_store() is store
+
+    get_container().reset()
+
+    assert await get_state_store() is not store
@@ -0,0 +1,146 @@
+"""
+Tests for database model loading behaviour.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session, selectinload
+
+from rsw.db.models import Base, DriverModel, SessionModel
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        race = SessionModel(session_key=9158, session_name="Race", year=2023)
+        race.drivers = [DriverModel(driver_number=1, name_acronym="VER")]
+        session.add(race)
+        session.commit()
+
+    with Session(engine) as session:
+        yield session
+
+
+def test_session_relationships_raise_on_lazy_load(db_session):
+    race = db_session.scalars(select(SessionModel)).one()
+
+    with pytest.raises(InvalidRequestError):
+        _ = race.drivers
+
+
+def test_session_relationships_load_with_selectinload(db_session):
+    stmt = select(SessionModel).options(selectinload(SessionModel.drivers))
+    race = db_session.scalars(stmt).one()
+
+    assert [d.name_acronym for d in race.drivers] == ["VER"]
+    assert isinstance(race.cached_at, datetime)
+
+
+async def test_laps_array_streams_columns():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from rsw.db.models import bulk_insert_laps, laps_array
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        race = SessionModel(session_key=9158, session_name="Race", year=2023)
+        session.add(race)
+        await session.flush()
+        await bulk_insert_laps(
+            session,
+            [
+                {"session_id": race.id, "driver_number": 44, "lap_number": 1, "lap_duration": 95.2},
+                {"session_id": race.id, "driver_number": 1, "lap_number": 2, "lap_duration": None},
+                {"session_id": race.id, "driver_number": 1, "lap_number": 1, "lap_duration": 94.8},
+            ],
+        )
+
+        laps = await laps_array(session, race.id)
+
+    await engine.dispose()
+    assert laps["driver_number"].tolist() == [1, 1, 44]
+    assert laps["lap_number"].tolist() == [1, 2, 1]
+    assert laps["lap_duration"][0] == 94.8
+    assert np.isnan(laps["lap_duration"][1])
+
+
+def test_normalize_compound_maps_unmodelled_values():
+    from rsw.db.models import normalize_compound
+
+    assert normalize_compound("SOFT") == "SOFT"
+    assert normalize_compound("medium") == "MEDIUM"
+    assert normalize_compound("HYPERSOFT") == "UNKNOWN"
+    assert normalize_compound(None) is None
+
+
+async def test_bulk_insert_stints_stores_unknown_compounds():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from rsw.db.models import StintModel, bulk_insert_stints
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        race = SessionModel(session_key=9158, session_name="Race", year=2023)
+        session.add(race)
+        await session.flush()
+        base = {"session_id": race.id, "driver_number": 1, "lap_start": 1, "lap_end": None}
+        await bulk_insert_stints(
+            session,
+            [
+                {**base, "stint_number": 1, "compound": "soft"},
+                {**base, "stint_number": 2, "compound": "TEST_UNKNOWN"},
+                {**base, "stint_number": 3, "compound": None},
+            ],
+        )
+
+        stmt = select(StintModel.compound).order_by(StintModel.stint_number)
+        compounds = (await session.scalars(stmt)).all()
+
+    await engine.dispose()
+    assert compounds == ["SOFT", "UNKNOWN", None]
+
+
+async def test_copy_records_match_executemany_rows():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from rsw.db.models import LapModel, bulk_insert_laps, copy_records
+
+    rows = [
+        {"session_id": 1, "lap_number": 2, "driver_number": 44, "lap_duration": 95.2},
+        {"session_id": 1, "lap_number": 1, "driver_number": 1, "lap_duration": None},
+    ]
+    columns, records = copy_records(LapModel, rows)
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as session:
+        session.add(SessionModel(id=1, session_key=9158, session_name="Race", year=2023))
+        await session.flush()
+        await bulk_insert_laps(session, rows)
+
+        table = LapModel.__table__
+        stmt = select(*(table.c[c] for c in columns)).order_by(table.c.id)
+        stored = [tuple(r) for r in (await session.execute(stmt)).all()]
+
+    await engine.dispose()
+    assert columns.index("session_id") < columns.index("driver_number") < columns.index("lap_number")
+    assert "is_pit_out_lap" in columns and "id" not in columns
+    assert stored == records
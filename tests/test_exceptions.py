@@ -47,6 +47,7 @@ class TestRSWError:
         assert result["error"]["code"] == "TEST"
         assert result["error"]["message"] == "Test error"
         assert result["error"]["details"]["id"] == 123
+        assert error.to_dict() is result
 
 
 class TestAPIErrors:
@@ -144,3 +145,32 @@ class TestReplayErrors:
         
         assert error.code == "CACHED_SESSION_NOT_FOUND"
         assert error.path == "/data/sessions/9158.json"
+
+
+class TestErrorResponses:
+    """Tests for the RSWError JSON response fast path."""
+
+    def test_response_body_and_status(self):
+        """Test error payload is encoded with the mapped status code."""
+        import json
+
+        from rsw.middleware.error_handler import rsw_error_response
+
+        response = rsw_error_response(RateLimitError(retry_after=30, endpoint="/laps"))
+
+        assert response.status_code == 429
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == RateLimitError(30, "/laps").to_dict()
+
+    def test_static_payload_for_no_active_replay(self):
+        """Test constant errors reuse the pre-encoded body."""
+        import json
+
+        from rsw.exceptions import NoActiveReplayError
+        from rsw.middleware.error_handler import rsw_error_response
+
+        first = rsw_error_response(NoActiveReplayError())
+        second = rsw_error_response(NoActiveReplayError())
+
+        assert first.body is second.body
+        assert json.loads(first.body)["error"]["code"] == "NO_ACTIVE_REPLAY"
@@ -0,0 +1,42 @@
+"""
+Tests for domain object factories.
+"""
+
+import numpy as np
+
+from rsw.factories import DataProviderFactory, PitWindowFactory, StrategyFactory
+
+
+def test_pit_window_batch_matches_scalar():
+    deg_slopes = np.array([0.05, 0.1, 0.0, -0.02, 0.2])
+    compounds = ["SOFT", "MEDIUM", "HARD", "MEDIUM", "SOFT"]
+    tyre_ages = np.array([0, 5, 10, 2, 1])
+
+    min_laps, ideal_laps, max_laps = PitWindowFactory.from_calculation_batch(
+        current_lap=12,
+        total_laps=57,
+        deg_slope=deg_slopes,
+        pit_loss=22.0,
+        compound=compounds,
+        tyre_age=tyre_ages,
+    )
+
+    for i, compound in enumerate(compounds):
+        window = PitWindowFactory.from_calculation(
+            current_lap=12,
+            total_laps=57,
+            deg_slope=float(deg_slopes[i]),
+            pit_loss=22.0,
+            compound=compound,
+            tyre_age=int(tyre_ages[i]),
+        )
+        assert (min_laps[i], ideal_laps[i], max_laps[i]) == (
+            window.min_lap,
+            window.ideal_lap,
+            window.max_lap,
+        )
+
+
+def test_factories_reuse_instances():
+    assert DataProviderFactory.create("mock") is DataProviderFactory.create("mock")
+    assert StrategyFactory.create() is StrategyFactory.create()
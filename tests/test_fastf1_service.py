@@ -0,0 +1,420 @@
+"""
+Tests for FastF1 telemetry helpers that don't require a loaded session.
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rsw.ingest import fastf1_service
+from rsw.ingest.fastf1_service import (
+    _extract_drs_zones,
+    extract_race_data,
+    get_driver_positions,
+    get_track_geometry,
+)
+
+
+class _FakeLap:
+    def __init__(self, telemetry: pd.DataFrame):
+        self._telemetry = telemetry
+
+    def get_telemetry(self) -> pd.DataFrame:
+        return self._telemetry
+
+
+class _FakeLaps:
+    def __init__(self, telemetry: pd.DataFrame):
+        self._lap = _FakeLap(telemetry)
+
+    def pick_fastest(self) -> _FakeLap:
+        return self._lap
+
+
+class _FakeSession:
+    """Minimal stand-in for a loaded FastF1 session."""
+
+    def __init__(self, telemetry: pd.DataFrame):
+        self.laps = _FakeLaps(telemetry)
+
+    def get_circuit_info(self):
+        return None
+
+
+def _seconds(values: list[float]) -> pd.TimedeltaIndex:
+    return pd.to_timedelta(values, unit="s")
+
+
+def _oval_telemetry(n: int = 101) -> pd.DataFrame:
+    t = np.linspace(0.0, 2 * np.pi, n)
+    return pd.DataFrame(
+        {
+            "X": 1000 * np.cos(t),
+            "Y": 600 * np.sin(t),
+            "Distance": np.linspace(0.0, 5000.0, n),
+            "DRS": np.where((t > 1) & (t < 2), 12, 0),
+        }
+    )
+
+
+def _zones_loop(drs, x, y, rel_dist):
+    """Reference scalar implementation of DRS zone extraction."""
+    zones = []
+    start = None
+    for i, val in enumerate(drs):
+        if val in (10, 12, 14):
+            if start is None:
+                start = i
+        elif start is not None:
+            zones.append((start, i - 1))
+            start = None
+    if start is not None:
+        zones.append((start, len(drs) - 1))
+    return [
+        {
+            "start_idx": s,
+            "end_idx": e,
+            "start_x": float(x[s]),
+            "start_y": float(y[s]),
+            "end_x": float(x[e]),
+            "end_y": float(y[e]),
+            "start_rel": float(rel_dist[s]),
+            "end_rel": float(rel_dist[e]),
+        }
+        for s, e in zones
+    ]
+
+
+class TestDrsZones:
+    """Tests for DRS zone extraction from the DRS signal."""
+
+    def test_matches_scalar_scan(self):
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            n = int(rng.integers(1, 60))
+            drs = rng.choice([0, 1, 8, 10, 12, 14], size=n)
+            x, y = rng.normal(size=(2, n))
+            rel = np.linspace(0.0, 1.0, n)
+
+            assert _extract_drs_zones(drs, x, y, rel) == _zones_loop(drs, x, y, rel)
+
+    def test_zone_open_at_end_of_lap(self):
+        drs = np.array([0, 12, 12, 0, 10, 14])
+        x = np.arange(6.0)
+
+        zones = _extract_drs_zones(drs, x, x, x / 5)
+
+        assert [(z["start_idx"], z["end_idx"]) for z in zones] == [(1, 2), (4, 5)]
+        assert isinstance(zones[0]["start_idx"], int)
+        assert isinstance(zones[0]["start_x"], float)
+
+    def test_no_drs(self):
+        drs = np.zeros(10)
+        assert _extract_drs_zones(drs, drs, drs, drs) == []
+
+
+class TestTrackGeometry:
+    """Tests for track geometry extraction."""
+
+    async def test_downsampled_lines_and_bounds(self):
+        telemetry = _oval_telemetry()
+
+        geometry = await get_track_geometry(_FakeSession(telemetry))
+
+        center = geometry["center_line"]
+        assert len(center["x"]) == len(center["y"]) == len(center["rel_dist"]) == 21
+        assert center["x"][1] == float(telemetry["X"][5])  # every 5th of 101 points
+        assert center["y"][1] == float(telemetry["Y"][5])
+        assert center["rel_dist"][1] == 0.05
+        assert type(center["x"][1]) is float
+        assert len(geometry["inner_edge"]["x"]) == len(geometry["outer_edge"]["y"]) == 21
+        # Edges sit 7.5 m either side of the center line
+        assert geometry["bounds"]["x_max"] == pytest.approx(1007.5, abs=0.1)
+        assert geometry["bounds"]["y_min"] == pytest.approx(-607.5, abs=0.1)
+        assert len(geometry["drs_zones"]) == 1
+        assert geometry["total_points"] == 101
+
+
+class TestExtractRaceData:
+    """Tests for converting FastF1 frames into ingest DTOs."""
+
+    def test_laps_columnar_conversion(self):
+        session = _FakeSession(_oval_telemetry())
+        session.laps = pd.DataFrame(
+            {
+                "DriverNumber": ["1", "1", "44", None],
+                "LapNumber": [1.0, 2.0, 1.0, 1.0],
+                "LapTime": _seconds([95.1, np.nan, 96.2, 97.0]),
+                "Sector1Time": _seconds([30.0, 31.0, np.nan, 30.0]),
+                "Sector2Time": _seconds([30.0, 31.0, 32.0, 30.0]),
+                "Sector3Time": _seconds([35.1, 31.0, 32.0, 30.0]),
+                "Compound": ["SOFT", None, " ", "HARD"],
+                "TyreLife": [1.0, np.nan, 3.0, 4.0],
+                "PitOutTime": _seconds([np.nan, 5.0, np.nan, np.nan]),
+            }
+        )
+
+        _, laps, _, _, _ = extract_race_data(session)
+
+        assert [(lap.driver_number, lap.lap_number) for lap in laps] == [(1, 1), (1, 2), (44, 1)]
+        assert laps[0].lap_duration == pytest.approx(95.1)
+        assert laps[1].lap_duration is None
+        assert laps[2].sector_1 is None
+        assert [lap.is_pit_out_lap for lap in laps] == [False, True, False]
+        assert [lap.compound for lap in laps] == ["SOFT", "UNKNOWN", "UNKNOWN"]
+        assert [lap.tyre_age for lap in laps] == [1, 0, 3]
+
+    def test_race_control_columnar_conversion(self):
+        session = _FakeSession(_oval_telemetry())
+        session.laps = pd.DataFrame()
+        session.race_control_messages = pd.DataFrame(
+            {
+                "Category": ["Flag", None, "SafetyCar"],
+                "Flag": ["YELLOW", np.nan, None],
+                "Message": ["YELLOW IN TRACK SECTOR 4", "CAR 44 UNDER INVESTIGATION", None],
+                "Lap": [3.0, np.nan, 12.0],
+                "RacingNumber": ["16", "44", None],
+            }
+        )
+
+        _, _, _, _, messages = extract_race_data(session)
+
+        assert [m.category for m in messages] == ["Flag", "Other", "SafetyCar"]
+        assert [m.flag for m in messages] == ["YELLOW", None, None]
+        assert messages[2].message == ""
+        assert [m.lap_number for m in messages] == [3, None, 12]
+        assert [m.driver_number for m in messages] == [16, 44, None]
+        assert len({m.timestamp for m in messages}) == 1
+
+    def test_pit_stops_from_pit_in_time(self):
+        session = _FakeSession(_oval_telemetry())
+        session.laps = pd.DataFrame(
+            {
+                "DriverNumber": ["1", "1", "44", "44"],
+                "LapNumber": [17.0, 18.0, 22.0, 40.0],
+                "PitInTime": _seconds([np.nan, 1834.5, 0.0, 2950.25]),
+            }
+        )
+
+        _, _, _, pits, _ = extract_race_data(session)
+
+        assert [(p.driver_number, p.lap_number) for p in pits] == [(1, 18), (44, 22), (44, 40)]
+        assert [p.pit_duration for p in pits] == [1834.5, 20.0, 2950.25]
+        assert len({p.timestamp for p in pits}) == 1
+
+    def test_stints_from_stint_column(self):
+        session = _FakeSession(_oval_telemetry())
+        session.laps = pd.DataFrame(
+            {
+                "DriverNumber": ["1"] * 5 + ["44"] * 3,
+                "LapNumber": [1.0, 2.0, 3.0, 4.0, 5.0, 1.0, 2.0, 3.0],
+                "Stint": [1.0, 1.0, 1.0, 2.0, 2.0, 1.0, 1.0, 1.0],
+                "Compound": ["SOFT", None, "SOFT", "hard ", "C1", "C4", "MEDIUM", ""],
+                "TyreLife": [1.0, 2.0, 3.0, 4.0, 5.0, 3.0, 4.0, 5.0],
+            }
+        )
+
+        _, _, stints, _, _ = extract_race_data(session)
+
+        assert [
+            (s.driver_number, s.stint_number, s.compound, s.lap_start, s.lap_end) for s in stints
+        ] == [(1, 1, "SOFT", 1, 3), (1, 2, "HARD", 4, 5), (44, 1, "MEDIUM", 1, 3)]
+        assert [s.tyre_age_at_start for s in stints] == [0, 3, 2]
+
+    def test_stints_from_compound_changes_without_stint_column(self):
+        session = _FakeSession(_oval_telemetry())
+        session.laps = pd.DataFrame(
+            {
+                "DriverNumber": ["1"] * 6,
+                "LapNumber": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "Compound": ["MEDIUM", "MEDIUM", None, "HARD", "HARD", "HARD"],
+            }
+        )
+
+        _, _, stints, _, _ = extract_race_data(session)
+
+        assert [(s.stint_number, s.compound, s.lap_start, s.lap_end) for s in stints] == [
+            (1, "MEDIUM", 1, 3),
+            (2, "HARD", 4, 6),
+        ]
+
+
+class _CountingLap(_FakeLap):
+    name = 7  # index label of the lap within session.laps
+
+    def __init__(self, telemetry: pd.DataFrame):
+        super().__init__(telemetry)
+        self.calls = 0
+
+    def get_telemetry(self) -> pd.DataFrame:
+        self.calls += 1
+        return super().get_telemetry()
+
+
+class _DriverLaps:
+    def __init__(self, lap: _FakeLap):
+        self.empty = False
+        self.iloc = [lap]
+
+
+class _PositionsSession:
+    """Fake session exposing one lap of telemetry per driver."""
+
+    def __init__(self, drivers: dict[str, _CountingLap]):
+        self.drivers = list(drivers)
+        self._laps = {d: _DriverLaps(lap) for d, lap in drivers.items()}
+        self.laps = self
+
+    def pick_drivers(self, driver: str) -> _DriverLaps:
+        return self._laps[driver]
+
+    def get_driver(self, driver: str) -> dict:
+        return {"Abbreviation": f"D{driver}"}
+
+
+class TestDriverPositions:
+    """Tests for per-frame driver position lookup."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        fastf1_service.clear_session_cache()
+        yield
+        fastf1_service.clear_session_cache()
+
+    async def test_telemetry_fetched_once_per_lap(self):
+        telemetry = _oval_telemetry(20).assign(
+            Speed=np.arange(20.0), nGear=7, Throttle=100.0, Brake=False
+        )
+        laps = {"1": _CountingLap(telemetry), "44": _CountingLap(telemetry)}
+        session = _PositionsSession(laps)
+
+        first = await get_driver_positions(session, frame_index=3)
+        later = await get_driver_positions(session, frame_index=50)
+
+        assert set(first) == {"D1", "D44"}
+        assert first["D1"]["speed"] == 3.0
+        assert first["D1"]["gear"] == 7
+        assert first["D1"]["rel_dist"] == 0
+        assert later["D44"]["speed"] == 19.0  # clamped to the last sample
+        assert [lap.calls for lap in laps.values()] == [1, 1]
+        cached = next(iter(fastf1_service._driver_tel_cache.values()))
+        assert cached["X"].dtype == np.float32
+        assert cached["nGear"].dtype == np.int8
+
+
+class _PickledSession:
+    """Picklable stand-in for a loaded session."""
+
+    def __init__(self, api_path: str):
+        self.api_path = api_path
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PickledSession) and other.api_path == self.api_path
+
+
+class TestSessionCache:
+    """Tests for the loaded-session cache."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(fastf1_service, "_FASTF1_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(fastf1_service, "_PICKLE_SESSIONS", False)
+        fastf1_service.clear_session_cache()
+        yield
+        fastf1_service.clear_session_cache()
+
+    async def test_oldest_session_evicted_with_its_telemetry(self, monkeypatch):
+        async def fake_load(year, round_number, session_type="R"):
+            return object()
+
+        monkeypatch.setattr(fastf1_service, "load_session", fake_load)
+        monkeypatch.setattr(fastf1_service, "SESSION_CACHE_MAX_ENTRIES", 2)
+
+        first = await fastf1_service.get_or_load_session(2023, 1)
+        assert await fastf1_service.get_or_load_session(2023, 1) is first
+        fastf1_service._driver_tel_cache[(id(first), "1", 0)] = {}
+
+        await fastf1_service.get_or_load_session(2023, 2)
+        await fastf1_service.get_or_load_session(2023, 3)
+
+        assert list(fastf1_service._session_cache) == ["2023_2_R", "2023_3_R"]
+        assert fastf1_service._driver_tel_cache == {}
+
+    async def test_clear_releases_module_caches(self, monkeypatch):
+        async def fake_load(year, round_number, session_type="R"):
+            return object()
+
+        monkeypatch.setattr(fastf1_service, "load_session", fake_load)
+        session = await fastf1_service.get_or_load_session(2023, 1)
+        fastf1_service._driver_tel_cache[(id(session), "1", 0)] = {}
+
+        fastf1_service.clear_session_cache()
+
+        assert fastf1_service._session_cache == {}
+        assert fastf1_service._driver_tel_cache == {}
+
+    @pytest.fixture
+    def pickled_loads(self, monkeypatch, tmp_path):
+        """Route loads through the on-disk pickle cache; returns the FastF1 load log."""
+        loads = []
+
+        async def fake_load(year, round_number, session_type="R"):
+            loads.append((year, round_number, session_type))
+            raw_dir = tmp_path / str(year) / f"round_{round_number}" / session_type
+            raw_dir.mkdir(parents=True, exist_ok=True)
+            (raw_dir / "timing_data.ff1pkl").write_bytes(b"raw")
+            return _PickledSession(f"/static/{year}/round_{round_number}/{session_type}/")
+
+        monkeypatch.setattr(fastf1_service, "load_session", fake_load)
+        monkeypatch.setattr(fastf1_service, "_PICKLE_SESSIONS", True)
+        monkeypatch.setattr(fastf1_service, "_fastf1_version", lambda: "3.4.0")
+        return loads
+
+    @staticmethod
+    async def _wait_for(path):
+        for _ in range(200):
+            if path.exists():
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"{path} was never written")
+
+    async def test_sessions_persist_across_restarts(self, pickled_loads, tmp_path):
+        session = await fastf1_service.get_or_load_session(2023, 1)
+        await self._wait_for(tmp_path / "sessions" / "2023_1_R-fastf1-3.4.0.pkl")
+
+        # Simulate a restart: the in-memory cache is gone, the pickle is not
+        fastf1_service.clear_session_cache()
+        reloaded = await fastf1_service.get_or_load_session(2023, 1)
+
+        assert reloaded == session
+        assert pickled_loads == [(2023, 1, "R")]
+
+    async def test_pickle_older_than_raw_cache_is_reloaded(self, pickled_loads, tmp_path):
+        await fastf1_service.get_or_load_session(2023, 1)
+        pickle_path = tmp_path / "sessions" / "2023_1_R-fastf1-3.4.0.pkl"
+        await self._wait_for(pickle_path)
+
+        # FastF1 refreshed the raw cache after the session was pickled
+        raw_file = tmp_path / "2023" / "round_1" / "R" / "timing_data.ff1pkl"
+        newer = pickle_path.stat().st_mtime + 60
+        os.utime(raw_file, (newer, newer))
+
+        fastf1_service.clear_session_cache()
+        await fastf1_service.get_or_load_session(2023, 1)
+
+        assert pickled_loads == [(2023, 1, "R"), (2023, 1, "R")]
+
+    async def test_pickle_from_other_fastf1_version_is_ignored(
+        self, pickled_loads, tmp_path, monkeypatch
+    ):
+        await fastf1_service.get_or_load_session(2023, 1)
+        await self._wait_for(tmp_path / "sessions" / "2023_1_R-fastf1-3.4.0.pkl")
+
+        monkeypatch.setattr(fastf1_service, "_fastf1_version", lambda: "3.5.0")
+        fastf1_service.clear_session_cache()
+        await fastf1_service.get_or_load_session(2023, 1)
+
+        assert len(pickled_loads) == 2
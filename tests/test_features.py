@@ -3,14 +3,30 @@ Unit tests for feature engineering module.
 """
 
 import pytest
-from rsw.features.build import FeatureFrame, build_features
+from rsw.features.build import (
+    Compound,
+    FeatureFrame,
+    FeatureTable,
+    build_features,
+    build_stint_features,
+)
 from rsw.features.filters import (
+    LapFlag,
     is_valid_lap,
+    is_valid_lap_batch,
+    pack_lap_flags,
     filter_outliers_zscore,
     filter_outliers_iqr,
     apply_filters,
+    filter_mask,
+)
+from rsw.features.traffic import (
+    TrafficTracker,
+    detect_traffic,
+    detect_traffic_batch,
+    estimate_traffic_delta,
+    estimate_traffic_delta_batch,
 )
-from rsw.features.traffic import detect_traffic, estimate_traffic_delta
 
 
 class TestFeatureBuilder:
@@ -124,6 +140,108 @@ class TestFeatureBuilder:
         
         assert frame2.is_valid is False
 
+    def test_rolling_pace_statistics(self):
+        """Test rolling mean/stdev and the pre-filtered valid_times input."""
+        import statistics
+
+        lap_times = [92.5, 0.0, 92.1, 92.9, 93.4, 92.7, 93.8]
+        kwargs = {
+            "driver_number": 1,
+            "lap_number": 7,
+            "lap_times": lap_times,
+            "lap_in_stint": 7,
+            "stint_number": 1,
+            "compound": "SOFT",
+            "tyre_age": 7,
+            "gap_ahead": None,
+            "total_laps": 50,
+        }
+
+        frame = build_features(**kwargs)
+        prefiltered = build_features(**kwargs, valid_times=[t for t in lap_times if t > 0])
+
+        recent = [92.1, 92.9, 93.4, 92.7, 93.8]
+        assert frame.recent_pace_mean == pytest.approx(statistics.mean(recent))
+        assert frame.recent_pace_std == pytest.approx(statistics.stdev(recent))
+        assert prefiltered == frame
+
+    def test_stint_features_valid_only(self):
+        """Test valid_only drops invalid laps without changing the others."""
+        lap_times = [92.5, 0.0, 92.1, None, 93.4]
+
+        frames = build_stint_features(lap_times, stint_start_lap=1, compound="SOFT", total_laps=50)
+        dense = build_stint_features(
+            lap_times, stint_start_lap=1, compound="SOFT", total_laps=50, valid_only=True
+        )
+
+        assert dense == [f for f in frames if f.is_valid]
+        assert [f.lap_number for f in dense] == [1, 3, 5]
+
+    def test_lap_index_matches_prefix_slice(self):
+        """Test lap_index gives the same frame as passing a sliced prefix."""
+        lap_times = [92.5, 0.0, 92.1, 92.9, 93.4, 92.7, 93.8]
+        for i in range(len(lap_times)):
+            for lap_number in (i + 1, 20):
+                kwargs = {
+                    "driver_number": 1,
+                    "lap_number": lap_number,
+                    "lap_in_stint": i + 1,
+                    "stint_number": 1,
+                    "compound": "SOFT",
+                    "tyre_age": i + 1,
+                    "gap_ahead": None,
+                    "total_laps": 50,
+                }
+                sliced = build_features(lap_times=lap_times[: i + 1], **kwargs)
+                indexed = build_features(lap_times=lap_times, lap_index=i, **kwargs)
+                assert indexed == sliced
+
+    def test_stint_features_match_per_lap_build(self):
+        """Test batched stint features equal per-lap build_features output."""
+        lap_times = [92.5, 0.0, 92.1, 92.9, 93.4, 92.7, 93.8, 94.0]
+
+        frames = build_stint_features(lap_times, stint_start_lap=12, compound="HARD", total_laps=57)
+
+        for i, frame in enumerate(frames):
+            expected = build_features(
+                driver_number=0,
+                lap_number=12 + i,
+                lap_times=lap_times[: i + 1],
+                lap_in_stint=i + 1,
+                stint_number=1,
+                compound="HARD",
+                tyre_age=i + 1,
+                gap_ahead=None,
+                total_laps=57,
+            )
+            assert frame.lap_time == expected.lap_time
+            assert frame.best_lap_time == expected.best_lap_time
+            assert frame.recent_pace_mean == expected.recent_pace_mean
+            assert frame.recent_pace_std == expected.recent_pace_std
+            assert frame.fuel_corrected_time == pytest.approx(expected.fuel_corrected_time)
+            assert frame.is_valid == expected.is_valid
+
+    def test_stint_features_flat_window_has_zero_std(self):
+        """Test a window of identical laps gives exactly zero pace std."""
+        lap_times = [108.565, 116.844, 95.799, 112.036, 93.4, 93.4, 93.4, 93.4, 93.4]
+
+        frames = build_stint_features(lap_times, stint_start_lap=1, compound="HARD", total_laps=57)
+
+        assert frames[-1].recent_pace_std == 0.0
+
+
+    def test_compound_codes(self):
+        """Test compounds are canonicalized and encoded as Compound codes."""
+        soft = "".join(["SO", "FT"])  # a distinct str object, as parsed from JSON
+        frames = build_stint_features([92.5, 92.6], 1, soft, 50)
+        frames.append(FeatureFrame(driver_number=1, lap_number=3, compound="C5"))
+
+        assert frames[0].compound is frames[1].compound
+        assert frames[0].compound_code is Compound.SOFT
+        assert frames[2].compound_code is Compound.UNKNOWN
+
+        table = FeatureTable.from_frames(frames)
+        assert (table.compound == Compound.SOFT).tolist() == [True, True, False]
 
 class TestFilters:
     """Test suite for lap time filters."""
@@ -136,6 +254,28 @@ class TestFilters:
         assert is_valid_lap(200.0) is False  # Too slow
         assert is_valid_lap(92.5, is_pit_in=True) is False
         assert is_valid_lap(92.5, is_sc=True) is False
+
+    def test_is_valid_lap_batch_matches_scalar(self):
+        """Batch validation with packed flags agrees with is_valid_lap."""
+        import numpy as np
+
+        times = [92.5, None, 0.0, 200.0, 92.5, 92.5, 60.0, 180.0, 59.9, 92.5]
+        pit_in = [False, False, False, False, True, False, False, False, False, False]
+        pit_out = [False] * 9 + [True]
+        sc = [False, False, False, False, False, True, False, False, False, False]
+        vsc = [False] * 10
+
+        flags = pack_lap_flags(pit_in, pit_out, sc, vsc)
+        assert flags.dtype == np.uint8
+        assert flags[4] == LapFlag.PIT_IN and flags[9] == LapFlag.PIT_OUT
+
+        arr = np.array([np.nan if t is None else t for t in times])
+        batch = is_valid_lap_batch(arr, flags)
+        expected = [
+            is_valid_lap(t, is_pit_in=a, is_pit_out=b, is_sc=c, is_vsc=d)
+            for t, a, b, c, d in zip(times, pit_in, pit_out, sc, vsc, strict=True)
+        ]
+        assert batch.tolist() == expected
     
     def test_outlier_zscore(self):
         """Test z-score outlier detection."""
@@ -180,6 +320,51 @@ class TestFilters:
         
         assert len(filtered) == 8  # 10 - 2 invalid
 
+    def test_filter_mask_on_table(self):
+        """Test table masking keeps the same rows as apply_filters."""
+        frames = [
+            FeatureFrame(driver_number=1, lap_number=i + 1, lap_time=90.0 + i * 0.1)
+            for i in range(10)
+        ]
+        frames[2].is_pit_in_lap = True
+        frames[4].traffic_affected = True
+        frames[7].lap_time = None
+        table = FeatureTable.from_frames(frames)
+
+        kept = table[filter_mask(table)]
+
+        assert kept.lap_number.tolist() == [f.lap_number for f in apply_filters(frames)]
+        assert kept.lap_number.tolist() == [1, 2, 4, 6, 7, 9, 10]
+
+    def test_filter_by_compound(self):
+        """Test the compound filter on frames and on a table."""
+        frames = [
+            FeatureFrame(
+                driver_number=1,
+                lap_number=i + 1,
+                lap_time=90.0 + i * 0.1,
+                compound="SOFT" if i % 2 else "HARD",
+            )
+            for i in range(8)
+        ]
+        table = FeatureTable.from_frames(frames)
+
+        softs = apply_filters(frames, compound=Compound.SOFT)
+
+        assert [f.lap_number for f in softs] == [2, 4, 6, 8]
+        assert table[filter_mask(table, compound=Compound.SOFT)].lap_number.tolist() == [2, 4, 6, 8]
+        assert apply_filters(frames, compound=Compound.WET) == []
+
+    def test_feature_table_round_trip(self):
+        """Test frames survive conversion to columns and back."""
+        frames = build_stint_features([92.5, 0.0, 92.1], 1, "MEDIUM", 50)
+        table = FeatureTable.from_frames(frames)
+
+        assert table.to_frames() == frames
+        assert table[1] == frames[1]
+        assert table[1].recent_pace_std is not None
+        assert len(table[table.is_valid]) == 2
+
 
 class TestTraffic:
     """Test suite for traffic detection."""
@@ -206,3 +391,34 @@ class TestTraffic:
         # Far = no delta
         delta = estimate_traffic_delta(gap_ahead=3.0)
         assert delta == 0.0
+
+    def test_tracker_sustained_traffic_and_history(self):
+        """Test tracker uses earlier gaps and keeps a bounded history."""
+        tracker = TrafficTracker()
+
+        tracker.update(1, 1.0)
+        tracker.update(1, 1.2)
+        is_traffic, _ = tracker.update(1, 3.0)  # Clear now, but close for 2 laps
+        assert is_traffic is True
+
+        for _ in range(10):
+            tracker.update(1, 3.0)
+        assert list(tracker.gap_history[1]) == [3.0] * 10
+        assert tracker.update(1, 3.0) == (False, 0.0)
+
+    def test_batch_matches_scalar(self):
+        """Test vectorized traffic helpers agree with the scalar versions."""
+        import numpy as np
+
+        gaps = [3.0, 1.2, 0.4, 1.8, 2.5, None, 0.9, 1.0, 1.7]
+        arr = np.array([np.nan if g is None else g for g in gaps])
+
+        is_traffic, severity = detect_traffic_batch(arr)
+        deltas = estimate_traffic_delta_batch(arr)
+
+        for i, gap in enumerate(gaps):
+            previous = [np.nan if g is None else g for g in gaps[:i]] or None
+            expected_traffic, expected_severity = detect_traffic(gap, previous)
+            assert is_traffic[i] == expected_traffic
+            assert severity[i] == pytest.approx(expected_severity)
+            assert deltas[i] == pytest.approx(estimate_traffic_delta(gap))
@@ -0,0 +1,117 @@
+"""
+Tests for OpenF1 response parsing and update batch assembly.
+"""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from rsw.ingest.base import LapData
+from rsw.ingest.openf1_client import OpenF1Client
+
+
+@pytest.fixture
+def client():
+    return OpenF1Client()
+
+
+async def test_laps_skip_invalid_rows(client):
+    client._fetch = AsyncMock(
+        return_value=[
+            {"driver_number": 1, "lap_number": 1, "lap_duration": 95.1, "date_start": None},
+            {"driver_number": 1, "lap_number": None, "lap_duration": 94.8},  # invalid
+            {"lap_number": 3},  # missing driver_number
+            {
+                "driver_number": 44,
+                "lap_number": 2,
+                "duration_sector_1": 30.2,
+                "date_start": "2023-03-05T15:04:00Z",
+            },
+        ]
+    )
+
+    laps = await client.get_laps(9158)
+
+    assert [(lap.driver_number, lap.lap_number) for lap in laps] == [(1, 1), (44, 2)]
+    assert laps[1].sector_1 == 30.2
+    assert laps[1].timestamp is not None
+
+
+async def test_positions_keep_latest_per_driver(client):
+    client._fetch = AsyncMock(
+        return_value=[
+            {"driver_number": 1, "position": 2, "date": "2023-03-05T15:00:00Z"},
+            {"driver_number": 1, "position": 1, "date": "2023-03-05T15:05:00Z"},
+            {"driver_number": 44, "position": 3, "date": "2023-03-05T15:01:00Z"},
+            {"driver_number": 44, "position": 5, "date": None},
+        ]
+    )
+
+    positions = await client.get_positions(9158)
+
+    assert {p.driver_number: p.position for p in positions} == {1: 1, 44: 3}
+
+
+async def test_positions_fall_back_when_latest_row_is_invalid(client):
+    client._fetch = AsyncMock(
+        return_value=[
+            {"driver_number": 1, "position": 2, "date": "2023-03-05T15:00:00Z"},
+            {"driver_number": 1, "position": "P1", "date": "2023-03-05T15:05:00Z"},
+        ]
+    )
+
+    positions = await client.get_positions(9158)
+
+    assert [(p.driver_number, p.position) for p in positions] == [(1, 2)]
+
+
+async def test_intervals_fall_back_when_latest_row_is_invalid(client):
+    client._fetch = AsyncMock(
+        return_value=[
+            {"driver_number": 1, "gap_to_leader": 1.5, "date": "2023-03-05T15:00:00Z"},
+            {"driver_number": 1, "gap_to_leader": "n/a", "date": "2023-03-05T15:05:00Z"},
+        ]
+    )
+
+    intervals = await client.get_intervals(9158)
+
+    assert [(i.driver_number, i.gap_to_leader) for i in intervals] == [(1, 1.5)]
+
+
+async def test_fetch_decodes_raw_body():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'[{"driver_number": 1, "lap_duration": 95.1}]')
+
+    client = OpenF1Client(base_url="https://api.test")
+    client._client = httpx.AsyncClient(
+        base_url="https://api.test", transport=httpx.MockTransport(handler)
+    )
+    try:
+        data = await client._fetch("/laps", {"session_key": 9158})
+    finally:
+        await client.close()
+
+    assert data == [{"driver_number": 1, "lap_duration": 95.1}]
+
+
+def test_dtos_are_frozen():
+    lap = LapData(driver_number=1, lap_number=1)
+
+    with pytest.raises(ValidationError):
+        lap.lap_number = 2
+
+
+async def test_fetch_update_batch_combines_payloads():
+    from rsw.ingest.mock import MockDataProvider
+
+    provider = MockDataProvider()
+
+    batch = await provider.fetch_update_batch(1, include_drivers=True)
+    without_drivers = await provider.fetch_update_batch(1)
+
+    assert batch.drivers
+    assert batch.laps and batch.current_lap == max(lap.lap_number for lap in batch.laps)
+    assert batch.stints and batch.race_control is not None
+    assert without_drivers.drivers is None
@@ -0,0 +1,186 @@
+"""
+Tests for the cached-session replay engine.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from rsw.backtest import ReplaySession
+
+
+@pytest.fixture
+def session_data():
+    return {
+        "session_key": 9158,
+        "session_info": {
+            "session_name": "Race",
+            "country_name": "Bahrain",
+            "circuit_short_name": "Sakhir",
+        },
+        "drivers": [{"driver_number": 1}, {"driver_number": 44}],
+        "laps": [
+            {"driver_number": d, "lap_number": lap, "lap_duration": 95.0}
+            for lap in range(1, 6)
+            for d in (1, 44)
+        ],
+        "stints": [
+            {"driver_number": 1, "stint_number": 1, "lap_start": 1, "lap_end": 3},
+            {"driver_number": 1, "stint_number": 2, "lap_start": 4, "lap_end": None},
+            {"driver_number": 44, "stint_number": 1, "lap_start": 1, "lap_end": 5},
+        ],
+        "pits": [{"driver_number": 1, "lap_number": 3, "pit_duration": 22.5}],
+        "race_control": [
+            {"lap_number": lap, "category": "Flag", "message": f"Message {lap}"}
+            for lap in range(1, 6)
+            for _ in range(2)
+        ],
+    }
+
+
+class TestReplayState:
+    """Tests for per-lap state lookups."""
+
+    def test_state_at_lap(self, session_data):
+        session = ReplaySession(session_data)
+        session.seek(3)
+
+        state = session.get_state()
+
+        assert state.total_laps == 5
+        assert state.current_lap == 3
+        assert [lap["driver_number"] for lap in state.laps_at_current] == [1, 44]
+        assert state.pits_at_current == [session_data["pits"][0]]
+        assert [(s["driver_number"], s["stint_number"]) for s in state.stints_active] == [
+            (1, 1),
+            (44, 1),
+        ]
+        assert [m["lap_number"] for m in state.messages_at_current] == [1, 2, 2, 3, 3]
+
+    def test_open_ended_stint_and_empty_lap(self, session_data):
+        session = ReplaySession(session_data)
+        session.seek(5)
+
+        state = session.get_state()
+
+        assert state.pits_at_current == []
+        assert [(s["driver_number"], s["stint_number"]) for s in state.stints_active] == [
+            (1, 2),
+            (44, 1),
+        ]
+
+    def test_messages_without_lap_count_from_start(self, session_data):
+        session_data["race_control"].insert(0, {"lap_number": None, "message": "Green light"})
+        session = ReplaySession(session_data)
+
+        assert [m["message"] for m in session._get_messages_at_lap(1)] == [
+            "Green light",
+            "Message 1",
+            "Message 1",
+        ]
+
+    def test_state_before_start(self, session_data):
+        state = ReplaySession(session_data).get_state()
+
+        assert state.current_lap == 0
+        assert state.laps_at_current == []
+        assert state.stints_active == []
+        assert state.messages_at_current == []
+
+    def test_state_is_reused_until_it_changes(self, session_data):
+        session = ReplaySession(session_data)
+        session.seek(2)
+
+        first = session.get_state()
+        assert session.get_state() is first
+
+        session.set_speed(2.0)
+        second = session.get_state()
+        assert second is not first
+        assert second.playback_speed == 2.0
+
+        session.seek(3)
+        assert session.get_state().current_lap == 3
+
+
+class TestPlayback:
+    """Tests for the playback loop."""
+
+    async def test_pause_holds_lap_until_resumed(self, session_data):
+        session = ReplaySession(session_data)
+        session.set_speed(10.0)
+        session.play()
+
+        await asyncio.sleep(0.15)
+        session.pause()
+        paused_at = session.get_state().current_lap
+        await asyncio.sleep(0.3)
+        assert session.get_state().current_lap == paused_at
+
+        session.play()
+        await asyncio.wait_for(session.wait_until_complete(), timeout=2.0)
+
+        state = session.get_state()
+        assert state.current_lap == 5
+        assert state.playback_state.value == "finished"
+
+
+class TestCachedSessions:
+    """Tests for loading sessions from disk."""
+
+    def test_load_and_list(self, session_data, tmp_path):
+        (tmp_path / "9158.json").write_text(json.dumps(session_data))
+        (tmp_path / "broken.json").write_text("{not json")
+
+        session = ReplaySession.load(tmp_path / "9158.json")
+        listing = ReplaySession.list_cached_sessions(tmp_path)
+
+        assert session.session_key == 9158
+        assert session.total_laps == 5
+        assert listing == [
+            {
+                "session_key": 9158,
+                "session_name": "Race",
+                "country": "Bahrain",
+                "circuit": "Sakhir",
+                "file": str(tmp_path / "9158.json"),
+            }
+        ]
+
+    def test_listing_uses_metadata_sidecar(self, session_data, tmp_path):
+        session_file = tmp_path / "9158.json"
+        session_file.write_text(json.dumps(session_data))
+
+        ReplaySession.list_cached_sessions(tmp_path)
+        sidecar = tmp_path / "9158.meta.json"
+        assert json.loads(sidecar.read_text())["session_key"] == 9158
+
+        # A fresh sidecar is trusted without re-reading the session file
+        sidecar.write_text(json.dumps({"session_key": 9158, "session_name": "Sprint"}))
+        listing = ReplaySession.list_cached_sessions(tmp_path)
+
+        assert len(listing) == 1
+        assert listing[0]["session_name"] == "Sprint"
+
+    def test_listing_skips_backfill_in_read_only_dir(self, session_data, tmp_path, monkeypatch):
+        import os
+
+        (tmp_path / "9158.json").write_text(json.dumps(session_data))
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
+
+        listing = ReplaySession.list_cached_sessions(tmp_path)
+
+        assert listing[0]["session_key"] == 9158
+        assert not (tmp_path / "9158.meta.json").exists()
+
+
+def test_write_atomic_replaces_without_leftovers(tmp_path):
+    from rsw.backtest.replay import write_atomic
+
+    target = tmp_path / "9158.json"
+    write_atomic(target, b'{"session_key": 1}')
+    write_atomic(target, b'{"session_key": 9158}')
+
+    assert json.loads(target.read_bytes()) == {"session_key": 9158}
+    assert list(tmp_path.iterdir()) == [target]
@@ -15,15 +15,15 @@ class TestWebSocketConnection:
     def test_websocket_connect(self, client: TestClient):
         """Test WebSocket connection establishment."""
         with client.websocket_connect("/ws") as websocket:
-            # Should receive initial state
-            data = websocket.receive_json()
+            # Should receive initial state as a binary JSON frame
+            data = websocket.receive_json(mode="binary")
             assert data["type"] == "state_update"
             assert "data" in data
     
     def test_websocket_receives_state_update(self, client: TestClient):
         """Test WebSocket receives state update with expected fields."""
         with client.websocket_connect("/ws") as websocket:
-            data = websocket.receive_json()
+            data = websocket.receive_json(mode="binary")
             state = data["data"]
             
             # Check critical fields exist
@@ -32,6 +32,15 @@ class TestWebSocketConnection:
             assert "current_lap" in state
             assert "total_laps" in state
 
+    def test_websocket_msgpack_format(self, client: TestClient):
+        """Test clients can opt in to MessagePack frames."""
+        msgspec = pytest.importorskip("msgspec")
+
+        with client.websocket_connect("/ws?format=msgpack") as websocket:
+            data = msgspec.msgpack.decode(websocket.receive_bytes())
+            assert data["type"] == "state_update"
+            assert "drivers" in data["data"]
+
 
 class TestRoundNumberCalculation:
     """Tests for round number calculation logic."""
@@ -211,3 +220,105 @@ class TestSimulationManager:
         await sim.stop()
 
         assert sim._task is None
+
+
+class TestConnectionManager:
+    """Tests for WebSocket broadcast fan-out."""
+
+    async def test_broadcast_sends_same_payload_to_all(self):
+        """Test every registered client receives the serialized message."""
+        from rsw.api.websocket_manager import ConnectionManager
+
+        manager = ConnectionManager()
+        sockets = [AsyncMock(), AsyncMock()]
+        for ws in sockets:
+            manager.register(ws)
+
+        await manager.broadcast({"type": "state_update", "data": {"lap": 3}})
+        await asyncio.sleep(0.01)
+
+        payloads = [ws.send_bytes.call_args.args[0] for ws in sockets]
+        assert payloads[0] is payloads[1]
+        assert b'"state_update"' in payloads[0]
+
+    async def test_broadcast_drops_failed_clients(self):
+        """Test a failing client is disconnected without affecting others."""
+        from rsw.api.websocket_manager import ConnectionManager
+
+        manager = ConnectionManager()
+        healthy = AsyncMock()
+        broken = AsyncMock()
+        broken.send_bytes.side_effect = RuntimeError("closed")
+        manager.register(healthy)
+        manager.register(broken)
+
+        await manager.broadcast({"type": "ping"})
+        await asyncio.sleep(0.01)
+
+        assert manager.connection_count == 1
+        healthy.send_bytes.assert_awaited_once()
+
+    async def test_slow_client_is_evicted_when_queue_fills(self):
+        """Test broadcasting never blocks on a client that stops reading."""
+        from rsw.api import websocket_manager
+        from rsw.api.websocket_manager import ConnectionManager
+
+        stalled = AsyncMock()
+        stalled.send_bytes.side_effect = lambda payload: asyncio.sleep(3600)
+
+        manager = ConnectionManager()
+        manager.register(stalled)
+
+        for _ in range(websocket_manager.CLIENT_QUEUE_SIZE + 2):
+            await manager.broadcast({"type": "ping"})
+
+        assert manager.connection_count == 0
+
+    async def test_send_to_skips_closed_socket(self):
+        """Test send_to drops a closed client without encoding or sending."""
+        from starlette.websockets import WebSocketState
+
+        from rsw.api.websocket_manager import ConnectionManager
+
+        closed = AsyncMock()
+        closed.client_state = WebSocketState.DISCONNECTED
+
+        manager = ConnectionManager()
+        manager.register(closed)
+
+        assert await manager.send_to(closed, {"type": "ping"}) is False
+        closed.send_bytes.assert_not_awaited()
+        assert manager.connection_count == 0
+
+    async def test_send_to_registered_client_uses_queue(self):
+        """Test send_to on a registered client goes through its writer queue."""
+        from rsw.api.websocket_manager import ConnectionManager
+
+        client = AsyncMock()
+        manager = ConnectionManager()
+        manager.register(client)
+
+        writer = manager._writers[client]
+        try:
+            assert await manager.send_to(client, {"type": "ping"}) is True
+            await asyncio.wait_for(manager.active_connections[client].join(), 1)
+            client.send_bytes.assert_awaited_once()
+        finally:
+            manager.disconnect(client)
+            await asyncio.gather(writer, return_exceptions=True)
+
+    async def test_writer_exits_after_disconnect(self):
+        """Test the writer task stops once its client is disconnected."""
+        from rsw.api.websocket_manager import ConnectionManager
+
+        client = AsyncMock()
+        manager = ConnectionManager()
+        manager.register(client)
+        writer = manager._writers[client]
+
+        await manager.broadcast({"type": "ping"})
+        await asyncio.wait_for(manager.active_connections[client].join(), 1)
+        manager.disconnect(client)
+
+        await asyncio.wait_for(asyncio.gather(writer, return_exceptions=True), 1)
+        assert writer.done()